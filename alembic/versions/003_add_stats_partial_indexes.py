@@ -0,0 +1,46 @@
+"""add_stats_partial_indexes
+
+Revision ID: 003_add_stats_partial_indexes
+Revises: 002_add_file_security_fields
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003_add_stats_partial_indexes'
+down_revision = '002_add_file_security_fields'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add partial indexes backing the admin system stats counters."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    # Enum columns store the member name, hence the upper-case literals.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_admin
+            ON users (id)
+            WHERE role = 'ADMIN'
+        """)
+
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_draft
+            ON documents (id)
+            WHERE status = 'DRAFT'
+        """)
+
+    # Refresh planner statistics so the new indexes are picked up
+    op.execute("ANALYZE users")
+    op.execute("ANALYZE documents")
+
+
+def downgrade() -> None:
+    """Remove admin system stats partial indexes."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_draft")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_users_admin")
@@ -0,0 +1,37 @@
+"""add_audit_logs_created_at_index
+
+Revision ID: 004_add_audit_logs_created_at_index
+Revises: 003_add_stats_partial_indexes
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004_add_audit_logs_created_at_index'
+down_revision = '003_add_stats_partial_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add a covering created_at index for recent-activity audit queries."""
+
+    # Covering index so the 24h activity count and the newest-first audit log
+    # listing are served as index-range / index-only scans
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_logs_created_at_inc
+            ON audit_logs (created_at DESC)
+            INCLUDE (user_id, action, resource_type)
+        """)
+
+    op.execute("ANALYZE audit_logs")
+
+
+def downgrade() -> None:
+    """Remove the covering created_at index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audit_logs_created_at_inc")
@@ -0,0 +1,36 @@
+"""add_audit_logs_user_created_index
+
+Revision ID: 005_add_audit_logs_user_created_index
+Revises: 004_add_audit_logs_created_at_index
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_add_audit_logs_user_created_index'
+down_revision = '004_add_audit_logs_created_at_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add composite (user_id, created_at DESC) index on audit_logs."""
+
+    # Last-activity lookups resolve to the first index tuple for the user.
+    # Declared on the model too, so it may already exist via create_all.
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_audit_logs_user_created_desc
+        ON audit_logs (user_id, created_at DESC)
+    """)
+
+    # The single-column user_id index is a left prefix of the composite one
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_user_id")
+
+
+def downgrade() -> None:
+    """Restore the single-column user_id index."""
+    op.create_index('ix_audit_logs_user_id', 'audit_logs', ['user_id'])
+    op.execute("DROP INDEX IF EXISTS idx_audit_logs_user_created_desc")
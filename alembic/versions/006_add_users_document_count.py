@@ -0,0 +1,62 @@
+"""add_users_document_count
+
+Revision ID: 006_add_users_document_count
+Revises: 005_add_audit_logs_user_created_index
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006_add_users_document_count'
+down_revision = '005_add_audit_logs_user_created_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add a trigger-maintained document counter to users."""
+    op.add_column('users', sa.Column('document_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Keep the counter in step with documents, mirroring tags.usage_count
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_user_document_count()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE users SET document_count = document_count + 1 WHERE id = NEW.author_id;
+                RETURN NEW;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE users SET document_count = document_count - 1 WHERE id = OLD.author_id;
+                RETURN OLD;
+            ELSIF TG_OP = 'UPDATE' AND NEW.author_id IS DISTINCT FROM OLD.author_id THEN
+                UPDATE users SET document_count = document_count - 1 WHERE id = OLD.author_id;
+                UPDATE users SET document_count = document_count + 1 WHERE id = NEW.author_id;
+                RETURN NEW;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        DROP TRIGGER IF EXISTS update_user_document_count_trigger ON documents;
+        CREATE TRIGGER update_user_document_count_trigger
+            AFTER INSERT OR DELETE OR UPDATE OF author_id ON documents
+            FOR EACH ROW EXECUTE FUNCTION update_user_document_count();
+    """)
+
+    # Backfill existing counts
+    op.execute("""
+        UPDATE users u
+        SET document_count = (SELECT count(*) FROM documents d WHERE d.author_id = u.id)
+    """)
+
+
+def downgrade() -> None:
+    """Remove the users document counter."""
+    op.execute("DROP TRIGGER IF EXISTS update_user_document_count_trigger ON documents")
+    op.execute("DROP FUNCTION IF EXISTS update_user_document_count()")
+    op.drop_column('users', 'document_count')
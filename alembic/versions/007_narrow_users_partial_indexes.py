@@ -0,0 +1,45 @@
+"""narrow_users_partial_indexes
+
+Revision ID: 007_narrow_users_partial_indexes
+Revises: 006_add_users_document_count
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_narrow_users_partial_indexes'
+down_revision = '006_add_users_document_count'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace full is_active/role indexes with partial indexes on the selective values."""
+
+    # Active users are already served by the partial idx_users_active
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_users_inactive
+        ON users (created_at DESC)
+        WHERE is_active = false
+    """)
+    op.drop_index('idx_users_is_active', table_name='users')
+
+    # Non-default roles are rare; list_users filters order by created_at
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_users_role_non_user
+        ON users (role, created_at DESC)
+        WHERE role <> 'NORMAL'
+    """)
+    op.drop_index('idx_users_role', table_name='users')
+
+
+def downgrade() -> None:
+    """Restore the full is_active/role indexes."""
+    op.create_index('idx_users_role', 'users', ['role'])
+    op.execute("DROP INDEX IF EXISTS idx_users_role_non_user")
+
+    op.create_index('idx_users_is_active', 'users', ['is_active'])
+    op.execute("DROP INDEX IF EXISTS idx_users_inactive")
@@ -0,0 +1,35 @@
+"""unique_users_username_email
+
+Revision ID: 008_unique_users_username_email
+Revises: 007_narrow_users_partial_indexes
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008_unique_users_username_email'
+down_revision = '007_narrow_users_partial_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Serve username/email lookups from unique indexes only."""
+
+    # Same names the model's unique=True, index=True columns produce, so this
+    # is a no-op where the schema was created from metadata
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users (username)")
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email)")
+
+    # The non-unique equality indexes from 001 duplicate the unique ones
+    op.drop_index('idx_users_username', table_name='users')
+    op.drop_index('idx_users_email', table_name='users')
+
+
+def downgrade() -> None:
+    """Restore the non-unique username/email indexes."""
+    op.create_index('idx_users_username', 'users', ['username'])
+    op.create_index('idx_users_email', 'users', ['email'])
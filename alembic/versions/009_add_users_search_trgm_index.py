@@ -0,0 +1,31 @@
+"""add_users_search_trgm_index
+
+Revision ID: 009_add_users_search_trgm_index
+Revises: 008_unique_users_username_email
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009_add_users_search_trgm_index'
+down_revision = '008_unique_users_username_email'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add trigram index for admin user search."""
+
+    # Expression must match the filter built in app.api.admin.list_users
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_users_search_trgm
+        ON users USING GIN ((username || ' ' || email) gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    """Remove trigram index for admin user search."""
+    op.execute("DROP INDEX IF EXISTS idx_users_search_trgm")
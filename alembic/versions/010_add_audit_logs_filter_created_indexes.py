@@ -0,0 +1,43 @@
+"""add_audit_logs_filter_created_indexes
+
+Revision ID: 010_add_audit_logs_filter_created_indexes
+Revises: 009_add_users_search_trgm_index
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010_add_audit_logs_filter_created_indexes'
+down_revision = '009_add_users_search_trgm_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add (filter, created_at DESC) indexes for audit log listing."""
+
+    # The user_id variant is idx_audit_logs_user_created_desc (005). Both are
+    # declared on the model too, so they may already exist via create_all.
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_audit_logs_action_created
+        ON audit_logs (action, created_at DESC)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_audit_logs_resource_created
+        ON audit_logs (resource_type, created_at DESC)
+    """)
+
+    # Single-column indexes are left prefixes of the composites
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_action")
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_resource_type")
+
+
+def downgrade() -> None:
+    """Restore single-column action/resource_type indexes."""
+    op.create_index('ix_audit_logs_resource_type', 'audit_logs', ['resource_type'])
+    op.create_index('ix_audit_logs_action', 'audit_logs', ['action'])
+    op.execute("DROP INDEX IF EXISTS idx_audit_logs_resource_created")
+    op.execute("DROP INDEX IF EXISTS idx_audit_logs_action_created")
@@ -0,0 +1,35 @@
+"""drop_redundant_document_indexes
+
+Revision ID: 011_drop_redundant_document_indexes
+Revises: 010_add_audit_logs_filter_created_indexes
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011_drop_redundant_document_indexes'
+down_revision = '010_add_audit_logs_filter_created_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop single-column document indexes that are left prefixes of composites."""
+
+    # status is covered by idx_documents_status_folder (status, folder_path);
+    # the published/draft counters use the partial status indexes
+    op.execute("DROP INDEX IF EXISTS idx_documents_status")
+    op.execute("DROP INDEX IF EXISTS ix_documents_status")
+
+    # author_id is covered by idx_documents_author_status (author_id, status)
+    op.execute("DROP INDEX IF EXISTS idx_documents_author_id")
+    op.execute("DROP INDEX IF EXISTS ix_documents_author_id")
+
+
+def downgrade() -> None:
+    """Restore single-column document indexes."""
+    op.create_index('idx_documents_author_id', 'documents', ['author_id'])
+    op.create_index('idx_documents_status', 'documents', ['status'])
@@ -0,0 +1,28 @@
+"""add_users_lower_indexes
+
+Revision ID: 012_add_users_lower_indexes
+Revises: 011_drop_redundant_document_indexes
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012_add_users_lower_indexes'
+down_revision = '011_drop_redundant_document_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add case-insensitive equality indexes for exact admin user lookups."""
+    op.execute("CREATE INDEX IF NOT EXISTS idx_users_lower_username ON users (lower(username))")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_users_lower_email ON users (lower(email))")
+
+
+def downgrade() -> None:
+    """Remove case-insensitive equality indexes."""
+    op.execute("DROP INDEX IF EXISTS idx_users_lower_email")
+    op.execute("DROP INDEX IF EXISTS idx_users_lower_username")
@@ -0,0 +1,40 @@
+"""add_documents_updated_id_index
+
+Revision ID: 013_add_documents_updated_id_index
+Revises: 012_add_users_lower_indexes
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013_add_documents_updated_id_index'
+down_revision = '012_add_users_lower_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index the (updated_at, id) keyset used by document list pagination."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_updated_id_desc
+            ON documents (updated_at DESC, id DESC)
+        """)
+
+        # Left prefix of the new index
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_updated_at_desc")
+
+
+def downgrade() -> None:
+    """Restore the single-column updated_at index."""
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_updated_at_desc
+            ON documents (updated_at DESC)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_updated_id_desc")
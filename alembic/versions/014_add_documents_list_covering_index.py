@@ -0,0 +1,43 @@
+"""add_documents_list_covering_index
+
+Revision ID: 014_add_documents_list_covering_index
+Revises: 013_add_documents_updated_id_index
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014_add_documents_list_covering_index'
+down_revision = '013_add_documents_updated_id_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Cover the document listing columns in the (updated_at, id) keyset index."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Index-only scans for list pages: filters and listed columns ride
+        # along in INCLUDE, so the heap (and its TOASTed content) is skipped
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_list_covering
+            ON documents (updated_at DESC, id DESC)
+            INCLUDE (title, slug, folder_path, status, author_id, created_at, published_at)
+        """)
+
+        # Same key as the new index
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_updated_id_desc")
+
+
+def downgrade() -> None:
+    """Restore the plain (updated_at, id) keyset index."""
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_updated_id_desc
+            ON documents (updated_at DESC, id DESC)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_list_covering")
@@ -0,0 +1,36 @@
+"""add_documents_fts_index
+
+Revision ID: 015_add_documents_fts_index
+Revises: 014_add_documents_list_covering_index
+Create Date: 2024-01-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015_add_documents_fts_index'
+down_revision = '014_add_documents_list_covering_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add full-text GIN index for simple document search."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Expression must match search_vector in app.models.document_simple
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_fts
+            ON documents USING GIN (
+                to_tsvector('english'::regconfig, coalesce(title, '') || ' ' || coalesce(content, ''))
+            )
+        """)
+
+
+def downgrade() -> None:
+    """Remove full-text GIN index for simple document search."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_fts")
@@ -2,17 +2,23 @@
 Admin API endpoints for user and system management.
 """
 import uuid
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, update, func, and_, or_, literal_column, tuple_
 
-from app.core.database import get_db
+from app.core.database import get_db, AsyncSessionLocal
 from app.core.auth import get_current_user
+from app.core.auth_cache import bump_user_epoch
+from app.core.redis import get_redis
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from app.core.responses import UTCZJSONResponse
 from app.models.user import User, UserRole
-from app.models.document import Document
+from app.models.document import Document, DocumentStatus
 from app.models.audit import AuditLog
 from app.services.auth import AuthenticationService, get_auth_service
 from app.services.audit import AuditService
@@ -24,7 +30,17 @@ from app.core.exceptions import NotFoundError, ValidationError, InternalError
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"], default_response_class=ORJSONResponse)
+
+# System stats are global aggregates; a short TTL spares the table scans on
+# every dashboard refresh
+SYSTEM_STATS_CACHE_KEY = "admin:system_stats"
+SYSTEM_STATS_CACHE_TTL = 30
+
+
+def _user_search_expr():
+    """Username/email search expression matching idx_users_search_trgm."""
+    return User.username + literal_column("' '") + User.email
 
 
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
@@ -44,6 +60,7 @@ async def list_users(
     role: Optional[UserRole] = Query(None, description="Filter by user role"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     search: Optional[str] = Query(None, description="Search by username or email"),
+    exact: bool = Query(False, description="Match search against the full username or email"),
     current_user: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db)
 ):
@@ -55,10 +72,19 @@ async def list_users(
     - **role**: Filter by user role
     - **is_active**: Filter by active status
     - **search**: Search by username or email
+    - **exact**: Treat search as a case-insensitive exact username or email
+      instead of a substring
     """
     try:
-        # Build query
-        stmt = select(User).order_by(User.created_at.desc())
+        # Build query; last activity is resolved per row by the server via
+        # a correlated MAX over idx_audit_logs_user_created_desc
+        last_activity = (
+            select(func.max(AuditLog.created_at))
+            .where(AuditLog.user_id == User.id)
+            .correlate(User)
+            .scalar_subquery()
+        )
+        stmt = select(User, last_activity).order_by(User.created_at.desc())
         
         # Apply filters
         conditions = []
@@ -66,14 +92,18 @@ async def list_users(
             conditions.append(User.role == role)
         if is_active is not None:
             conditions.append(User.is_active == is_active)
-        if search:
-            search_term = f"%{search.lower()}%"
+        if search and exact:
+            # Equality probes on idx_users_lower_username / idx_users_lower_email
+            search_term = search.lower()
             conditions.append(
                 or_(
-                    User.username.ilike(search_term),
-                    User.email.ilike(search_term)
+                    func.lower(User.username) == search_term,
+                    func.lower(User.email) == search_term
                 )
             )
+        elif search:
+            search_term = f"%{search.lower()}%"
+            conditions.append(_user_search_expr().ilike(search_term))
         
         if conditions:
             stmt = stmt.where(and_(*conditions))
@@ -81,29 +111,14 @@ async def list_users(
         stmt = stmt.limit(limit).offset(offset)
         
         result = await db.execute(stmt)
-        users = result.scalars().all()
-        
-        # Convert to response format
-        user_responses = []
-        for user in users:
-            # Get user stats
-            doc_count = await _get_user_document_count(db, user.id)
-            last_activity = await _get_user_last_activity(db, user.id)
-            
-            user_responses.append(UserManagementResponse(
-                id=str(user.id),
-                username=user.username,
-                email=user.email,
-                role=user.role,
-                is_active=user.is_active,
-                theme_preference=user.theme_preference,
-                created_at=user.created_at,
-                last_login_at=user.last_login_at,
-                document_count=doc_count,
-                last_activity_at=last_activity
-            ))
-        
-        return user_responses
+        
+        # Rows are built from already-typed ORM values, so they are serialized
+        # directly; response_model only documents the shape
+        rows = [
+            _to_user_list_row(user, last_activity_at)
+            for user, last_activity_at in result.all()
+        ]
+        return UTCZJSONResponse(rows)
         
     except Exception as e:
         logger.error(f"Error listing users: {e}")
@@ -140,6 +155,7 @@ async def create_user(
         )
         
         logger.info(f"Admin {current_user.username} created user {user.username}")
+        await _invalidate_system_stats()
         
         return UserManagementResponse(
             id=str(user.id),
@@ -177,8 +193,7 @@ async def get_user(
     """
     try:
         stmt = select(User).where(User.id == user_id)
-        result = await db.execute(stmt)
-        user = result.scalar_one_or_none()
+        user = await db.scalar(stmt)
         
         if not user:
             raise HTTPException(
@@ -187,7 +202,6 @@ async def get_user(
             )
         
         # Get user stats
-        doc_count = await _get_user_document_count(db, user.id)
         last_activity = await _get_user_last_activity(db, user.id)
         
         return UserManagementResponse(
@@ -199,7 +213,7 @@ async def get_user(
             theme_preference=user.theme_preference,
             created_at=user.created_at,
             last_login_at=user.last_login_at,
-            document_count=doc_count,
+            document_count=user.document_count,
             last_activity_at=last_activity
         )
         
@@ -229,9 +243,19 @@ async def update_user(
     - **email**: New email address (optional)
     """
     try:
-        stmt = select(User).where(User.id == user_id)
-        result = await db.execute(stmt)
-        user = result.scalar_one_or_none()
+        # Update fields and read back the row in one round-trip
+        values = user_data.model_dump(exclude_none=True)
+        if values:
+            stmt = (
+                update(User)
+                .where(User.id == user_id)
+                .values(**values)
+                .returning(User)
+                .execution_options(populate_existing=True)
+            )
+        else:
+            stmt = select(User).where(User.id == user_id)
+        user = await db.scalar(stmt)
         
         if not user:
             raise HTTPException(
@@ -239,21 +263,13 @@ async def update_user(
                 detail=f"User with ID {user_id} not found"
             )
         
-        # Update fields
-        if user_data.role is not None:
-            user.role = user_data.role
-        if user_data.is_active is not None:
-            user.is_active = user_data.is_active
-        if user_data.email is not None:
-            user.email = user_data.email
-        
         await db.commit()
-        await db.refresh(user)
         
         logger.info(f"Admin {current_user.username} updated user {user.username}")
+        await bump_user_epoch(user.id)
+        await _invalidate_system_stats()
         
         # Get user stats
-        doc_count = await _get_user_document_count(db, user.id)
         last_activity = await _get_user_last_activity(db, user.id)
         
         return UserManagementResponse(
@@ -265,7 +281,7 @@ async def update_user(
             theme_preference=user.theme_preference,
             created_at=user.created_at,
             last_login_at=user.last_login_at,
-            document_count=doc_count,
+            document_count=user.document_count,
             last_activity_at=last_activity
         )
         
@@ -294,16 +310,6 @@ async def delete_user(
     This will deactivate the user rather than hard delete to preserve audit trails.
     """
     try:
-        stmt = select(User).where(User.id == user_id)
-        result = await db.execute(stmt)
-        user = result.scalar_one_or_none()
-        
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with ID {user_id} not found"
-            )
-        
         # Prevent self-deletion
         if user_id == current_user.id:
             raise HTTPException(
@@ -312,10 +318,25 @@ async def delete_user(
             )
         
         # Soft delete by deactivating
-        user.is_active = False
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=False)
+            .returning(User.username)
+        )
+        username = await db.scalar(stmt)
+        
+        if username is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with ID {user_id} not found"
+            )
+        
         await db.commit()
         
-        logger.info(f"Admin {current_user.username} deactivated user {user.username}")
+        logger.info(f"Admin {current_user.username} deactivated user {username}")
+        await bump_user_epoch(user_id)
+        await _invalidate_system_stats()
         
     except HTTPException:
         raise
@@ -330,8 +351,7 @@ async def delete_user(
 
 @router.get("/stats/system", response_model=SystemStatsResponse)
 async def get_system_stats(
-    current_user: User = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(require_admin)
 ):
     """
     Get system statistics and metrics (admin only).
@@ -340,54 +360,37 @@ async def get_system_stats(
     document counts, activity metrics, and system health indicators.
     """
     try:
-        # User statistics
-        total_users = await db.scalar(select(func.count(User.id)))
-        active_users = await db.scalar(
-            select(func.count(User.id)).where(User.is_active == True)
-        )
-        admin_users = await db.scalar(
-            select(func.count(User.id)).where(User.role == UserRole.ADMIN)
-        )
-        
-        # Document statistics
-        total_documents = await db.scalar(select(func.count(Document.id)))
-        published_documents = await db.scalar(
-            select(func.count(Document.id)).where(Document.status == "published")
-        )
-        draft_documents = await db.scalar(
-            select(func.count(Document.id)).where(Document.status == "draft")
-        )
+        cached_stats = await _get_cached_system_stats()
+        if cached_stats is not None:
+            return cached_stats
         
-        # Recent activity (last 24 hours)
         yesterday = datetime.utcnow() - timedelta(days=1)
-        recent_activity = await db.scalar(
-            select(func.count(AuditLog.id)).where(AuditLog.created_at >= yesterday)
-        )
-        
-        # New users (last 7 days)
         week_ago = datetime.utcnow() - timedelta(days=7)
-        new_users = await db.scalar(
-            select(func.count(User.id)).where(User.created_at >= week_ago)
-        )
         
-        # New documents (last 7 days)
-        new_documents = await db.scalar(
-            select(func.count(Document.id)).where(Document.created_at >= week_ago)
+        # The three tables are independent, so scan them concurrently on
+        # separate sessions instead of serialising on one connection
+        user_stats, document_stats, recent_activity = await asyncio.gather(
+            _get_user_stats(week_ago),
+            _get_document_stats(week_ago),
+            _get_recent_activity_count(yesterday),
         )
         
-        return SystemStatsResponse(
-            total_users=total_users or 0,
-            active_users=active_users or 0,
-            admin_users=admin_users or 0,
-            total_documents=total_documents or 0,
-            published_documents=published_documents or 0,
-            draft_documents=draft_documents or 0,
+        stats = SystemStatsResponse(
+            total_users=user_stats.total or 0,
+            active_users=user_stats.active or 0,
+            admin_users=user_stats.admin or 0,
+            total_documents=document_stats.total or 0,
+            published_documents=document_stats.published or 0,
+            draft_documents=document_stats.draft or 0,
             recent_activity_24h=recent_activity or 0,
-            new_users_7d=new_users or 0,
-            new_documents_7d=new_documents or 0,
+            new_users_7d=user_stats.new_7d or 0,
+            new_documents_7d=document_stats.new_7d or 0,
             generated_at=datetime.utcnow()
         )
         
+        await _cache_system_stats(stats)
+        return stats
+        
     except Exception as e:
         logger.error(f"Error getting system stats: {e}")
         raise HTTPException(
@@ -400,6 +403,7 @@ async def get_system_stats(
 async def get_audit_logs(
     limit: int = Query(100, ge=1, le=500, description="Maximum number of logs to return"),
     offset: int = Query(0, ge=0, description="Number of logs to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     user_id: Optional[uuid.UUID] = Query(None, description="Filter by user ID"),
     action: Optional[str] = Query(None, description="Filter by action type"),
     resource_type: Optional[str] = Query(None, description="Filter by resource type"),
@@ -412,7 +416,9 @@ async def get_audit_logs(
     Get audit logs for compliance reporting (admin only).
     
     - **limit**: Maximum number of logs to return (1-500)
-    - **offset**: Number of logs to skip for pagination
+    - **offset**: Number of logs to skip for pagination; ignored with a cursor
+    - **cursor**: Cursor for the next page, taken from the X-Next-Cursor
+      header of the previous response
     - **user_id**: Filter by user ID
     - **action**: Filter by action type
     - **resource_type**: Filter by resource type
@@ -420,16 +426,15 @@ async def get_audit_logs(
     - **end_date**: Filter logs before this date
     """
     try:
-        # Build query
-        stmt = (
-            select(AuditLog)
-            .order_by(AuditLog.created_at.desc())
-            .limit(limit)
-            .offset(offset)
-        )
-        
+        keyset = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    
+    try:
         # Apply filters
         conditions = []
+        if keyset:
+            conditions.append(tuple_(AuditLog.created_at, AuditLog.id) < tuple_(*keyset))
         if user_id:
             conditions.append(AuditLog.user_id == user_id)
         if action:
@@ -441,28 +446,36 @@ async def get_audit_logs(
         if end_date:
             conditions.append(AuditLog.created_at <= end_date)
         
+        # Build query
+        stmt = select(AuditLog)
         if conditions:
             stmt = stmt.where(and_(*conditions))
+        # Fetch one extra row to learn whether another page exists; a cursor
+        # already positions the page, so offset only applies without one
+        stmt = (
+            stmt
+            .order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+            .limit(limit + 1)
+        )
+        if not keyset:
+            stmt = stmt.offset(offset)
         
         result = await db.execute(stmt)
         logs = result.scalars().all()
         
-        # Convert to response format
-        return [
-            AuditLogResponse(
-                id=str(log.id),
-                user_id=str(log.user_id),
-                action=log.action,
-                resource_type=log.resource_type,
-                resource_id=log.resource_id,
-                metadata=log.custom_metadata or {},
-                ip_address=log.ip_address,
-                user_agent=log.user_agent,
-                created_at=log.created_at
-            )
-            for log in logs
-        ]
+        headers = {}
+        if len(logs) > limit:
+            logs = logs[:limit]
+            last = logs[-1]
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+        
+        # Rows are built from already-typed ORM values, so they are serialized
+        # directly; response_model only documents the shape
+        rows = [_to_audit_log_row(log) for log in logs]
+        return UTCZJSONResponse(rows, headers=headers)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting audit logs: {e}")
         raise HTTPException(
@@ -471,20 +484,110 @@ async def get_audit_logs(
         )
 
 
-async def _get_user_document_count(db: AsyncSession, user_id: uuid.UUID) -> int:
-    """Get count of documents created by user."""
-    result = await db.execute(
-        select(func.count(Document.id)).where(Document.author_id == user_id)
-    )
-    return result.scalar() or 0
+def _to_user_list_row(user: User, last_activity_at: Optional[datetime]) -> Dict[str, Any]:
+    """Convert User model and its last activity to a UserManagementResponse-shaped dict."""
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "role": user.role,
+        "is_active": user.is_active,
+        "theme_preference": user.theme_preference,
+        "created_at": user.created_at,
+        "last_login_at": user.last_login_at,
+        "document_count": user.document_count,
+        "last_activity_at": last_activity_at
+    }
+
+
+def _to_audit_log_row(log: AuditLog) -> Dict[str, Any]:
+    """Convert AuditLog model to an AuditLogResponse-shaped dict."""
+    return {
+        "id": log.id,
+        "user_id": log.user_id,
+        "action": log.action,
+        "resource_type": log.resource_type,
+        "resource_id": log.resource_id,
+        "metadata": log.custom_metadata or {},
+        # asyncpg returns INET values as ipaddress objects
+        "ip_address": str(log.ip_address) if log.ip_address is not None else None,
+        "user_agent": log.user_agent,
+        "created_at": log.created_at
+    }
 
 
 async def _get_user_last_activity(db: AsyncSession, user_id: uuid.UUID) -> Optional[datetime]:
     """Get user's last activity timestamp."""
-    result = await db.execute(
-        select(AuditLog.created_at)
-        .where(AuditLog.user_id == user_id)
-        .order_by(AuditLog.created_at.desc())
-        .limit(1)
+    return await db.scalar(
+        select(func.max(AuditLog.created_at)).where(AuditLog.user_id == user_id)
     )
-    return result.scalar_one_or_none()
\ No newline at end of file
+
+
+async def _get_user_stats(week_ago: datetime):
+    """Get user counters in a single pass over the users table."""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(
+                func.count(User.id).label("total"),
+                func.count(User.id).filter(User.is_active == True).label("active"),
+                func.count(User.id).filter(User.role == UserRole.ADMIN).label("admin"),
+                func.count(User.id).filter(User.created_at >= week_ago).label("new_7d"),
+            )
+        )
+        return result.one()
+
+
+async def _get_document_stats(week_ago: datetime):
+    """Get document counters in a single pass over the documents table."""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(
+                func.count(Document.id).label("total"),
+                func.count(Document.id).filter(
+                    Document.status == DocumentStatus.PUBLISHED
+                ).label("published"),
+                func.count(Document.id).filter(
+                    Document.status == DocumentStatus.DRAFT
+                ).label("draft"),
+                func.count(Document.id).filter(Document.created_at >= week_ago).label("new_7d"),
+            )
+        )
+        return result.one()
+
+
+async def _get_recent_activity_count(since: datetime) -> int:
+    """Get the number of audit log entries recorded since a timestamp."""
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(
+            select(func.count(AuditLog.id)).where(AuditLog.created_at >= since)
+        ) or 0
+
+
+async def _get_cached_system_stats() -> Optional[SystemStatsResponse]:
+    """Get system stats from the Redis cache, if present."""
+    try:
+        redis = await get_redis()
+        cached = await redis.get(SYSTEM_STATS_CACHE_KEY)
+        if cached:
+            return SystemStatsResponse.model_validate_json(cached)
+    except Exception as e:
+        logger.warning(f"Error reading cached system stats: {e}")
+    return None
+
+
+async def _cache_system_stats(stats: SystemStatsResponse) -> None:
+    """Store system stats in the Redis cache."""
+    try:
+        redis = await get_redis()
+        await redis.setex(SYSTEM_STATS_CACHE_KEY, SYSTEM_STATS_CACHE_TTL, stats.model_dump_json())
+    except Exception as e:
+        logger.warning(f"Error caching system stats: {e}")
+
+
+async def _invalidate_system_stats() -> None:
+    """Drop cached system stats after a user mutation."""
+    try:
+        redis = await get_redis()
+        await redis.delete(SYSTEM_STATS_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Error invalidating cached system stats: {e}")
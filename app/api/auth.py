@@ -1,22 +1,26 @@
 """
 Authentication API endpoints.
 """
+import hashlib
 import logging
-from typing import Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from typing import Dict, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.auth import get_current_user, get_auth_service, security
+from app.core.auth import get_request_user, get_auth_service, get_client_ip, security
+from app.core.auth_cache import failed_login_cache
+from app.core.etag import etag_matches
 from app.core.rate_limit import login_rate_limit
 from app.models.user import User
 from app.services.auth import AuthenticationService, AuthenticationError
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/auth", tags=["authentication"])
+router = APIRouter(prefix="/api/v1/auth", tags=["authentication"], default_response_class=ORJSONResponse)
 
 
 class LoginRequest(BaseModel):
@@ -63,20 +67,59 @@ class MessageResponse(BaseModel):
     message: str
 
 
+def _user_payload(user: User) -> Dict[str, Any]:
+    """
+    Build the user profile payload.
+    
+    UUIDs, datetimes and enums are left as-is for orjson to serialize.
+    
+    Args:
+        user: User to serialize
+        
+    Returns:
+        Dict: Profile fields matching UserProfile
+    """
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "role": user.role,
+        "is_active": user.is_active,
+        "theme_preference": user.theme_preference,
+        "created_at": user.created_at,
+        "last_login_at": user.last_login_at
+    }
+
+
+def _user_etag(user: User) -> str:
+    """
+    Build an ETag for a user's profile from the fields that version it.
+    
+    Args:
+        user: User whose profile is being served
+        
+    Returns:
+        str: Quoted strong ETag
+    """
+    version = f"{user.id}:{user.updated_at}:{user.last_login_at}:{user.role.value}:{user.is_active}"
+    return f'"{hashlib.blake2b(version.encode(), digest_size=16).hexdigest()}"'
+
+
 @router.post("/login", response_model=LoginResponse)
 async def login(
-    request: Request,
     login_data: LoginRequest,
     auth_service: AuthenticationService = Depends(get_auth_service),
-    _rate_limit: dict = Depends(login_rate_limit)
+    _rate_limit: dict = Depends(login_rate_limit),
+    client_ip: Optional[str] = Depends(get_client_ip)
 ):
     """
     Authenticate user and return JWT tokens.
     
     Args:
-        request: FastAPI request object
         login_data: Login credentials
         auth_service: Authentication service
+        _rate_limit: Rate limit check
+        client_ip: Client IP address
         
     Returns:
         LoginResponse: JWT tokens and user info
@@ -85,6 +128,13 @@ async def login(
         HTTPException: If authentication fails
     """
     try:
+        # Reject credentials that just failed without touching the DB or bcrypt
+        if failed_login_cache.contains(login_data.username, login_data.password):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid username or password"
+            )
+        
         # Authenticate user
         user = await auth_service.authenticate_user(
             username=login_data.username,
@@ -92,44 +142,24 @@ async def login(
         )
         
         if not user:
+            failed_login_cache.add(login_data.username, login_data.password)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid username or password"
             )
         
-        # Get client IP address
-        client_ip = None
-        if request.client:
-            client_ip = request.client.host
-        elif "x-forwarded-for" in request.headers:
-            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
-        elif "x-real-ip" in request.headers:
-            client_ip = request.headers["x-real-ip"]
-        
         # Create session with tokens
         session_data = await auth_service.create_user_session(user, client_ip)
         
-        # Prepare user data for response
-        user_data = {
-            "id": str(user.id),
-            "username": user.username,
-            "email": user.email,
-            "role": user.role.value,
-            "is_active": user.is_active,
-            "theme_preference": user.theme_preference.value,
-            "created_at": user.created_at.isoformat(),
-            "last_login_at": user.last_login_at.isoformat() if user.last_login_at else None
-        }
-        
         logger.info(f"User logged in successfully: {user.username}")
         
-        return LoginResponse(
-            access_token=session_data["access_token"],
-            refresh_token=session_data["refresh_token"],
-            token_type=session_data["token_type"],
-            expires_in=session_data["expires_in"],
-            user=user_data
-        )
+        return ORJSONResponse({
+            "access_token": session_data["access_token"],
+            "refresh_token": session_data["refresh_token"],
+            "token_type": session_data["token_type"],
+            "expires_in": session_data["expires_in"],
+            "user": _user_payload(user)
+        })
         
     except HTTPException:
         raise
@@ -235,32 +265,39 @@ async def refresh_token(
 
 @router.get("/me", response_model=UserProfile)
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_user)
+    request: Request,
+    current_user: User = Depends(get_request_user)
 ):
     """
     Get current user profile information.
     
+    Supports conditional requests: a matching If-None-Match header gets an
+    empty 304 response instead of the profile body.
+    
     Args:
+        request: FastAPI request object
         current_user: Current authenticated user
         
     Returns:
         UserProfile: User profile data
     """
-    return UserProfile(
-        id=str(current_user.id),
-        username=current_user.username,
-        email=current_user.email,
-        role=current_user.role.value,
-        is_active=current_user.is_active,
-        theme_preference=current_user.theme_preference.value,
-        created_at=current_user.created_at.isoformat(),
-        last_login_at=current_user.last_login_at.isoformat() if current_user.last_login_at else None
-    )
+    etag = _user_etag(current_user)
+    headers = {
+        "ETag": etag,
+        # Per-user response: never shared, always revalidated
+        "Cache-Control": "private, no-cache",
+        "Vary": "Authorization"
+    }
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return ORJSONResponse(_user_payload(current_user), headers=headers)
 
 
-@router.post("/validate", response_model=Dict[str, Any])
+@router.post("/validate")
 async def validate_token(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_request_user)
 ):
     """
     Validate current token and return user info.
@@ -272,13 +309,13 @@ async def validate_token(
     Returns:
         Dict: Token validation result with user info
     """
-    return {
+    return ORJSONResponse({
         "valid": True,
         "user": {
-            "id": str(current_user.id),
+            "id": current_user.id,
             "username": current_user.username,
             "email": current_user.email,
-            "role": current_user.role.value,
+            "role": current_user.role,
             "is_active": current_user.is_active
         }
-    }
\ No newline at end of file
+    })
\ No newline at end of file
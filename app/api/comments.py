@@ -3,32 +3,43 @@ Comment API endpoints for document discussions.
 """
 import uuid
 import logging
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import NO_VALUE
 
 from app.core.database import get_db
 from app.core.auth import get_current_user
+from app.core.redis import get_redis
+from app.core.responses import UTCZJSONResponse, orjson_dumps
 from app.models.user import User
 from app.services.comment import CommentService
-from app.schemas.comment import (
-    CommentCreate, CommentUpdate, CommentResponse, CommentListResponse
-)
-from app.core.exceptions import (
-    NotFoundError, PermissionDeniedError, ValidationError, InternalError
-)
+from app.schemas.comment import CommentCreate, CommentUpdate, CommentResponse
+from app.core.exception_mapper import map_service_exceptions
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1", tags=["comments"])
+router = APIRouter(prefix="/api/v1", tags=["comments"], default_response_class=ORJSONResponse)
+
+COMMENT_LIST_CACHE_TTL = 60
+# Version counters outlive any list entry written under them
+COMMENT_LIST_VERSION_TTL = 86400
+
+
+async def get_comment_service(db: AsyncSession = Depends(get_db)) -> CommentService:
+    """Dependency to get comment service."""
+    return CommentService(db)
 
 
 @router.post("/documents/{document_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
+@map_service_exceptions
 async def create_comment(
     document_id: uuid.UUID,
     comment_data: CommentCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    service: CommentService = Depends(get_comment_service)
 ):
     """
     Create a new comment on a document.
@@ -37,26 +48,20 @@ async def create_comment(
     - **content**: Comment content (required)
     - **parent_id**: Parent comment ID for threaded replies (optional)
     """
-    try:
-        service = CommentService(db)
-        comment = await service.create_comment(document_id, comment_data, current_user)
-        return _to_comment_response(comment)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    comment = await service.create_comment(document_id, comment_data, current_user)
+    await _invalidate_comment_lists(document_id)
+    return UTCZJSONResponse(_to_comment_response(comment), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/documents/{document_id}/comments", response_model=List[CommentResponse])
+@map_service_exceptions
 async def get_document_comments(
     document_id: uuid.UUID,
     include_replies: bool = Query(True, description="Include nested replies"),
     limit: int = Query(100, ge=1, le=500, description="Maximum number of comments to return"),
     offset: int = Query(0, ge=0, description="Number of comments to skip"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    service: CommentService = Depends(get_comment_service)
 ):
     """
     Get comments for a document.
@@ -68,58 +73,57 @@ async def get_document_comments(
     
     Returns comments in chronological order with optional nested replies.
     """
-    try:
-        service = CommentService(db)
-        comments = await service.list_document_comments(
-            document_id, 
-            current_user,
-            include_replies=include_replies,
-            limit=limit,
-            offset=offset
-        )
-        
-        if include_replies:
-            return [_to_comment_response(comment) for comment in comments]
-        else:
-            return [_to_comment_list_response(comment) for comment in comments]
-            
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    # Access depends on the viewer, so it is checked before any cache hit
+    await service.check_document_access(document_id, current_user)
+    
+    cache_key = await _comment_list_cache_key(document_id, include_replies, limit, offset)
+    if cache_key:
+        cached = await _get_cached_comment_list(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+    
+    comments = await service.list_document_comments(
+        document_id, 
+        current_user,
+        include_replies=include_replies,
+        limit=limit,
+        offset=offset
+    )
+    
+    if include_replies:
+        payload = _comment_tree_payloads(comments)
+    else:
+        payload = [_comment_list_payload(comment) for comment in comments]
+    
+    content = orjson_dumps(payload)
+    if cache_key:
+        await _cache_comment_list(cache_key, content)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/comments/{comment_id}", response_model=CommentResponse)
+@map_service_exceptions
 async def get_comment(
     comment_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    service: CommentService = Depends(get_comment_service)
 ):
     """
     Get a specific comment by ID.
     
     - **comment_id**: UUID of the comment to retrieve
     """
-    try:
-        service = CommentService(db)
-        comment = await service.get_comment(comment_id, current_user)
-        return _to_comment_response(comment)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    comment = await service.get_comment(comment_id, current_user)
+    return UTCZJSONResponse(_to_comment_response(comment))
 
 
 @router.put("/comments/{comment_id}", response_model=CommentResponse)
+@map_service_exceptions
 async def update_comment(
     comment_id: uuid.UUID,
     comment_data: CommentUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    service: CommentService = Depends(get_comment_service)
 ):
     """
     Update an existing comment.
@@ -129,25 +133,17 @@ async def update_comment(
     
     Only the comment author or admin can update a comment.
     """
-    try:
-        service = CommentService(db)
-        comment = await service.update_comment(comment_id, comment_data, current_user)
-        return _to_comment_response(comment)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    comment = await service.update_comment(comment_id, comment_data, current_user)
+    await _invalidate_comment_lists(comment.document_id)
+    return UTCZJSONResponse(_to_comment_response(comment))
 
 
 @router.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
+@map_service_exceptions
 async def delete_comment(
     comment_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    service: CommentService = Depends(get_comment_service)
 ):
     """
     Delete a comment (soft delete).
@@ -157,53 +153,122 @@ async def delete_comment(
     Only the comment author or admin can delete a comment.
     The comment will be marked as deleted but preserved for audit purposes.
     """
+    comment = await service.delete_comment(comment_id, current_user)
+    await _invalidate_comment_lists(comment.document_id)
+
+
+def _to_comment_response(comment) -> Dict[str, Any]:
+    """Convert Comment model to a CommentResponse-shaped dict with nested replies."""
+    return _comment_tree_payloads([comment])[0]
+
+
+def _comment_tree_payloads(comments) -> List[Dict[str, Any]]:
+    """
+    Serialize comment trees to plain dicts in a single iterative pass.
+    
+    Replies are walked depth-first with an explicit stack, so deep threads
+    don't recurse and no per-node response model is validated.
+    """
+    payloads: List[Dict[str, Any]] = []
+    stack = [(comment, payloads) for comment in reversed(comments)]
+    
+    while stack:
+        comment, siblings = stack.pop()
+        replies = _loaded_replies(comment)
+        
+        payload = _comment_payload(comment)
+        payload["replies"] = []
+        payload["reply_count"] = getattr(comment, 'reply_count', len(replies))
+        siblings.append(payload)
+        
+        stack.extend((reply, payload["replies"]) for reply in reversed(replies))
+    
+    return payloads
+
+
+def _loaded_replies(comment) -> List[Any]:
+    """Return a comment's replies only if already loaded, never lazy-loading them."""
+    replies = inspect(comment).attrs.replies.loaded_value
+    return [] if replies is NO_VALUE else replies
+
+
+def _comment_list_payload(comment) -> Dict[str, Any]:
+    """Convert Comment model to a CommentListResponse-shaped dict without nested replies."""
+    payload = _comment_payload(comment)
+    payload["reply_count"] = getattr(comment, 'reply_count', 0)
+    return payload
+
+
+def _comment_payload(comment) -> Dict[str, Any]:
+    """
+    Collect the scalar fields shared by all comment responses.
+    
+    UUIDs and datetimes are left as-is for orjson to serialize.
+    """
+    return {
+        "id": comment.id,
+        "content": comment.content,
+        "document_id": comment.document_id,
+        "author_id": comment.author_id,
+        "author_username": comment.author.username,
+        "parent_id": comment.parent_id,
+        "is_deleted": comment.is_deleted,
+        "created_at": comment.created_at,
+        "updated_at": comment.updated_at,
+    }
+
+
+def _comment_list_version_key(document_id: uuid.UUID) -> str:
+    """Redis key holding the comment list version for a document."""
+    return f"comments:{document_id}:version"
+
+
+async def _comment_list_cache_key(
+    document_id: uuid.UUID, include_replies: bool, limit: int, offset: int
+) -> Optional[str]:
+    """
+    Build the cache key for a page of a document's comments.
+    
+    Keys embed the document's current list version, so bumping the version
+    invalidates every cached page at once without scanning for keys.
+    Returns None when Redis is unavailable.
+    """
     try:
-        service = CommentService(db)
-        await service.delete_comment(comment_id, current_user)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
-
-
-def _to_comment_response(comment) -> CommentResponse:
-    """Convert Comment model to CommentResponse schema with nested replies."""
-    replies = []
-    if hasattr(comment, 'replies') and comment.replies:
-        replies = [_to_comment_response(reply) for reply in comment.replies]
-    
-    reply_count = getattr(comment, 'reply_count', len(replies))
-    
-    return CommentResponse(
-        id=str(comment.id),
-        content=comment.content,
-        document_id=str(comment.document_id),
-        author_id=str(comment.author_id),
-        author_username=comment.author.username,
-        parent_id=str(comment.parent_id) if comment.parent_id else None,
-        is_deleted=comment.is_deleted,
-        created_at=comment.created_at,
-        updated_at=comment.updated_at,
-        replies=replies,
-        reply_count=reply_count
-    )
+        redis = await get_redis()
+        version = await redis.get(_comment_list_version_key(document_id)) or 0
+    except Exception as e:
+        logger.warning(f"Error reading comment list version for document {document_id}: {e}")
+        return None
+    return f"comments:{document_id}:v{version}:{int(include_replies)}:{limit}:{offset}"
+
+
+async def _get_cached_comment_list(cache_key: str) -> Optional[str]:
+    """Get a serialized comment list from the Redis cache, if present."""
+    try:
+        redis = await get_redis()
+        return await redis.get(cache_key)
+    except Exception as e:
+        logger.warning(f"Error reading cached comment list {cache_key}: {e}")
+    return None
+
+
+async def _cache_comment_list(cache_key: str, content: bytes) -> None:
+    """Store a serialized comment list in the Redis cache."""
+    try:
+        redis = await get_redis()
+        await redis.setex(cache_key, COMMENT_LIST_CACHE_TTL, content)
+    except Exception as e:
+        logger.warning(f"Error caching comment list {cache_key}: {e}")
 
 
-def _to_comment_list_response(comment) -> CommentListResponse:
-    """Convert Comment model to CommentListResponse schema without nested replies."""
-    reply_count = getattr(comment, 'reply_count', 0)
-    
-    return CommentListResponse(
-        id=str(comment.id),
-        content=comment.content,
-        document_id=str(comment.document_id),
-        author_id=str(comment.author_id),
-        author_username=comment.author.username,
-        parent_id=str(comment.parent_id) if comment.parent_id else None,
-        is_deleted=comment.is_deleted,
-        created_at=comment.created_at,
-        updated_at=comment.updated_at,
-        reply_count=reply_count
-    )
\ No newline at end of file
+async def _invalidate_comment_lists(document_id: uuid.UUID) -> None:
+    """Drop every cached comment page for a document after a comment mutation."""
+    version_key = _comment_list_version_key(document_id)
+    try:
+        redis = await get_redis()
+        pipe = redis.pipeline()
+        pipe.incr(version_key)
+        pipe.expire(version_key, COMMENT_LIST_VERSION_TTL)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Error invalidating cached comments for document {document_id}: {e}")
@@ -4,7 +4,9 @@ Developer-focused documentation features API endpoints.
 import uuid
 import logging
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 
@@ -12,11 +14,20 @@ from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.models.user import User
 from app.services.developer_features import DeveloperFeaturesService, APIExample
-from app.core.exceptions import NotFoundError, ValidationError, InternalError
+from app.core.exception_mapper import map_service_exceptions
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/developer", tags=["developer"])
+router = APIRouter(prefix="/api/v1/developer", tags=["developer"], default_response_class=ORJSONResponse)
+
+# Language lists are class constants; sort and serialize them once
+_SUPPORTED_LANGUAGES = tuple(sorted(DeveloperFeaturesService.SUPPORTED_LANGUAGES))
+_EXECUTABLE_LANGUAGES = tuple(sorted(DeveloperFeaturesService.SAFE_EXECUTABLE_LANGUAGES))
+_SUPPORTED_LANGUAGES_JSON = orjson.dumps(_SUPPORTED_LANGUAGES)
+_EXECUTABLE_LANGUAGES_JSON = orjson.dumps(_EXECUTABLE_LANGUAGES)
+
+# Upper bound on markdown accepted by /process-content, checked before any scanning
+MAX_PROCESS_CONTENT_LENGTH = 1_000_000
 
 
 class CodeExecutionRequest(BaseModel):
@@ -76,6 +87,11 @@ class RepositoryInfoResponse(BaseModel):
     error: Optional[str] = None
 
 
+async def get_developer_features_service(db: AsyncSession = Depends(get_db)) -> DeveloperFeaturesService:
+    """Dependency to get developer features service."""
+    return DeveloperFeaturesService(db)
+
+
 @router.get("/languages", response_model=List[str])
 async def get_supported_languages():
     """
@@ -83,8 +99,7 @@ async def get_supported_languages():
     
     Returns a list of all supported language identifiers.
     """
-    service = DeveloperFeaturesService(None)  # No DB needed for this
-    return sorted(list(service.SUPPORTED_LANGUAGES))
+    return Response(content=_SUPPORTED_LANGUAGES_JSON, media_type="application/json")
 
 
 @router.get("/executable-languages", response_model=List[str])
@@ -94,15 +109,15 @@ async def get_executable_languages():
     
     Returns a list of language identifiers that can be executed safely.
     """
-    service = DeveloperFeaturesService(None)  # No DB needed for this
-    return sorted(list(service.SAFE_EXECUTABLE_LANGUAGES))
+    return Response(content=_EXECUTABLE_LANGUAGES_JSON, media_type="application/json")
 
 
 @router.post("/execute-code", response_model=CodeExecutionResponse)
+@map_service_exceptions
 async def execute_code(
     request: CodeExecutionRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    service: DeveloperFeaturesService = Depends(get_developer_features_service)
 ):
     """
     Execute code snippet in a sandboxed environment.
@@ -112,28 +127,22 @@ async def execute_code(
     
     Supports safe execution of JavaScript, Python, SQL validation, and data format validation.
     """
-    try:
-        service = DeveloperFeaturesService(db)
-        result = await service.execute_code_snippet(request.language, request.code, current_user)
-        
-        return CodeExecutionResponse(
-            success=result["success"],
-            output=result["output"],
-            error=result.get("error"),
-            execution_time=result["execution_time"]
-        )
-        
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    result = await service.execute_code_snippet(request.language, request.code, current_user)
+    
+    return CodeExecutionResponse(
+        success=result["success"],
+        output=result["output"],
+        error=result.get("error"),
+        execution_time=result["execution_time"]
+    )
 
 
 @router.post("/api-example", response_model=APIExampleResponse)
+@map_service_exceptions
 async def execute_api_example(
     request: APIExampleRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    service: DeveloperFeaturesService = Depends(get_developer_features_service)
 ):
     """
     Execute a live API example with "Try it" functionality.
@@ -146,43 +155,36 @@ async def execute_api_example(
     
     Executes the API request and returns the response with metadata.
     """
-    try:
-        service = DeveloperFeaturesService(db)
-        
-        # Create API example
-        api_example = await service.create_api_example(
-            method=request.method,
-            url=request.url,
-            headers=request.headers,
-            body=request.body,
-            description=request.description
-        )
-        
-        # Execute the API example
-        result = await service.execute_api_example(api_example, current_user)
-        
-        return APIExampleResponse(
-            success=result["success"],
-            status_code=result.get("status_code"),
-            headers=result.get("headers"),
-            body=result.get("body"),
-            error=result.get("error"),
-            execution_time=result["execution_time"],
-            content_type=result.get("content_type"),
-            size=result.get("size")
-        )
-        
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    # Create API example
+    api_example = await service.create_api_example(
+        method=request.method,
+        url=request.url,
+        headers=request.headers,
+        body=request.body,
+        description=request.description
+    )
+    
+    # Execute the API example
+    result = await service.execute_api_example(api_example, current_user)
+    
+    return APIExampleResponse(
+        success=result["success"],
+        status_code=result.get("status_code"),
+        headers=result.get("headers"),
+        body=result.get("body"),
+        error=result.get("error"),
+        execution_time=result["execution_time"],
+        content_type=result.get("content_type"),
+        size=result.get("size")
+    )
 
 
 @router.post("/link-repository", status_code=status.HTTP_201_CREATED)
+@map_service_exceptions
 async def link_repository_code(
     request: RepositoryLinkRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    service: DeveloperFeaturesService = Depends(get_developer_features_service)
 ):
     """
     Link documentation to specific code in a repository.
@@ -195,37 +197,28 @@ async def link_repository_code(
     
     Creates a link between documentation and repository code with line-level precision.
     """
-    try:
-        service = DeveloperFeaturesService(db)
-        
-        await service.link_repository_code(
-            document_id=request.document_id,
-            repo_url=request.repo_url,
-            file_path=request.file_path,
-            start_line=request.start_line,
-            end_line=request.end_line,
-            user=current_user
-        )
-        
-        return {
-            "status": "success",
-            "message": f"Linked repository code {request.repo_url}:{request.file_path} to document"
-        }
-        
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    await service.link_repository_code(
+        document_id=request.document_id,
+        repo_url=request.repo_url,
+        file_path=request.file_path,
+        start_line=request.start_line,
+        end_line=request.end_line,
+        user=current_user
+    )
+    
+    return {
+        "status": "success",
+        "message": f"Linked repository code {request.repo_url}:{request.file_path} to document"
+    }
 
 
 @router.get("/repository-info", response_model=RepositoryInfoResponse)
+@map_service_exceptions
 async def get_repository_info(
     repo_url: str,
     file_path: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    service: DeveloperFeaturesService = Depends(get_developer_features_service)
 ):
     """
     Get repository information for documentation display.
@@ -235,23 +228,17 @@ async def get_repository_info(
     
     Returns repository metadata including last commit, file size, and provider information.
     """
-    try:
-        service = DeveloperFeaturesService(db)
-        info = await service.get_repository_info(repo_url, file_path)
-        
-        return RepositoryInfoResponse(**info)
-        
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    info = await service.get_repository_info(repo_url, file_path)
+    
+    return RepositoryInfoResponse(**info)
 
 
 @router.post("/process-content", status_code=status.HTTP_200_OK)
+@map_service_exceptions
 async def process_content_for_syntax_highlighting(
-    content: str,
+    content: str = Query(..., max_length=MAX_PROCESS_CONTENT_LENGTH, description="Markdown content with code blocks"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    service: DeveloperFeaturesService = Depends(get_developer_features_service)
 ):
     """
     Process markdown content for enhanced syntax highlighting and code execution.
@@ -264,28 +251,17 @@ async def process_content_for_syntax_highlighting(
     - Copy to clipboard functionality
     - Code execution for safe languages
     """
-    try:
-        service = DeveloperFeaturesService(db)
-        processed_content = await service.process_code_blocks(content)
-        
-        return {
-            "status": "success",
-            "processed_content": processed_content
-        }
-        
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    processed_content = await service.process_code_blocks(content)
+    
+    return {
+        "status": "success",
+        "processed_content": processed_content
+    }
 
 
-@router.get("/syntax-highlighting-demo", status_code=status.HTTP_200_OK)
-async def get_syntax_highlighting_demo():
-    """
-    Get a demonstration of syntax highlighting capabilities.
-    
-    Returns sample code in various languages to showcase syntax highlighting features.
-    """
-    demo_code = {
-        "python": '''def fibonacci(n):
+# Static demo payload, serialized once at import
+_SYNTAX_HIGHLIGHTING_DEMO_CODE = {
+    "python": '''def fibonacci(n):
     """Generate Fibonacci sequence up to n terms."""
     a, b = 0, 1
     for _ in range(n):
@@ -295,8 +271,8 @@ async def get_syntax_highlighting_demo():
 # Example usage
 for num in fibonacci(10):
     print(num)''',
-        
-        "javascript": '''// Async function with modern JavaScript features
+    
+    "javascript": '''// Async function with modern JavaScript features
 async function fetchUserData(userId) {
     try {
         const response = await fetch(`/api/users/${userId}`);
@@ -311,8 +287,8 @@ async function fetchUserData(userId) {
         throw error;
     }
 }''',
-        
-        "sql": '''-- Complex query with joins and window functions
+    
+    "sql": '''-- Complex query with joins and window functions
 SELECT 
     u.username,
     u.email,
@@ -328,8 +304,8 @@ GROUP BY u.id, u.username, u.email
 HAVING document_count > 0
 ORDER BY document_count DESC
 LIMIT 10;''',
-        
-        "yaml": '''# Kubernetes deployment configuration
+    
+    "yaml": '''# Kubernetes deployment configuration
 apiVersion: apps/v1
 kind: Deployment
 metadata:
@@ -357,8 +333,8 @@ spec:
             secretKeyRef:
               name: wiki-secrets
               key: database-url''',
-        
-        "json": '''{
+    
+    "json": '''{
   "openapi": "3.0.0",
   "info": {
     "title": "Wiki Documentation API",
@@ -398,11 +374,25 @@ spec:
     }
   }
 }'''
-    }
+}
+
+_SYNTAX_HIGHLIGHTING_DEMO_JSON = orjson.dumps({
+    "status": "success",
+    "demo_code": _SYNTAX_HIGHLIGHTING_DEMO_CODE,
+    "supported_languages_count": len(DeveloperFeaturesService.SUPPORTED_LANGUAGES),
+    "executable_languages_count": len(DeveloperFeaturesService.SAFE_EXECUTABLE_LANGUAGES)
+})
+
+
+@router.get("/syntax-highlighting-demo", status_code=status.HTTP_200_OK)
+async def get_syntax_highlighting_demo():
+    """
+    Get a demonstration of syntax highlighting capabilities.
     
-    return {
-        "status": "success",
-        "demo_code": demo_code,
-        "supported_languages_count": len(DeveloperFeaturesService.SUPPORTED_LANGUAGES),
-        "executable_languages_count": len(DeveloperFeaturesService.SAFE_EXECUTABLE_LANGUAGES)
-    }
\ No newline at end of file
+    Returns sample code in various languages to showcase syntax highlighting features.
+    """
+    return Response(
+        content=_SYNTAX_HIGHLIGHTING_DEMO_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=86400"}
+    )
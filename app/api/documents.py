@@ -1,13 +1,22 @@
 """
 Document API endpoints for content management.
 """
+import asyncio
+import logging
 import uuid
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
+from typing import Any, AsyncIterator, Dict, List, Optional
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query, Response
+from fastapi import status as http_status  # list_documents has a `status` filter parameter
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.auth import get_current_user
+from app.core.document_cache import get_cached_document, cache_document
+from app.core.etag import etag_matches
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from app.core.responses import UTCZJSONResponse, orjson_dumps
 from app.models.user import User
 from app.models.document import DocumentStatus
 from app.services.document import DocumentService
@@ -19,15 +28,22 @@ from app.schemas.document import (
 from app.schemas.responses import (
     DocumentResponse, DocumentListResponse
 )
-from app.core.exceptions import (
-    NotFoundError, PermissionDeniedError, ValidationError,
-    DuplicateError, InternalError
+from app.core.exception_mapper import map_service_exceptions
+
+router = APIRouter(
+    prefix="/api/v1/documents",
+    tags=["documents"],
+    default_response_class=ORJSONResponse
 )
 
-router = APIRouter(prefix="/api/v1/documents", tags=["documents"])
+logger = logging.getLogger(__name__)
+
+# Revision content is escaped and sent in slices of this many characters
+REVISION_STREAM_CHUNK_SIZE = 64 * 1024
 
 
 @router.post("/", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
+@map_service_exceptions
 async def create_document(
     doc_data: DocumentCreate,
     current_user: User = Depends(get_current_user),
@@ -43,21 +59,16 @@ async def create_document(
     - **status**: Document status (draft or published)
     - **tags**: List of tag names
     """
-    try:
-        service = DocumentService(db)
-        document = await service.create_document(doc_data, current_user)
-        return _to_document_response(document)
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except DuplicateError as e:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = DocumentService(db)
+    document = await service.create_document(doc_data, current_user)
+    return _document_json_response(document, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{document_id}", response_model=DocumentResponse)
+@map_service_exceptions
 async def get_document(
     document_id: uuid.UUID,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -68,18 +79,37 @@ async def get_document(
     - Document is published (visible to all users)
     - Document is draft and user is the author
     - User is admin (can see all documents)
+    
+    Supports conditional requests: a matching If-None-Match header gets an
+    empty 304 response instead of the document body.
     """
-    try:
-        service = DocumentService(db)
-        document = await service.get_document(document_id, current_user)
-        return _to_document_response(document)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    if_none_match = request.headers.get("if-none-match")
+    
+    # Cached bodies are shared by all viewers, so visibility is checked per request
+    cached = await get_cached_document(document_id)
+    if cached is not None:
+        if not _can_view_cached_document(cached, current_user):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+        headers = _document_cache_headers(cached["etag"])
+        if etag_matches(if_none_match, cached["etag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=cached["body"], media_type="application/json", headers=headers)
+    
+    service = DocumentService(db)
+    document = await service.get_document(document_id, current_user)
+    
+    etag = _document_etag(document)
+    headers = _document_cache_headers(etag)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    body = _to_document_response(document).model_dump_json()
+    await cache_document(document, body, etag)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.put("/{document_id}", response_model=DocumentResponse)
+@map_service_exceptions
 async def update_document(
     document_id: uuid.UUID,
     doc_data: DocumentUpdate,
@@ -91,28 +121,18 @@ async def update_document(
     
     Only the document author or admin can update a document.
     """
-    try:
-        service = DocumentService(db)
-        document = await service.update_document(
-            document_id, 
-            doc_data, 
-            current_user, 
-            change_summary=doc_data.change_summary
-        )
-        return _to_document_response(document)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except DuplicateError as e:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = DocumentService(db)
+    document = await service.update_document(
+        document_id, 
+        doc_data, 
+        current_user, 
+        change_summary=doc_data.change_summary
+    )
+    return _document_json_response(document)
 
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
+@map_service_exceptions
 async def delete_document(
     document_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -123,18 +143,12 @@ async def delete_document(
     
     Only the document author or admin can delete a document.
     """
-    try:
-        service = DocumentService(db)
-        await service.delete_document(document_id, current_user)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = DocumentService(db)
+    await service.delete_document(document_id, current_user)
 
 
 @router.post("/{document_id}/move", response_model=DocumentResponse)
+@map_service_exceptions
 async def move_document(
     document_id: uuid.UUID,
     move_data: DocumentMoveRequest,
@@ -146,28 +160,19 @@ async def move_document(
     
     Only the document author or admin can move a document.
     """
-    try:
-        service = DocumentService(db)
-        document = await service.move_document(document_id, move_data.new_folder_path, current_user)
-        return _to_document_response(document)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except DuplicateError as e:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = DocumentService(db)
+    document = await service.move_document(document_id, move_data.new_folder_path, current_user)
+    return _document_json_response(document)
 
 
 @router.get("/", response_model=List[DocumentListResponse])
+@map_service_exceptions
 async def list_documents(
     folder_path: Optional[str] = Query(None, description="Filter by folder path"),
     status: Optional[DocumentStatus] = Query(None, description="Filter by document status"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of documents to return"),
     offset: int = Query(0, ge=0, description="Number of documents to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -178,19 +183,48 @@ async def list_documents(
     - Published documents are visible to all users
     - Draft documents are only visible to their authors
     - Admins can see all documents
+    
+    When more documents follow, the X-Next-Cursor response header holds the
+    cursor for the next page. Cursor paging stays fast at any depth, unlike
+    large offsets.
     """
     try:
-        service = DocumentService(db)
-        documents = await service.list_documents(
-            user=current_user,
-            folder_path=folder_path,
-            status=status,
-            limit=limit,
-            offset=offset
-        )
-        return [_to_document_list_response(doc) for doc in documents]
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+        keyset = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    
+    service = DocumentService(db)
+    # Fetch one extra row to learn whether another page exists
+    documents = await service.list_documents(
+        user=current_user,
+        folder_path=folder_path,
+        status=status,
+        limit=limit + 1,
+        offset=offset,
+        cursor=keyset
+    )
+    
+    headers = {}
+    if len(documents) > limit:
+        documents = documents[:limit]
+        last = documents[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last.updated_at, last.id)
+    
+    tags_by_document = await service.get_tags_for_documents([doc.id for doc in documents])
+    
+    # Rows are built from already-typed ORM values, so they are serialized
+    # directly; response_model only documents the shape
+    rows = [_to_document_list_row(doc, tags_by_document.get(doc.id, [])) for doc in documents]
+    return UTCZJSONResponse(rows, headers=headers)
+
+
+def _document_json_response(document, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a document once, bypassing FastAPI's response_model revalidation."""
+    return Response(
+        content=_to_document_response(document).model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
 
 
 def _to_document_response(document) -> DocumentResponse:
@@ -200,7 +234,7 @@ def _to_document_response(document) -> DocumentResponse:
     tags = []
     for doc_tag in document.tags:
         tags.append(TagResponse(
-            id=str(doc_tag.tag.id),
+            id=doc_tag.tag.id,
             name=doc_tag.tag.name,
             description=doc_tag.tag.description,
             color=doc_tag.tag.color,
@@ -208,14 +242,14 @@ def _to_document_response(document) -> DocumentResponse:
         ))
     
     return DocumentResponse(
-        id=str(document.id),
+        id=document.id,
         title=document.title,
         slug=document.slug,
         content=document.content,
         content_type=document.content_type,
         folder_path=document.folder_path,
         status=document.status,
-        author_id=str(document.author_id),
+        author_id=document.author_id,
         created_at=document.created_at,
         updated_at=document.updated_at,
         published_at=document.published_at,
@@ -223,34 +257,52 @@ def _to_document_response(document) -> DocumentResponse:
     )
 
 
-def _to_document_list_response(document) -> DocumentListResponse:
-    """Convert Document model to DocumentListResponse schema."""
-    from app.schemas.responses import TagResponse
-    
-    tags = []
-    for doc_tag in document.tags:
-        tags.append(TagResponse(
-            id=str(doc_tag.tag.id),
-            name=doc_tag.tag.name,
-            description=doc_tag.tag.description,
-            color=doc_tag.tag.color,
-            usage_count=doc_tag.tag.usage_count
-        ))
-    
-    return DocumentListResponse(
-        id=str(document.id),
-        title=document.title,
-        slug=document.slug,
-        folder_path=document.folder_path,
-        status=document.status,
-        author_id=str(document.author_id),
-        created_at=document.created_at,
-        updated_at=document.updated_at,
-        published_at=document.published_at,
-        tags=tags
-    )
+def _document_etag(document) -> str:
+    """Weak ETag versioning a document by its last update."""
+    return f'W/"{document.id.hex}-{int(document.updated_at.timestamp() * 1_000_000)}"'
+
+
+def _revision_etag(revision) -> str:
+    """Weak ETag for a revision; revisions never change once written."""
+    return f'W/"{revision.id.hex}"'
+
+
+def _document_cache_headers(etag: str) -> Dict[str, str]:
+    """Headers for conditional document responses."""
+    return {
+        "ETag": etag,
+        # Visibility depends on the viewer: never shared, always revalidated
+        "Cache-Control": "private, no-cache",
+        "Vary": "Authorization"
+    }
+
+
+def _can_view_cached_document(cached: Dict[str, str], user: User) -> bool:
+    """Apply DocumentService.get_document's visibility rules to a cached entry."""
+    if user.role.value == "admin":
+        return True
+    if cached["status"] == DocumentStatus.PUBLISHED.value:
+        return True
+    return cached["status"] == DocumentStatus.DRAFT.value and cached["author_id"] == str(user.id)
+
+
+def _to_document_list_row(document, tags: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert Document model and its tag dicts to a DocumentListResponse-shaped dict."""
+    return {
+        "id": document.id,
+        "title": document.title,
+        "slug": document.slug,
+        "folder_path": document.folder_path,
+        "status": document.status,
+        "author_id": document.author_id,
+        "created_at": document.created_at,
+        "updated_at": document.updated_at,
+        "published_at": document.published_at,
+        "tags": tags
+    }
 
 @router.get("/{document_id}/revisions", response_model=List[DocumentRevisionListResponse])
+@map_service_exceptions
 async def get_document_revisions(
     document_id: uuid.UUID,
     limit: int = Query(50, ge=1, le=100, description="Maximum number of revisions to return"),
@@ -264,24 +316,19 @@ async def get_document_revisions(
     Returns all revisions for the document in descending order (newest first).
     Only users with read access to the document can view its revisions.
     """
-    try:
-        service = DocumentService(db)
-        revisions = await service.get_document_revisions(
-            document_id, current_user, limit=limit, offset=offset
-        )
-        return [_to_revision_list_response(rev) for rev in revisions]
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = DocumentService(db)
+    revisions = await service.get_document_revisions(
+        document_id, current_user, limit=limit, offset=offset
+    )
+    return UTCZJSONResponse([_revision_list_payload(rev) for rev in revisions])
 
 
 @router.get("/{document_id}/revisions/{revision_number}", response_model=DocumentRevisionResponse)
+@map_service_exceptions
 async def get_document_revision(
     document_id: uuid.UUID,
     revision_number: int,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -290,20 +337,23 @@ async def get_document_revision(
     
     Returns the complete content of the document at the specified revision.
     Only users with read access to the document can view its revisions.
+    A matching If-None-Match header gets an empty 304 response. The body is
+    streamed so multi-megabyte revisions do not block the event loop.
     """
-    try:
-        service = DocumentService(db)
-        revision = await service.get_document_revision(document_id, revision_number, current_user)
-        return _to_revision_response(revision)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = DocumentService(db)
+    revision = await service.get_document_revision(document_id, revision_number, current_user)
+    headers = _document_cache_headers(_revision_etag(revision))
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return StreamingResponse(
+        _stream_revision(revision),
+        media_type="application/json",
+        headers=headers
+    )
 
 
 @router.post("/{document_id}/revisions/{revision_number}/restore", response_model=DocumentResponse)
+@map_service_exceptions
 async def restore_document_revision(
     document_id: uuid.UUID,
     revision_number: int,
@@ -317,24 +367,18 @@ async def restore_document_revision(
     Creates a new revision with the content from the specified revision.
     Only the document author or admin can restore revisions.
     """
-    try:
-        service = DocumentService(db)
-        document = await service.restore_document_revision(
-            document_id, 
-            revision_number, 
-            current_user,
-            change_summary=restore_data.change_summary
-        )
-        return _to_document_response(document)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = DocumentService(db)
+    document = await service.restore_document_revision(
+        document_id, 
+        revision_number, 
+        current_user,
+        change_summary=restore_data.change_summary
+    )
+    return _document_json_response(document)
 
 
 @router.get("/{document_id}/revisions/{revision1}/compare/{revision2}", response_model=DocumentRevisionComparisonResponse)
+@map_service_exceptions
 async def compare_document_revisions(
     document_id: uuid.UUID,
     revision1: int,
@@ -348,44 +392,44 @@ async def compare_document_revisions(
     Returns detailed comparison data including changes between the two revisions.
     Only users with read access to the document can compare its revisions.
     """
-    try:
-        service = DocumentService(db)
-        comparison = await service.compare_document_revisions(
-            document_id, revision1, revision2, current_user
-        )
-        return DocumentRevisionComparisonResponse(**comparison)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
-
-
-def _to_revision_response(revision) -> DocumentRevisionResponse:
-    """Convert DocumentRevision model to DocumentRevisionResponse schema."""
-    return DocumentRevisionResponse(
-        id=str(revision.id),
-        document_id=str(revision.document_id),
-        revision_number=revision.revision_number,
-        title=revision.title,
-        content=revision.content,
-        change_summary=revision.change_summary,
-        author_id=str(revision.author_id),
-        author_username=revision.author.username,
-        created_at=revision.created_at
+    service = DocumentService(db)
+    comparison = await service.compare_document_revisions(
+        document_id, revision1, revision2, current_user
     )
+    return DocumentRevisionComparisonResponse(**comparison)
+
+
+async def _stream_revision(revision) -> AsyncIterator[bytes]:
+    """Serialize a revision as a DocumentRevisionResponse-shaped JSON object, content last."""
+    head = orjson_dumps({
+        "id": revision.id,
+        "document_id": revision.document_id,
+        "revision_number": revision.revision_number,
+        "title": revision.title,
+        "change_summary": revision.change_summary,
+        "author_id": revision.author_id,
+        "author_username": revision.author.username,
+        "created_at": revision.created_at
+    })
+    yield head[:-1] + b',"content":"'
+    
+    # JSON string escaping is per character, so slices can be escaped independently
+    content = revision.content
+    for start in range(0, len(content), REVISION_STREAM_CHUNK_SIZE):
+        yield orjson.dumps(content[start:start + REVISION_STREAM_CHUNK_SIZE])[1:-1]
+        await asyncio.sleep(0)
+    yield b'"}'
 
 
-def _to_revision_list_response(revision) -> DocumentRevisionListResponse:
-    """Convert DocumentRevision model to DocumentRevisionListResponse schema."""
-    return DocumentRevisionListResponse(
-        id=str(revision.id),
-        document_id=str(revision.document_id),
-        revision_number=revision.revision_number,
-        title=revision.title,
-        change_summary=revision.change_summary,
-        author_id=str(revision.author_id),
-        author_username=revision.author.username,
-        created_at=revision.created_at
-    )
\ No newline at end of file
+def _revision_list_payload(revision) -> Dict[str, Any]:
+    """Convert DocumentRevision model to a DocumentRevisionListResponse-shaped dict."""
+    return {
+        "id": revision.id,
+        "document_id": revision.document_id,
+        "revision_number": revision.revision_number,
+        "title": revision.title,
+        "change_summary": revision.change_summary,
+        "author_id": revision.author_id,
+        "author_username": revision.author.username,
+        "created_at": revision.created_at
+    }
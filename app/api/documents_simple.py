@@ -1,18 +1,31 @@
 """
 Simple document API endpoints with database operations.
 """
+import hashlib
+import logging
 import uuid
+from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Form, Query
+from fastapi import APIRouter, Depends, HTTPException, Form, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from app.core.database_simple import get_db
+from app.core.redis_simple import get_redis
+from app.core.etag import etag_matches
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 from app.services.document_simple import DocumentService
 from app.models.document_simple import Document
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+DOCUMENT_SLUG_CACHE_TTL = 60
+# The count is a dashboard figure; a few seconds of staleness spares a table scan per call
+DOCUMENT_COUNT_CACHE_KEY = "documents:count"
+DOCUMENT_COUNT_CACHE_TTL = 10
+
 
 # Pydantic models for request/response
 class DocumentCreate(BaseModel):
@@ -28,26 +41,46 @@ class DocumentUpdate(BaseModel):
 
 
 class DocumentResponse(BaseModel):
-    id: str
+    id: uuid.UUID
     title: str
     content: str
     summary: Optional[str]
     slug: Optional[str]
     is_published: bool
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+_document_list_adapter = TypeAdapter(List[DocumentResponse])
 
 
 @router.get("/documents", response_model=List[DocumentResponse])
 async def list_documents(
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     db: AsyncSession = Depends(get_db)
 ):
-    """List all documents with pagination."""
+    """List all documents with pagination; X-Next-Cursor is set when more follow."""
+    try:
+        keyset = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
     service = DocumentService(db)
-    documents = await service.list_documents(limit=limit, offset=offset)
-    return [DocumentResponse(**doc.to_dict()) for doc in documents]
+    documents = await service.list_documents(limit=limit + 1, offset=offset, cursor=keyset)
+    headers = {}
+    if len(documents) > limit:
+        documents = documents[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(documents[-1].updated_at, documents[-1].id)
+    return Response(
+        content=_serialize_documents(documents),
+        media_type="application/json",
+        headers=headers
+    )
 
 
 @router.get("/documents/search", response_model=List[DocumentResponse])
@@ -56,45 +89,51 @@ async def search_documents(
     limit: int = Query(50, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
 ):
-    """Search documents by title and content."""
+    """Full-text search documents by title and content; the summary is not searched."""
     service = DocumentService(db)
     documents = await service.search_documents(query=q, limit=limit)
-    return [DocumentResponse(**doc.to_dict()) for doc in documents]
+    return Response(content=_serialize_documents(documents), media_type="application/json")
 
 
 @router.get("/documents/{document_id}", response_model=DocumentResponse)
 async def get_document(
-    document_id: str,
+    document_id: uuid.UUID,
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific document by ID."""
-    try:
-        doc_uuid = uuid.UUID(document_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid document ID format")
-    
     service = DocumentService(db)
-    document = await service.get_document_by_id(doc_uuid)
+    document = await service.get_document_by_id(document_id)
     
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    return DocumentResponse(**document.to_dict())
+    return DocumentResponse.model_validate(document)
 
 
 @router.get("/documents/slug/{slug}", response_model=DocumentResponse)
 async def get_document_by_slug(
     slug: str,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
-    """Get a specific document by slug."""
-    service = DocumentService(db)
-    document = await service.get_document_by_slug(slug)
-    
-    if not document:
-        raise HTTPException(status_code=404, detail="Document not found")
+    """Get a specific document by slug; a matching If-None-Match gets a 304."""
+    body = await _get_cached_slug(slug)
+    if body is None:
+        service = DocumentService(db)
+        document = await service.get_document_by_slug(slug)
+        
+        if not document:
+            raise HTTPException(status_code=404, detail="Document not found")
+        
+        body = DocumentResponse.model_validate(document).model_dump_json()
+        await _cache_slug(slug, body)
     
-    return DocumentResponse(**document.to_dict())
+    # Content-derived, so cached and freshly serialized bodies agree
+    etag = f'"{hashlib.blake2b(body.encode(), digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("/documents", response_model=DocumentResponse)
@@ -113,7 +152,7 @@ async def create_document(
             content=content,
             summary=summary
         )
-        return DocumentResponse(**document.to_dict())
+        return DocumentResponse.model_validate(document)
     
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error creating document: {str(e)}")
@@ -121,21 +160,19 @@ async def create_document(
 
 @router.put("/documents/{document_id}", response_model=DocumentResponse)
 async def update_document(
-    document_id: str,
+    document_id: uuid.UUID,
     title: Optional[str] = Form(None),
     content: Optional[str] = Form(None),
     summary: Optional[str] = Form(None),
     db: AsyncSession = Depends(get_db)
 ):
     """Update an existing document."""
-    try:
-        doc_uuid = uuid.UUID(document_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid document ID format")
-    
     service = DocumentService(db)
+    existing = await service.get_document_by_id(document_id)
+    old_slug = existing.slug if existing else None
+    
     document = await service.update_document(
-        document_id=doc_uuid,
+        document_id=document_id,
         title=title,
         content=content,
         summary=summary
@@ -144,32 +181,93 @@ async def update_document(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    return DocumentResponse(**document.to_dict())
+    await _invalidate_cached_slugs(old_slug, document.slug)
+    return DocumentResponse.model_validate(document)
 
 
 @router.delete("/documents/{document_id}")
 async def delete_document(
-    document_id: str,
+    document_id: uuid.UUID,
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a document."""
-    try:
-        doc_uuid = uuid.UUID(document_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid document ID format")
-    
     service = DocumentService(db)
-    success = await service.delete_document(doc_uuid)
+    existing = await service.get_document_by_id(document_id)
+    success = await service.delete_document(document_id)
     
     if not success:
         raise HTTPException(status_code=404, detail="Document not found")
     
+    await _invalidate_cached_slugs(existing.slug)
     return {"message": "Document deleted successfully"}
 
 
 @router.get("/documents-count")
 async def get_document_count(db: AsyncSession = Depends(get_db)):
     """Get total count of documents."""
+    try:
+        redis = await get_redis()
+        if redis:
+            cached = await redis.get(DOCUMENT_COUNT_CACHE_KEY)
+            if cached is not None:
+                return {"count": int(cached)}
+    except Exception as e:
+        logger.warning(f"Error reading cached document count: {e}")
+    
     service = DocumentService(db)
     count = await service.get_document_count()
-    return {"count": count}
\ No newline at end of file
+    
+    try:
+        redis = await get_redis()
+        if redis:
+            await redis.setex(DOCUMENT_COUNT_CACHE_KEY, DOCUMENT_COUNT_CACHE_TTL, count)
+    except Exception as e:
+        logger.warning(f"Error caching document count: {e}")
+    
+    return {"count": count}
+
+
+def _serialize_documents(documents: List[Document]) -> bytes:
+    """Validate and serialize a page of documents in one pass through pydantic-core."""
+    return _document_list_adapter.dump_json(
+        _document_list_adapter.validate_python(documents, from_attributes=True)
+    )
+
+
+def _slug_cache_key(slug: str) -> str:
+    """Redis key holding the cached response for a document slug."""
+    return f"document:slug:{slug}"
+
+
+async def _get_cached_slug(slug: str) -> Optional[str]:
+    """Get a cached document response by slug, if present."""
+    try:
+        redis = await get_redis()
+        if redis:
+            return await redis.get(_slug_cache_key(slug))
+    except Exception as e:
+        logger.warning(f"Error reading cached document slug {slug}: {e}")
+    return None
+
+
+async def _cache_slug(slug: str, body: str) -> None:
+    """Cache a serialized document response under its slug."""
+    try:
+        redis = await get_redis()
+        if redis:
+            await redis.setex(_slug_cache_key(slug), DOCUMENT_SLUG_CACHE_TTL, body)
+    except Exception as e:
+        logger.warning(f"Error caching document slug {slug}: {e}")
+
+
+async def _invalidate_cached_slugs(*slugs: Optional[str]) -> None:
+    """Drop cached responses for the given slugs after a document changes."""
+    keys = {_slug_cache_key(slug) for slug in slugs if slug}
+    if not keys:
+        return
+    try:
+        redis = await get_redis()
+        if redis:
+            await redis.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Error invalidating cached document slugs {slugs}: {e}")
@@ -2,34 +2,52 @@
 File management API endpoints with security scanning.
 """
 import logging
+import os
+import re
 import uuid
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Request, UploadFile, File as FastAPIFile
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, Tuple
+from urllib.parse import quote
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status, UploadFile, File as FastAPIFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from pydantic import BaseModel, ValidationError, field_serializer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.auth import get_current_user
+from app.core.config import settings
+from app.core.database import get_db, AsyncSessionLocal
+from app.core.auth import get_current_user, get_client_ip
 from app.core.rate_limit import upload_rate_limit
+from app.core.redis import get_redis
 from app.models.user import User
+from app.services.audit import AuditService
 from app.services.file import FileService, FileUploadError, MalwareDetectedError
+from app.services.permission import PermissionService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/files", tags=["files"])
 
+# Upper bound on how long a crashed thumbnail job blocks new ones
+THUMBNAIL_JOB_TTL = 300
+
 
 class FileUploadResponse(BaseModel):
     """File upload response model."""
-    id: str
+    id: uuid.UUID
     filename: str
     original_filename: str
     file_size: int
     mime_type: str
     checksum: str
-    created_at: str
+    created_at: datetime
     message: str
+    
+    @field_serializer('created_at')
+    def serialize_created_at(self, value: datetime) -> str:
+        """Keep the isoformat() timestamps clients received before."""
+        return value.isoformat()
 
 
 class ImagePasteRequest(BaseModel):
@@ -41,16 +59,21 @@ class ImagePasteRequest(BaseModel):
 
 class FileInfoResponse(BaseModel):
     """File information response model."""
-    id: str
+    id: uuid.UUID
     filename: str
     original_filename: str
     file_path: str
     mime_type: str
     file_size: int
     checksum: str
-    uploaded_by: str
-    document_id: Optional[str]
-    created_at: str
+    uploaded_by: uuid.UUID
+    document_id: Optional[uuid.UUID]
+    created_at: datetime
+    
+    @field_serializer('created_at')
+    def serialize_created_at(self, value: datetime) -> str:
+        """Keep the isoformat() timestamps clients received before."""
+        return value.isoformat()
 
 
 class MessageResponse(BaseModel):
@@ -58,34 +81,70 @@ class MessageResponse(BaseModel):
     message: str
 
 
+# Canonical hex UUID, hyphens optional; malformed IDs are rejected without entering uuid.UUID
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
+)
+
+
+def _parse_uuid(value: str, detail: str) -> uuid.UUID:
+    """
+    Parse an ID from the request, raising 400 with the given detail if malformed.
+    
+    Args:
+        value: Raw ID string
+        detail: Error detail for malformed IDs
+        
+    Returns:
+        uuid.UUID: Parsed ID
+        
+    Raises:
+        HTTPException: If the ID is not a UUID
+    """
+    if not _UUID_RE.fullmatch(value):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
+    return uuid.UUID(value)
+
+
+def _content_disposition(filename: str) -> str:
+    """Build an attachment Content-Disposition header the way FileResponse does."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
 async def get_file_service(db: AsyncSession = Depends(get_db)) -> FileService:
     """Dependency to get file service."""
-    from app.services.permission import PermissionService
-    permission_service = PermissionService(db)
-    return FileService(db, permission_service=permission_service)
+    audit_service = AuditService(db)
+    permission_service = PermissionService(db, audit_service=audit_service)
+    return FileService(db, audit_service=audit_service, permission_service=permission_service)
 
 
 @router.post("/upload", response_model=FileUploadResponse)
 async def upload_file(
-    request: Request,
     file: UploadFile = FastAPIFile(...),
     folder_path: str = "/",
     document_id: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     file_service: FileService = Depends(get_file_service),
-    _rate_limit: dict = Depends(upload_rate_limit)
+    _rate_limit: dict = Depends(upload_rate_limit),
+    client_ip: Optional[str] = Depends(get_client_ip)
 ):
     """
     Upload a file with security scanning.
     
     Args:
-        request: FastAPI request object
         file: File to upload
         folder_path: Destination folder path
         document_id: Optional associated document ID
         current_user: Current authenticated user
         file_service: File service
         _rate_limit: Rate limit check
+        client_ip: Client IP address
         
     Returns:
         FileUploadResponse: Upload result
@@ -94,25 +153,10 @@ async def upload_file(
         HTTPException: If upload fails
     """
     try:
-        # Get client IP
-        client_ip = None
-        if request.client:
-            client_ip = request.client.host
-        elif "x-forwarded-for" in request.headers:
-            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
-        elif "x-real-ip" in request.headers:
-            client_ip = request.headers["x-real-ip"]
-        
         # Parse document ID if provided
         doc_uuid = None
         if document_id:
-            try:
-                doc_uuid = uuid.UUID(document_id)
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid document ID format"
-                )
+            doc_uuid = _parse_uuid(document_id, "Invalid document ID format")
         
         # Upload file
         file_record = await file_service.upload_file(
@@ -126,13 +170,13 @@ async def upload_file(
         logger.info(f"File uploaded successfully: {file.filename} by {current_user.username}")
         
         return FileUploadResponse(
-            id=str(file_record.id),
+            id=file_record.id,
             filename=file_record.filename,
             original_filename=file_record.original_filename,
             file_size=file_record.file_size,
             mime_type=file_record.mime_type,
             checksum=file_record.checksum,
-            created_at=file_record.created_at.isoformat(),
+            created_at=file_record.created_at,
             message="File uploaded successfully"
         )
         
@@ -176,13 +220,7 @@ async def get_file_info(
     Raises:
         HTTPException: If file not found or access denied
     """
-    try:
-        file_uuid = uuid.UUID(file_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file ID format"
-        )
+    file_uuid = _parse_uuid(file_id, "Invalid file ID format")
     
     try:
         file_record = await file_service.get_file(
@@ -197,16 +235,16 @@ async def get_file_info(
             )
         
         return FileInfoResponse(
-            id=str(file_record.id),
+            id=file_record.id,
             filename=file_record.filename,
             original_filename=file_record.original_filename,
             file_path=file_record.file_path,
             mime_type=file_record.mime_type,
             file_size=file_record.file_size,
             checksum=file_record.checksum,
-            uploaded_by=str(file_record.uploaded_by),
-            document_id=str(file_record.document_id) if file_record.document_id else None,
-            created_at=file_record.created_at.isoformat()
+            uploaded_by=file_record.uploaded_by,
+            document_id=file_record.document_id,
+            created_at=file_record.created_at
         )
         
     except HTTPException:
@@ -221,44 +259,29 @@ async def get_file_info(
 
 @router.get("/{file_id}/download")
 async def download_file(
-    request: Request,
     file_id: str,
     current_user: User = Depends(get_current_user),
-    file_service: FileService = Depends(get_file_service)
+    file_service: FileService = Depends(get_file_service),
+    client_ip: Optional[str] = Depends(get_client_ip)
 ):
     """
     Download a file.
     
     Args:
-        request: FastAPI request object
         file_id: File ID
         current_user: Current authenticated user
         file_service: File service
+        client_ip: Client IP address
         
     Returns:
-        FileResponse: File download response
+        Response: File download response, or an X-Accel-Redirect for nginx to serve
         
     Raises:
         HTTPException: If file not found or access denied
     """
-    try:
-        file_uuid = uuid.UUID(file_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file ID format"
-        )
+    file_uuid = _parse_uuid(file_id, "Invalid file ID format")
     
     try:
-        # Get client IP
-        client_ip = None
-        if request.client:
-            client_ip = request.client.host
-        elif "x-forwarded-for" in request.headers:
-            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
-        elif "x-real-ip" in request.headers:
-            client_ip = request.headers["x-real-ip"]
-        
         file_record = await file_service.get_file(
             file_id=file_uuid,
             user=current_user,
@@ -271,10 +294,23 @@ async def download_file(
                 detail="File not found or access denied"
             )
         
-        # Get file path
-        file_path = file_service.get_file_path(file_record)
+        if settings.USE_X_ACCEL_REDIRECT:
+            # nginx serves the body with sendfile and answers 404 itself if
+            # the file is gone, so the app never touches the filesystem
+            return Response(
+                media_type=file_record.mime_type,
+                headers={
+                    "X-Accel-Redirect": settings.X_ACCEL_REDIRECT_PREFIX + quote(file_record.file_path),
+                    "Content-Disposition": _content_disposition(file_record.original_filename),
+                }
+            )
         
-        if not file_path.exists():
+        # Stat once off the event loop; FileResponse reuses the result for
+        # its headers instead of statting again
+        file_path = file_service.get_file_path(file_record)
+        try:
+            stat_result = await run_in_threadpool(os.stat, file_path)
+        except FileNotFoundError:
             logger.error(f"File not found on disk: {file_path}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -284,7 +320,8 @@ async def download_file(
         return FileResponse(
             path=str(file_path),
             filename=file_record.original_filename,
-            media_type=file_record.mime_type
+            media_type=file_record.mime_type,
+            stat_result=stat_result
         )
         
     except HTTPException:
@@ -299,19 +336,19 @@ async def download_file(
 
 @router.delete("/{file_id}", response_model=MessageResponse)
 async def delete_file(
-    request: Request,
     file_id: str,
     current_user: User = Depends(get_current_user),
-    file_service: FileService = Depends(get_file_service)
+    file_service: FileService = Depends(get_file_service),
+    client_ip: Optional[str] = Depends(get_client_ip)
 ):
     """
     Delete a file.
     
     Args:
-        request: FastAPI request object
         file_id: File ID
         current_user: Current authenticated user
         file_service: File service
+        client_ip: Client IP address
         
     Returns:
         MessageResponse: Deletion confirmation
@@ -319,24 +356,9 @@ async def delete_file(
     Raises:
         HTTPException: If file not found or access denied
     """
-    try:
-        file_uuid = uuid.UUID(file_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file ID format"
-        )
+    file_uuid = _parse_uuid(file_id, "Invalid file ID format")
     
     try:
-        # Get client IP
-        client_ip = None
-        if request.client:
-            client_ip = request.client.host
-        elif "x-forwarded-for" in request.headers:
-            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
-        elif "x-real-ip" in request.headers:
-            client_ip = request.headers["x-real-ip"]
-        
         success = await file_service.delete_file(
             file_id=file_uuid,
             user=current_user,
@@ -363,21 +385,21 @@ async def delete_file(
 
 @router.put("/{file_id}/move", response_model=FileInfoResponse)
 async def move_file(
-    request: Request,
     file_id: str,
     new_folder_path: str,
     current_user: User = Depends(get_current_user),
-    file_service: FileService = Depends(get_file_service)
+    file_service: FileService = Depends(get_file_service),
+    client_ip: Optional[str] = Depends(get_client_ip)
 ):
     """
     Move a file to a new folder.
     
     Args:
-        request: FastAPI request object
         file_id: File ID
         new_folder_path: New folder path
         current_user: Current authenticated user
         file_service: File service
+        client_ip: Client IP address
         
     Returns:
         FileInfoResponse: Updated file information
@@ -385,24 +407,9 @@ async def move_file(
     Raises:
         HTTPException: If file not found or access denied
     """
-    try:
-        file_uuid = uuid.UUID(file_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file ID format"
-        )
+    file_uuid = _parse_uuid(file_id, "Invalid file ID format")
     
     try:
-        # Get client IP
-        client_ip = None
-        if request.client:
-            client_ip = request.client.host
-        elif "x-forwarded-for" in request.headers:
-            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
-        elif "x-real-ip" in request.headers:
-            client_ip = request.headers["x-real-ip"]
-        
         file_record = await file_service.move_file(
             file_id=file_uuid,
             new_folder_path=new_folder_path,
@@ -417,16 +424,16 @@ async def move_file(
             )
         
         return FileInfoResponse(
-            id=str(file_record.id),
+            id=file_record.id,
             filename=file_record.filename,
             original_filename=file_record.original_filename,
             file_path=file_record.file_path,
             mime_type=file_record.mime_type,
             file_size=file_record.file_size,
             checksum=file_record.checksum,
-            uploaded_by=str(file_record.uploaded_by),
-            document_id=str(file_record.document_id) if file_record.document_id else None,
-            created_at=file_record.created_at.isoformat()
+            uploaded_by=file_record.uploaded_by,
+            document_id=file_record.document_id,
+            created_at=file_record.created_at
         )
         
     except HTTPException:
@@ -439,23 +446,48 @@ async def move_file(
         )
 
 
-@router.post("/paste-image", response_model=FileUploadResponse)
+async def _image_paste_request(request: Request) -> ImagePasteRequest:
+    """
+    Parse the paste body straight from raw bytes into the model.
+    
+    Pastes carry multi-MB base64 strings; validating the JSON in pydantic-core
+    skips building the intermediate dict FastAPI's body parsing would.
+    """
+    try:
+        return ImagePasteRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        # Same error locations FastAPI reports for parsed bodies
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)
+        ])
+
+
+@router.post(
+    "/paste-image",
+    response_model=FileUploadResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ImagePasteRequest.model_json_schema()}}
+        }
+    }
+)
 async def paste_image(
-    request: Request,
-    image_request: ImagePasteRequest,
+    image_request: ImagePasteRequest = Depends(_image_paste_request),
     current_user: User = Depends(get_current_user),
     file_service: FileService = Depends(get_file_service),
-    _rate_limit: dict = Depends(upload_rate_limit)
+    _rate_limit: dict = Depends(upload_rate_limit),
+    client_ip: Optional[str] = Depends(get_client_ip)
 ):
     """
     Process pasted image from editor.
     
     Args:
-        request: FastAPI request object
         image_request: Image paste request data
         current_user: Current authenticated user
         file_service: File service
         _rate_limit: Rate limit check
+        client_ip: Client IP address
         
     Returns:
         FileUploadResponse: Upload result
@@ -464,25 +496,10 @@ async def paste_image(
         HTTPException: If processing fails
     """
     try:
-        # Get client IP
-        client_ip = None
-        if request.client:
-            client_ip = request.client.host
-        elif "x-forwarded-for" in request.headers:
-            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
-        elif "x-real-ip" in request.headers:
-            client_ip = request.headers["x-real-ip"]
-        
         # Parse document ID if provided
         doc_uuid = None
         if image_request.document_id:
-            try:
-                doc_uuid = uuid.UUID(image_request.document_id)
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid document ID format"
-                )
+            doc_uuid = _parse_uuid(image_request.document_id, "Invalid document ID format")
         
         # Process pasted image
         file_record = await file_service.process_pasted_image(
@@ -496,13 +513,13 @@ async def paste_image(
         logger.info(f"Pasted image processed successfully by {current_user.username}")
         
         return FileUploadResponse(
-            id=str(file_record.id),
+            id=file_record.id,
             filename=file_record.filename,
             original_filename=file_record.original_filename,
             file_size=file_record.file_size,
             mime_type=file_record.mime_type,
             checksum=file_record.checksum,
-            created_at=file_record.created_at.isoformat(),
+            created_at=file_record.created_at,
             message="Image processed successfully"
         )
         
@@ -520,9 +537,14 @@ async def paste_image(
         )
 
 
-@router.post("/{file_id}/thumbnail", response_model=FileUploadResponse)
+@router.post(
+    "/{file_id}/thumbnail",
+    response_model=FileUploadResponse,
+    responses={status.HTTP_202_ACCEPTED: {"description": "Thumbnail generation queued"}}
+)
 async def create_thumbnail(
     file_id: str,
+    background_tasks: BackgroundTasks,
     width: int = 300,
     height: int = 300,
     current_user: User = Depends(get_current_user),
@@ -531,26 +553,25 @@ async def create_thumbnail(
     """
     Create thumbnail for an image file.
     
+    An existing thumbnail is returned directly. Otherwise generation is queued
+    to run after the response and 202 is returned; poll the status URL until
+    the thumbnail is available.
+    
     Args:
         file_id: File ID
+        background_tasks: Background task queue
         width: Thumbnail width
         height: Thumbnail height
         current_user: Current authenticated user
         file_service: File service
         
     Returns:
-        FileUploadResponse: Thumbnail creation result
+        FileUploadResponse: Existing thumbnail, or a 202 pending status
         
     Raises:
         HTTPException: If creation fails
     """
-    try:
-        file_uuid = uuid.UUID(file_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file ID format"
-        )
+    file_uuid = _parse_uuid(file_id, "Invalid file ID format")
     
     try:
         # Validate thumbnail size
@@ -560,27 +581,27 @@ async def create_thumbnail(
                 detail="Invalid thumbnail size (must be between 1 and 1024 pixels)"
             )
         
-        thumbnail_record = await file_service.create_thumbnail(
-            file_id=file_uuid,
-            user=current_user,
-            size=(width, height)
-        )
-        
-        if not thumbnail_record:
+        original_file = await file_service.get_file(file_id=file_uuid, user=current_user)
+        if not original_file or not original_file.mime_type.startswith('image/'):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="File not found or not an image"
             )
         
-        return FileUploadResponse(
-            id=str(thumbnail_record.id),
-            filename=thumbnail_record.filename,
-            original_filename=thumbnail_record.original_filename,
-            file_size=thumbnail_record.file_size,
-            mime_type=thumbnail_record.mime_type,
-            checksum=thumbnail_record.checksum,
-            created_at=thumbnail_record.created_at.isoformat(),
-            message="Thumbnail created successfully"
+        thumbnail_record = await file_service.get_thumbnail(original_file)
+        if thumbnail_record:
+            return _thumbnail_response(thumbnail_record)
+        
+        # Concurrent requests share one queued job per file
+        if await _claim_thumbnail_job(file_uuid):
+            background_tasks.add_task(_create_thumbnail_in_background, file_uuid, current_user, (width, height))
+        
+        return ORJSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={
+                "status": "pending",
+                "status_url": f"{router.prefix}/{file_uuid}/thumbnail"
+            }
         )
         
     except HTTPException:
@@ -593,6 +614,118 @@ async def create_thumbnail(
         )
 
 
+@router.get("/{file_id}/thumbnail", response_model=FileUploadResponse)
+async def get_thumbnail(
+    file_id: str,
+    current_user: User = Depends(get_current_user),
+    file_service: FileService = Depends(get_file_service)
+):
+    """
+    Get the generated thumbnail for an image file.
+    
+    Args:
+        file_id: File ID
+        current_user: Current authenticated user
+        file_service: File service
+        
+    Returns:
+        FileUploadResponse: Thumbnail information
+        
+    Raises:
+        HTTPException: If the file is not accessible or the thumbnail isn't ready
+    """
+    file_uuid = _parse_uuid(file_id, "Invalid file ID format")
+    
+    try:
+        original_file = await file_service.get_file(file_id=file_uuid, user=current_user)
+        if not original_file:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="File not found or access denied"
+            )
+        
+        thumbnail_record = await file_service.get_thumbnail(original_file)
+        if not thumbnail_record:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Thumbnail not available"
+            )
+        
+        return _thumbnail_response(thumbnail_record)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting thumbnail: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get thumbnail"
+        )
+
+
+def _thumbnail_response(thumbnail_record) -> FileUploadResponse:
+    """Convert a thumbnail File record to FileUploadResponse."""
+    return FileUploadResponse(
+        id=thumbnail_record.id,
+        filename=thumbnail_record.filename,
+        original_filename=thumbnail_record.original_filename,
+        file_size=thumbnail_record.file_size,
+        mime_type=thumbnail_record.mime_type,
+        checksum=thumbnail_record.checksum,
+        created_at=thumbnail_record.created_at,
+        message="Thumbnail created successfully"
+    )
+
+
+def _thumbnail_job_key(file_id: uuid.UUID) -> str:
+    """Redis key marking a queued thumbnail generation for a file."""
+    return f"thumbnail:pending:{file_id}"
+
+
+async def _claim_thumbnail_job(file_id: uuid.UUID) -> bool:
+    """
+    Claim the right to queue thumbnail generation for a file.
+    
+    Returns:
+        bool: False if another request already has a job pending
+    """
+    try:
+        redis = await get_redis()
+        return bool(await redis.set(_thumbnail_job_key(file_id), "1", nx=True, ex=THUMBNAIL_JOB_TTL))
+    except Exception as e:
+        logger.warning(f"Error claiming thumbnail job for file {file_id}: {e}")
+        return True
+
+
+async def _release_thumbnail_job(file_id: uuid.UUID) -> None:
+    """Release a file's thumbnail job claim once generation has finished."""
+    try:
+        redis = await get_redis()
+        await redis.delete(_thumbnail_job_key(file_id))
+    except Exception as e:
+        logger.warning(f"Error releasing thumbnail job for file {file_id}: {e}")
+
+
+async def _create_thumbnail_in_background(
+    file_id: uuid.UUID,
+    user: User,
+    size: Tuple[int, int]
+) -> None:
+    """Generate a thumbnail after the response, in a session of its own."""
+    try:
+        async with AsyncSessionLocal() as db:
+            file_service = await get_file_service(db)
+            thumbnail_record = await file_service.create_thumbnail(file_id=file_id, user=user, size=size)
+            if thumbnail_record:
+                await db.commit()
+            else:
+                logger.warning(f"Thumbnail generation produced nothing for file {file_id}")
+    except Exception as e:
+        logger.error(f"Error creating thumbnail in background for file {file_id}: {e}")
+    finally:
+        await _release_thumbnail_job(file_id)
+
+
 @router.get("/{file_id}/access-logs")
 async def get_file_access_logs(
     file_id: str,
@@ -615,13 +748,7 @@ async def get_file_access_logs(
     Raises:
         HTTPException: If file not found or access denied
     """
-    try:
-        file_uuid = uuid.UUID(file_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file ID format"
-        )
+    file_uuid = _parse_uuid(file_id, "Invalid file ID format")
     
     try:
         # Validate limit
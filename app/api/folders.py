@@ -4,10 +4,12 @@ Folder management API endpoints.
 import uuid
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.redis import get_redis
 from app.core.auth import get_current_user
 from app.models.user import User
 from app.services.folder import FolderService
@@ -15,17 +17,21 @@ from app.schemas.folder import (
     FolderCreate, FolderUpdate, FolderMoveRequest,
     FolderTreeNode, FolderListResponse
 )
-from app.core.exceptions import (
-    NotFoundError, PermissionDeniedError, ValidationError,
-    DuplicateError, InternalError
-)
+from app.core.exception_mapper import map_service_exceptions
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/folders", tags=["folders"])
 
+# Folder mutations invalidate explicitly; the TTL bounds how stale document counts can get
+FOLDER_TREE_CACHE_TTL = 60
+FOLDER_TREE_CACHE_KEYS = "folder:tree:keys"
+
+_folder_tree_adapter = TypeAdapter(List[FolderTreeNode])
+
 
 @router.post("/", response_model=FolderListResponse, status_code=status.HTTP_201_CREATED)
+@map_service_exceptions
 async def create_folder(
     folder_data: FolderCreate,
     current_user: User = Depends(get_current_user),
@@ -39,19 +45,14 @@ async def create_folder(
     - **parent_path**: Parent folder path (optional)
     - **description**: Folder description (optional)
     """
-    try:
-        service = FolderService(db)
-        folder = await service.create_folder(folder_data, current_user)
-        return _to_folder_response(folder)
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except DuplicateError as e:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = FolderService(db)
+    folder = await service.create_folder(folder_data, current_user)
+    await _invalidate_folder_trees()
+    return _to_folder_response(folder)
 
 
 @router.get("/", response_model=List[FolderListResponse])
+@map_service_exceptions
 async def list_folders(
     parent_path: Optional[str] = Query(None, description="Filter by parent folder path"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of folders to return"),
@@ -66,19 +67,17 @@ async def list_folders(
     - **limit**: Maximum number of folders to return (1-1000)
     - **offset**: Number of folders to skip for pagination
     """
-    try:
-        service = FolderService(db)
-        folders = await service.list_folders(
-            parent_path=parent_path,
-            limit=limit,
-            offset=offset
-        )
-        return [_to_folder_response(folder) for folder in folders]
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = FolderService(db)
+    folders = await service.list_folders(
+        parent_path=parent_path,
+        limit=limit,
+        offset=offset
+    )
+    return [_to_folder_response(folder) for folder in folders]
 
 
 @router.get("/tree", response_model=List[FolderTreeNode])
+@map_service_exceptions
 async def get_folder_tree(
     root_path: Optional[str] = Query(None, description="Root path for tree (default: all folders)"),
     max_depth: int = Query(10, ge=1, le=20, description="Maximum tree depth"),
@@ -93,15 +92,20 @@ async def get_folder_tree(
     
     Returns folders organized in a hierarchical tree structure with document counts.
     """
-    try:
-        service = FolderService(db)
-        tree = await service.get_folder_tree(root_path=root_path, max_depth=max_depth)
-        return tree
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    cache_key = f"folder:tree:{root_path or '/'}:{max_depth}"
+    cached = await _get_cached_tree(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
+    service = FolderService(db)
+    tree = await service.get_folder_tree(root_path=root_path, max_depth=max_depth)
+    body = _folder_tree_adapter.dump_json(tree)
+    await _cache_tree(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{folder_id}", response_model=FolderListResponse)
+@map_service_exceptions
 async def get_folder(
     folder_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -112,17 +116,13 @@ async def get_folder(
     
     - **folder_id**: UUID of the folder to retrieve
     """
-    try:
-        service = FolderService(db)
-        folder = await service.get_folder(folder_id)
-        return _to_folder_response(folder)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = FolderService(db)
+    folder = await service.get_folder(folder_id)
+    return _to_folder_response(folder)
 
 
 @router.put("/{folder_id}", response_model=FolderListResponse)
+@map_service_exceptions
 async def update_folder(
     folder_id: uuid.UUID,
     folder_data: FolderUpdate,
@@ -138,21 +138,14 @@ async def update_folder(
     
     Only the folder creator or admin can update a folder.
     """
-    try:
-        service = FolderService(db)
-        folder = await service.update_folder(folder_id, folder_data, current_user)
-        return _to_folder_response(folder)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = FolderService(db)
+    folder = await service.update_folder(folder_id, folder_data, current_user)
+    await _invalidate_folder_trees()
+    return _to_folder_response(folder)
 
 
 @router.delete("/{folder_id}", status_code=status.HTTP_204_NO_CONTENT)
+@map_service_exceptions
 async def delete_folder(
     folder_id: uuid.UUID,
     force: bool = Query(False, description="Force deletion even if folder contains documents"),
@@ -168,20 +161,13 @@ async def delete_folder(
     Only the folder creator or admin can delete a folder.
     By default, folders with documents cannot be deleted unless force=true.
     """
-    try:
-        service = FolderService(db)
-        await service.delete_folder(folder_id, current_user, force=force)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+    service = FolderService(db)
+    await service.delete_folder(folder_id, current_user, force=force)
+    await _invalidate_folder_trees()
 
 
 @router.post("/{folder_id}/move", response_model=FolderListResponse)
+@map_service_exceptions
 async def move_folder(
     folder_id: uuid.UUID,
     move_data: FolderMoveRequest,
@@ -196,31 +182,54 @@ async def move_folder(
     
     Only the folder creator or admin can move a folder.
     """
+    service = FolderService(db)
+    folder = await service.move_folder(folder_id, move_data.new_parent_path, current_user)
+    await _invalidate_folder_trees()
+    return _to_folder_response(folder)
+
+
+async def _get_cached_tree(cache_key: str) -> Optional[str]:
+    """Get a serialized folder tree from Redis, if cached."""
+    try:
+        redis = await get_redis()
+        return await redis.get(cache_key)
+    except Exception as e:
+        logger.warning(f"Error reading cached folder tree {cache_key}: {e}")
+        return None
+
+
+async def _cache_tree(cache_key: str, body: bytes) -> None:
+    """Cache a serialized folder tree, tracking its key for invalidation."""
+    try:
+        redis = await get_redis()
+        pipe = redis.pipeline()
+        pipe.set(cache_key, body, ex=FOLDER_TREE_CACHE_TTL)
+        pipe.sadd(FOLDER_TREE_CACHE_KEYS, cache_key)
+        pipe.expire(FOLDER_TREE_CACHE_KEYS, FOLDER_TREE_CACHE_TTL)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Error caching folder tree {cache_key}: {e}")
+
+
+async def _invalidate_folder_trees() -> None:
+    """Drop every cached folder tree after the hierarchy changes."""
     try:
-        service = FolderService(db)
-        folder = await service.move_folder(folder_id, move_data.new_parent_path, current_user)
-        return _to_folder_response(folder)
-    except NotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-    except PermissionDeniedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    except DuplicateError as e:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
-    except InternalError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=e.message)
+        redis = await get_redis()
+        keys = await redis.smembers(FOLDER_TREE_CACHE_KEYS)
+        await redis.delete(FOLDER_TREE_CACHE_KEYS, *keys)
+    except Exception as e:
+        logger.warning(f"Error invalidating cached folder trees: {e}")
 
 
 def _to_folder_response(folder) -> FolderListResponse:
     """Convert Folder model to FolderListResponse schema."""
     return FolderListResponse(
-        id=str(folder.id),
+        id=folder.id,
         name=folder.name,
         path=folder.path,
         parent_path=folder.parent_path,
         description=folder.description,
-        created_by_id=str(folder.created_by),
-        created_at=folder.created_at.isoformat(),
+        created_by_id=folder.created_by_id,
+        created_at=folder.created_at,
         document_count=getattr(folder, 'document_count', 0)
     )
\ No newline at end of file
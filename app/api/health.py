@@ -1,100 +1,190 @@
 """
 Health check endpoints for container orchestration.
 """
+import asyncio
 import time
-from typing import Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Awaitable, Callable, Dict, Any, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import engine, get_health_db
 from app.core.redis import get_redis
 from app.core.logging import get_logger
+from app.api.health_simple import health_check, static_json_response
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Probe results are reused for this long, so frequent UI and orchestrator
+# polling costs one real DB/Redis round trip per interval
+PROBE_CACHE_TTL = 2.0
 
-@router.get("/health")
-async def health_check() -> Dict[str, Any]:
-    """
-    Basic health check endpoint.
-    
-    Returns:
-        Dict: Health status
-    """
-    return {
-        "status": "healthy",
-        "timestamp": time.time(),
-        "service": "wiki-app"
-    }
+_probe_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_probe_locks: Dict[str, asyncio.Lock] = {}
 
 
-@router.get("/health/detailed")
-async def detailed_health_check(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
-    """
-    Detailed health check including database and Redis connectivity.
-    
-    Args:
-        db: Database session
-        
-    Returns:
-        Dict: Detailed health status
-        
-    Raises:
-        HTTPException: If any service is unhealthy
-    """
-    health_status = {
-        "status": "healthy",
-        "timestamp": time.time(),
-        "service": "wiki-app",
-        "checks": {}
-    }
-    
-    # Check database connectivity
+async def _probe_database(db: AsyncSession) -> Dict[str, Any]:
+    """Run a trivial query against the database."""
     try:
-        start_time = time.time()
-        result = await db.execute(text("SELECT 1"))
-        db_duration = time.time() - start_time
+        t0 = time.perf_counter_ns()
+        await db.execute(text("SELECT 1"))
+        duration_ms = (time.perf_counter_ns() - t0) / 1_000_000
         
-        health_status["checks"]["database"] = {
+        await logger.ainfo("Database health check passed", duration_ms=duration_ms)
+        return {
             "status": "healthy",
-            "response_time_ms": round(db_duration * 1000, 2)
+            "response_time_ms": duration_ms
         }
         
-        await logger.ainfo("Database health check passed", duration_ms=round(db_duration * 1000, 2))
-        
     except Exception as e:
-        health_status["checks"]["database"] = {
+        await logger.aerror("Database health check failed", error=str(e))
+        return {
             "status": "unhealthy",
             "error": str(e)
         }
-        health_status["status"] = "unhealthy"
-        await logger.aerror("Database health check failed", error=str(e))
+
+
+def _pool_stats() -> Optional[Dict[str, int]]:
+    """Read the application pool counters, or None for unpooled engines."""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return None
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+    }
+
+
+async def _probe_database_pool(db: AsyncSession) -> Dict[str, Any]:
+    """
+    Judge database readiness from the application pool counters.
+    
+    A warm pool with idle, pre-pinged connections and spare capacity is
+    ready without a round trip; otherwise fall back to ``SELECT 1``.
+    """
+    stats = _pool_stats()
+    if stats is None:
+        return await _probe_database(db)
     
-    # Check Redis connectivity
+    capacity = stats["size"] + stats["max_overflow"]
+    if stats["checked_in"] > 0 and stats["checked_out"] < capacity:
+        return {"status": "healthy", "pool": stats}
+    
+    result = await _probe_database(db)
+    return {**result, "pool": stats}
+
+
+async def _probe_redis() -> Dict[str, Any]:
+    """Ping Redis."""
     try:
         redis = await get_redis()
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         await redis.ping()
-        redis_duration = time.time() - start_time
+        duration_ms = (time.perf_counter_ns() - t0) / 1_000_000
         
-        health_status["checks"]["redis"] = {
+        await logger.ainfo("Redis health check passed", duration_ms=duration_ms)
+        return {
             "status": "healthy",
-            "response_time_ms": round(redis_duration * 1000, 2)
+            "response_time_ms": duration_ms
         }
         
-        await logger.ainfo("Redis health check passed", duration_ms=round(redis_duration * 1000, 2))
-        
     except Exception as e:
-        health_status["checks"]["redis"] = {
+        await logger.aerror("Redis health check failed", error=str(e))
+        return {
             "status": "unhealthy",
             "error": str(e)
         }
-        health_status["status"] = "unhealthy"
-        await logger.aerror("Redis health check failed", error=str(e))
+
+
+async def _cached_probe(
+    name: str,
+    probe: Callable[[], Awaitable[Dict[str, Any]]],
+    fresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Get a probe result, running the probe at most once per PROBE_CACHE_TTL.
+    
+    Concurrent callers on a cache miss wait for a single in-flight probe
+    instead of each running their own.
+    
+    Args:
+        name: Probe cache key
+        probe: Coroutine function performing the check
+        fresh: Bypass the cached result
+        
+    Returns:
+        Dict: Probe result
+    """
+    if not fresh:
+        cached = _probe_cache.get(name)
+        if cached and time.monotonic() - cached[0] < PROBE_CACHE_TTL:
+            return cached[1]
+    
+    lock = _probe_locks.setdefault(name, asyncio.Lock())
+    async with lock:
+        # Another caller may have refreshed it while we waited
+        if not fresh:
+            cached = _probe_cache.get(name)
+            if cached and time.monotonic() - cached[0] < PROBE_CACHE_TTL:
+                return cached[1]
+        
+        result = await probe()
+        _probe_cache[name] = (time.monotonic(), result)
+        return result
+
+
+async def _run_probes(db: AsyncSession, fresh: bool) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the database and Redis probes concurrently through the cache.
+    
+    The session only checks out a pool connection if the database probe
+    actually runs.
+    """
+    database, redis = await asyncio.gather(
+        _cached_probe("database", lambda: _probe_database(db), fresh),
+        _cached_probe("redis", _probe_redis, fresh)
+    )
+    return {"database": database, "redis": redis}
+
+
+# Basic probe shared with the lightweight entry points
+router.add_api_route("/health", health_check, methods=["GET", "HEAD"])
+
+
+@router.get("/health/detailed")
+async def detailed_health_check(
+    fresh: bool = Query(False, description="Bypass cached probe results"),
+    db: AsyncSession = Depends(get_health_db)
+) -> Dict[str, Any]:
+    """
+    Detailed health check including database and Redis connectivity.
+    
+    Args:
+        fresh: Bypass cached probe results
+        db: Health probe database session
+        
+    Returns:
+        Dict: Detailed health status
+        
+    Raises:
+        HTTPException: If any service is unhealthy
+    """
+    checks = await _run_probes(db, fresh)
+    healthy = all(check["status"] == "healthy" for check in checks.values())
+    
+    health_status = {
+        "status": "healthy" if healthy else "unhealthy",
+        "timestamp": time.time(),
+        "service": "wiki-app",
+        "checks": checks
+    }
     
     # Return appropriate status code
-    if health_status["status"] == "unhealthy":
+    if not healthy:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=health_status
@@ -104,50 +194,55 @@ async def detailed_health_check(db: AsyncSession = Depends(get_db)) -> Dict[str,
 
 
 @router.get("/health/ready")
-async def readiness_check(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+async def readiness_check(
+    fresh: bool = Query(False, description="Bypass cached probe results"),
+    db: AsyncSession = Depends(get_health_db)
+) -> Dict[str, Any]:
     """
     Readiness check for Kubernetes-style orchestration.
     
+    Database readiness comes from the application pool counters when the
+    pool is warm and has spare capacity; the Redis probe result is shared
+    with the detailed check.
+    
     Args:
-        db: Database session
+        fresh: Bypass cached probe results
+        db: Health probe database session
         
     Returns:
         Dict: Readiness status
     """
-    try:
-        # Check if we can perform basic database operations
-        await db.execute(text("SELECT 1"))
-        
-        # Check Redis
-        redis = await get_redis()
-        await redis.ping()
-        
-        return {
-            "status": "ready",
-            "timestamp": time.time()
-        }
-        
-    except Exception as e:
-        await logger.aerror("Readiness check failed", error=str(e))
+    database, redis = await asyncio.gather(
+        _cached_probe("database_pool", lambda: _probe_database_pool(db), fresh),
+        _cached_probe("redis", _probe_redis, fresh)
+    )
+    checks = {"database": database, "redis": redis}
+    errors = [check["error"] for check in checks.values() if check["status"] != "healthy"]
+    
+    if errors:
+        await logger.aerror("Readiness check failed", error=errors[0])
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={
                 "status": "not_ready",
-                "error": str(e),
+                "error": errors[0],
                 "timestamp": time.time()
             }
         )
+    
+    return {
+        "status": "ready",
+        "timestamp": time.time(),
+        "database_pool": checks["database"].get("pool")
+    }
 
 
-@router.get("/health/live")
-async def liveness_check() -> Dict[str, Any]:
+@router.api_route("/health/live", methods=["GET", "HEAD"])
+async def liveness_check() -> Response:
     """
     Liveness check for Kubernetes-style orchestration.
     
     Returns:
-        Dict: Liveness status
+        Response: Liveness status
     """
-    return {
-        "status": "alive",
-        "timestamp": time.time()
-    }
\ No newline at end of file
+    return static_json_response("live", {"status": "alive"})
@@ -1,17 +1,46 @@
 """
 Simple health check endpoint for development.
+
+Kept free of database and Redis imports so the lightweight entry points can
+mount it; the full app registers the same handler from app.api.health.
 """
-from fastapi import APIRouter
-from datetime import datetime
+import time
+from typing import Any, Dict, Tuple
+
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# Pre-serialized bodies for fixed probe responses, by whole second
+_static_bodies: Dict[str, Tuple[int, bytes]] = {}
+
+
+def static_json_response(name: str, payload: Dict[str, Any]) -> Response:
+    """
+    Build a fixed JSON probe response, re-serializing at most once a second.
+    
+    Args:
+        name: Body cache key
+        payload: Response fields, without the timestamp
+        
+    Returns:
+        Response: Pre-serialized JSON response
+    """
+    now = int(time.time())
+    cached = _static_bodies.get(name)
+    if cached is None or cached[0] != now:
+        cached = (now, orjson.dumps({**payload, "timestamp": now}))
+        _static_bodies[name] = cached
+    return Response(content=cached[1], media_type="application/json")
+
 
-@router.get("/health")
-async def health_check():
-    """Simple health check endpoint."""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "service": "wiki-documentation-app"
-    }
\ No newline at end of file
+@router.api_route("/health", methods=["GET", "HEAD"])
+async def health_check() -> Response:
+    """
+    Basic health check endpoint.
+    
+    Returns:
+        Response: Health status
+    """
+    return static_json_response("health", {"status": "healthy", "service": "wiki-app"})
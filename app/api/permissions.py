@@ -1,15 +1,18 @@
 """
 Permission management API endpoints.
 """
+import asyncio
 import logging
 import uuid
+from datetime import datetime
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, field_serializer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.auth import get_current_admin_user, get_permission_service
+from app.core.database import AsyncSessionLocal, get_db
+from app.core.auth import get_current_admin_user, get_permission_service, get_client_ip
 from app.models.user import User
 from app.models.permission import PermissionAction, PermissionEffect, PermissionGroup, Permission
 from app.services.permission import PermissionService, PermissionError
@@ -27,16 +30,21 @@ class PermissionGroupCreate(BaseModel):
 
 class PermissionGroupResponse(BaseModel):
     """Permission group response model."""
-    id: str
+    id: uuid.UUID
     name: str
     description: Optional[str]
-    created_at: str
+    created_at: datetime
     permissions_count: int
+    
+    @field_serializer('created_at')
+    def serialize_created_at(self, value: datetime) -> str:
+        """Keep the isoformat() timestamps clients received before."""
+        return value.isoformat()
 
 
 class PermissionCreate(BaseModel):
     """Permission creation model."""
-    group_id: str = Field(..., description="Permission group ID")
+    group_id: uuid.UUID = Field(..., description="Permission group ID")
     resource_pattern: str = Field(..., min_length=1, description="Resource path pattern")
     action: PermissionAction = Field(..., description="Permission action")
     effect: PermissionEffect = Field(..., description="Permission effect")
@@ -44,24 +52,29 @@ class PermissionCreate(BaseModel):
 
 class PermissionResponse(BaseModel):
     """Permission response model."""
-    id: str
-    group_id: str
+    id: uuid.UUID
+    group_id: uuid.UUID
     group_name: str
     resource_pattern: str
     action: str
     effect: str
-    created_at: str
+    created_at: datetime
+    
+    @field_serializer('created_at')
+    def serialize_created_at(self, value: datetime) -> str:
+        """Keep the isoformat() timestamps clients received before."""
+        return value.isoformat()
 
 
 class UserGroupAssignment(BaseModel):
     """User group assignment model."""
-    user_id: str = Field(..., description="User ID")
-    group_id: str = Field(..., description="Permission group ID")
+    user_id: uuid.UUID = Field(..., description="User ID")
+    group_id: uuid.UUID = Field(..., description="Permission group ID")
 
 
 class UserPermissionsResponse(BaseModel):
     """User permissions response model."""
-    user_id: str
+    user_id: uuid.UUID
     username: str
     groups: List[Dict[str, Any]]
     effective_permissions: Dict[str, bool]
@@ -101,10 +114,10 @@ async def create_permission_group(
         logger.info(f"Permission group created by {current_user.username}: {group.name}")
         
         return PermissionGroupResponse(
-            id=str(group.id),
+            id=group.id,
             name=group.name,
             description=group.description,
-            created_at=group.created_at.isoformat(),
+            created_at=group.created_at,
             permissions_count=0
         )
         
@@ -138,29 +151,26 @@ async def list_permission_groups(
     """
     try:
         from sqlalchemy import select, func
-        from sqlalchemy.orm import selectinload
         
-        # Query groups with permission counts
+        # Query group columns with permission counts
         stmt = (
-            select(PermissionGroup, func.count(Permission.id).label('permissions_count'))
+            select(
+                PermissionGroup.id,
+                PermissionGroup.name,
+                PermissionGroup.description,
+                PermissionGroup.created_at,
+                func.count(Permission.id).label('permissions_count')
+            )
             .outerjoin(Permission)
             .group_by(PermissionGroup.id)
             .order_by(PermissionGroup.name)
         )
         
         result = await db.execute(stmt)
-        groups_with_counts = result.all()
-        
-        return [
-            PermissionGroupResponse(
-                id=str(group.id),
-                name=group.name,
-                description=group.description,
-                created_at=group.created_at.isoformat(),
-                permissions_count=count
-            )
-            for group, count in groups_with_counts
-        ]
+        
+        # Rows hold already-typed column values, so they are serialized
+        # directly; response_model only documents the shape
+        return ORJSONResponse([dict(row) for row in result.mappings()])
         
     except Exception as e:
         logger.error(f"Error listing permission groups: {e}")
@@ -192,28 +202,22 @@ async def create_permission(
     """
     try:
         permission = await permission_service.create_permission(
-            group_id=uuid.UUID(permission_data.group_id),
+            group_id=permission_data.group_id,
             resource_pattern=permission_data.resource_pattern,
             action=permission_data.action,
             effect=permission_data.effect
         )
         
-        # Get group name for response
-        from sqlalchemy import select
-        stmt = select(PermissionGroup).where(PermissionGroup.id == permission.group_id)
-        result = await permission_service.db.execute(stmt)
-        group = result.scalar_one()
-        
         logger.info(f"Permission created by {current_user.username}: {permission_data.resource_pattern}")
         
         return PermissionResponse(
-            id=str(permission.id),
-            group_id=str(permission.group_id),
-            group_name=group.name,
+            id=permission.id,
+            group_id=permission.group_id,
+            group_name=permission.group.name,
             resource_pattern=permission.resource_pattern,
             action=permission.action.value,
             effect=permission.effect.value,
-            created_at=permission.created_at.isoformat()
+            created_at=permission.created_at
         )
         
     except PermissionError as e:
@@ -221,11 +225,6 @@ async def create_permission(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid UUID format"
-        )
     except Exception as e:
         logger.error(f"Error creating permission: {e}")
         raise HTTPException(
@@ -236,7 +235,7 @@ async def create_permission(
 
 @router.get("/rules", response_model=List[PermissionResponse])
 async def list_permissions(
-    group_id: Optional[str] = None,
+    group_id: Optional[uuid.UUID] = None,
     current_user: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -253,38 +252,30 @@ async def list_permissions(
     """
     try:
         from sqlalchemy import select
-        from sqlalchemy.orm import selectinload
         
         stmt = (
-            select(Permission)
-            .options(selectinload(Permission.group))
+            select(
+                Permission.id,
+                Permission.group_id,
+                PermissionGroup.name.label('group_name'),
+                Permission.resource_pattern,
+                Permission.action,
+                Permission.effect,
+                Permission.created_at
+            )
+            .join(PermissionGroup, Permission.group_id == PermissionGroup.id)
             .order_by(Permission.resource_pattern)
         )
         
         if group_id:
-            stmt = stmt.where(Permission.group_id == uuid.UUID(group_id))
+            stmt = stmt.where(Permission.group_id == group_id)
         
         result = await db.execute(stmt)
-        permissions = result.scalars().all()
-        
-        return [
-            PermissionResponse(
-                id=str(permission.id),
-                group_id=str(permission.group_id),
-                group_name=permission.group.name,
-                resource_pattern=permission.resource_pattern,
-                action=permission.action.value,
-                effect=permission.effect.value,
-                created_at=permission.created_at.isoformat()
-            )
-            for permission in permissions
-        ]
         
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid UUID format"
-        )
+        # Rows hold already-typed column values, so they are serialized
+        # directly; response_model only documents the shape
+        return ORJSONResponse([dict(row) for row in result.mappings()])
+        
     except Exception as e:
         logger.error(f"Error listing permissions: {e}")
         raise HTTPException(
@@ -315,8 +306,8 @@ async def assign_user_to_group(
     """
     try:
         await permission_service.assign_user_to_group(
-            user_id=uuid.UUID(assignment.user_id),
-            group_id=uuid.UUID(assignment.group_id)
+            user_id=assignment.user_id,
+            group_id=assignment.group_id
         )
         
         logger.info(f"User assigned to group by {current_user.username}: {assignment.user_id} -> {assignment.group_id}")
@@ -328,11 +319,6 @@ async def assign_user_to_group(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid UUID format"
-        )
     except Exception as e:
         logger.error(f"Error assigning user to group: {e}")
         raise HTTPException(
@@ -363,8 +349,8 @@ async def remove_user_from_group(
     """
     try:
         success = await permission_service.remove_user_from_group(
-            user_id=uuid.UUID(assignment.user_id),
-            group_id=uuid.UUID(assignment.group_id)
+            user_id=assignment.user_id,
+            group_id=assignment.group_id
         )
         
         if not success:
@@ -379,11 +365,6 @@ async def remove_user_from_group(
         
     except HTTPException:
         raise
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid UUID format"
-        )
     except Exception as e:
         logger.error(f"Error removing user from group: {e}")
         raise HTTPException(
@@ -394,7 +375,7 @@ async def remove_user_from_group(
 
 @router.get("/users/{user_id}", response_model=UserPermissionsResponse)
 async def get_user_permissions(
-    user_id: str,
+    user_id: uuid.UUID,
     resource_path: str = "/",
     current_user: User = Depends(get_current_admin_user),
     permission_service: PermissionService = Depends(get_permission_service),
@@ -420,7 +401,7 @@ async def get_user_permissions(
         from sqlalchemy import select
         
         # Get user
-        user_stmt = select(User).where(User.id == uuid.UUID(user_id))
+        user_stmt = select(User).where(User.id == user_id)
         user_result = await db.execute(user_stmt)
         user = user_result.scalar_one_or_none()
         
@@ -430,27 +411,29 @@ async def get_user_permissions(
                 detail="User not found"
             )
         
-        # Get user's groups
-        groups = await permission_service.get_user_groups(user.id)
-        
-        # Get effective permissions for the resource path
-        effective_permissions = await permission_service.get_effective_permissions(
-            user=user,
-            resource_path=resource_path
-        )
-        
-        groups_data = [
-            {
-                "id": str(group.id),
-                "name": group.name,
-                "description": group.description,
-                "permissions_count": len(group.permissions)
-            }
-            for group in groups
-        ]
+        # Load groups and effective permissions concurrently; a session
+        # cannot run two queries at once, so groups get their own
+        async with AsyncSessionLocal() as groups_db:
+            groups, effective_permissions = await asyncio.gather(
+                PermissionService(groups_db).get_user_groups(user.id),
+                permission_service.get_effective_permissions(
+                    user=user,
+                    resource_path=resource_path
+                )
+            )
+            
+            groups_data = [
+                {
+                    "id": group.id,
+                    "name": group.name,
+                    "description": group.description,
+                    "permissions_count": len(group.permissions)
+                }
+                for group in groups
+            ]
         
         return UserPermissionsResponse(
-            user_id=str(user.id),
+            user_id=user.id,
             username=user.username,
             groups=groups_data,
             effective_permissions=effective_permissions
@@ -458,11 +441,6 @@ async def get_user_permissions(
         
     except HTTPException:
         raise
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid UUID format"
-        )
     except Exception as e:
         logger.error(f"Error getting user permissions: {e}")
         raise HTTPException(
@@ -473,35 +451,26 @@ async def get_user_permissions(
 
 @router.post("/check", response_model=Dict[str, bool])
 async def check_permission(
-    request: Request,
     resource_path: str,
     action: PermissionAction,
     current_user: User = Depends(get_current_admin_user),
-    permission_service: PermissionService = Depends(get_permission_service)
+    permission_service: PermissionService = Depends(get_permission_service),
+    client_ip: Optional[str] = Depends(get_client_ip)
 ):
     """
     Check if current user has specific permission.
     
     Args:
-        request: FastAPI request object
         resource_path: Resource path to check
         action: Permission action to check
         current_user: Current admin user
         permission_service: Permission service
+        client_ip: Client IP address
         
     Returns:
         Dict[str, bool]: Permission check result
     """
     try:
-        # Get client IP
-        client_ip = None
-        if request.client:
-            client_ip = request.client.host
-        elif "x-forwarded-for" in request.headers:
-            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
-        elif "x-real-ip" in request.headers:
-            client_ip = request.headers["x-real-ip"]
-        
         has_permission = await permission_service.check_permission(
             user=current_user,
             resource_path=resource_path,
@@ -4,6 +4,7 @@ Search API endpoints for full-text search and autocomplete functionality.
 import logging
 from typing import List, Optional, Dict
 from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -18,7 +19,11 @@ from fastapi import Request
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/search", tags=["search"])
+router = APIRouter(
+    prefix="/api/v1/search",
+    tags=["search"],
+    default_response_class=ORJSONResponse
+)
 
 
 @router.get(
@@ -197,8 +202,8 @@ async def get_search_suggestions(
         # Return empty list on error to maintain performance
         return []
 
-@
-router.get(
+
+@router.get(
     "/analytics/performance",
     response_model=Dict,
     responses={
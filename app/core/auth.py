@@ -45,69 +45,201 @@ async def get_permission_service(db: AsyncSession = Depends(get_db)) -> Permissi
     return PermissionService(db)
 
 
-async def get_current_user(
+async def get_client_ip(request: Request) -> Optional[str]:
+    """
+    Dependency to resolve the client IP address for a request.
+    
+    The connection's peer address wins; forwarded headers are only consulted
+    when it is missing. FastAPI caches dependency results per request, so the
+    headers are parsed once however many dependencies ask for it.
+    
+    Args:
+        request: FastAPI request object
+        
+    Returns:
+        Optional[str]: Client IP address, if known
+    """
+    if request.client:
+        return request.client.host
+    
+    headers = request.headers
+    forwarded_for = headers.get("x-forwarded-for")
+    if forwarded_for:
+        return forwarded_for.split(",", 1)[0].strip()
+    return headers.get("x-real-ip")
+
+
+def _bearer_token(request: Request) -> Optional[str]:
+    """Extract the bearer token from the Authorization header."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        return token
+    return None
+
+
+async def _resolve_request_user(
     request: Request,
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    auth_service: AuthenticationService = Depends(get_auth_service)
+    token: str,
+    auth_service: AuthenticationService
 ) -> User:
     """
-    Dependency to get current authenticated user.
+    Resolve the bearer token's user at most once per request.
+    
+    The outcome is memoized on request.state (``user`` or ``auth_error``),
+    so several auth dependencies on one route share a single lookup, and
+    routes that never ask for the user never pay for it.
     
     Args:
         request: FastAPI request object
-        credentials: HTTP Bearer credentials
-        auth_service: Authentication service
+        token: Bearer token
+        auth_service: Service bound to the request's session
         
     Returns:
-        User: Current authenticated user
+        User: Resolved user
         
     Raises:
-        HTTPException: If authentication fails
+        Exception: The memoized resolution error
     """
-    if not credentials:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication credentials required",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    state = request.state
+    user = getattr(state, "user", None)
+    if user is not None:
+        return user
+    error = getattr(state, "auth_error", None)
+    if error is not None:
+        raise error
     
     try:
-        user = await auth_service.get_current_user(credentials.credentials)
+        user = await auth_service.get_current_user(token)
+    except Exception as e:
+        state.auth_error = e
+        raise
+    
+    state.user = user
+    return user
+
+
+def _authentication_exception(error: Optional[Exception]) -> HTTPException:
+    """
+    Map an authentication failure to its HTTP response.
+    
+    Args:
+        error: Error raised while resolving the user, or None if no
+            credentials were supplied
         
-        # Log the request for audit purposes
-        logger.info(
-            f"Authenticated request: user={user.username}, "
-            f"endpoint={request.url.path}, method={request.method}, "
-            f"ip={request.client.host if request.client else 'unknown'}"
+    Returns:
+        HTTPException: Exception to raise from the dependency
+    """
+    if error is None:
+        return HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication credentials required",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-        
-        return user
-        
-    except TokenBlacklistError:
-        raise HTTPException(
+    if isinstance(error, TokenBlacklistError):
+        return HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been revoked",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except AuthenticationError as e:
-        logger.warning(f"Authentication failed: {e}")
-        raise HTTPException(
+    if isinstance(error, AuthenticationError):
+        logger.warning(f"Authentication failed: {error}")
+        return HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except AuthorizationError as e:
-        logger.warning(f"Authorization failed: {e}")
-        raise HTTPException(
+    if isinstance(error, AuthorizationError):
+        logger.warning(f"Authorization failed: {error}")
+        return HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is disabled or not found",
         )
+    logger.error(f"Unexpected error in authentication: {error}")
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail="Authentication service error",
+    )
+
+
+def _log_authenticated_request(request: Request, user: User) -> None:
+    """Log an authenticated request for audit purposes."""
+    logger.info(
+        f"Authenticated request: user={user.username}, "
+        f"endpoint={request.url.path}, method={request.method}, "
+        f"ip={request.client.host if request.client else 'unknown'}"
+    )
+
+
+async def get_request_user(
+    request: Request,
+    auth_service: AuthenticationService = Depends(get_auth_service)
+) -> User:
+    """
+    Lightweight dependency returning the request's authenticated user.
+    
+    Reads the bearer token straight from the Authorization header. The
+    lookup runs on the request's get_db session, which FastAPI shares with
+    every other dependency of the request.
+    
+    Args:
+        request: FastAPI request object
+        auth_service: Authentication service
+        
+    Returns:
+        User: Current authenticated user
+        
+    Raises:
+        HTTPException: If authentication failed or no credentials were sent
+    """
+    token = _bearer_token(request)
+    if not token:
+        raise _authentication_exception(None)
+    
+    try:
+        user = await _resolve_request_user(request, token, auth_service)
     except Exception as e:
-        logger.error(f"Unexpected error in authentication: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication service error",
-        )
+        raise _authentication_exception(e)
+    
+    _log_authenticated_request(request, user)
+    return user
+
+
+async def get_current_user(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    auth_service: AuthenticationService = Depends(get_auth_service)
+) -> User:
+    """
+    Dependency to get current authenticated user.
+    
+    Args:
+        request: FastAPI request object
+        credentials: HTTP Bearer credentials
+        auth_service: Authentication service
+        
+    Returns:
+        User: Current authenticated user
+        
+    Raises:
+        HTTPException: If authentication fails
+    """
+    if not credentials:
+        raise _authentication_exception(None)
+    
+    try:
+        # Reuse a lookup already made for this request, attached to this
+        # request's session
+        resolved_user = getattr(request.state, "user", None)
+        if resolved_user is not None:
+            user = await auth_service.db.merge(resolved_user, load=False)
+        else:
+            user = await _resolve_request_user(request, credentials.credentials, auth_service)
+        
+        _log_authenticated_request(request, user)
+        return user
+        
+    except Exception as e:
+        raise _authentication_exception(e)
 
 
 async def get_current_active_user(
@@ -199,17 +331,17 @@ class RequirePermissions:
     
     async def __call__(
         self,
-        request: Request,
         current_user: User = Depends(get_current_active_user),
-        permission_service: PermissionService = Depends(get_permission_service)
+        permission_service: PermissionService = Depends(get_permission_service),
+        client_ip: Optional[str] = Depends(get_client_ip)
     ) -> User:
         """
         Check if current user has required permissions.
         
         Args:
-            request: FastAPI request object
             current_user: Current active user
             permission_service: Permission service
+            client_ip: Client IP address for audit logging
             
         Returns:
             User: Current user if permissions are satisfied
@@ -217,15 +349,6 @@ class RequirePermissions:
         Raises:
             HTTPException: If user lacks required permissions
         """
-        # Get client IP for audit logging
-        client_ip = None
-        if request.client:
-            client_ip = request.client.host
-        elif "x-forwarded-for" in request.headers:
-            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
-        elif "x-real-ip" in request.headers:
-            client_ip = request.headers["x-real-ip"]
-        
         # Check each required permission
         for permission in self.required_permissions:
             has_permission = await permission_service.check_permission(
@@ -255,19 +378,19 @@ class RequireResourcePermission:
     
     async def __call__(
         self,
-        request: Request,
         resource_path: str,
         current_user: User = Depends(get_current_active_user),
-        permission_service: PermissionService = Depends(get_permission_service)
+        permission_service: PermissionService = Depends(get_permission_service),
+        client_ip: Optional[str] = Depends(get_client_ip)
     ) -> User:
         """
         Check if current user has permission for specific resource.
         
         Args:
-            request: FastAPI request object
             resource_path: Resource path to check
             current_user: Current active user
             permission_service: Permission service
+            client_ip: Client IP address for audit logging
             
         Returns:
             User: Current user if permission is granted
@@ -275,15 +398,6 @@ class RequireResourcePermission:
         Raises:
             HTTPException: If user lacks required permission
         """
-        # Get client IP for audit logging
-        client_ip = None
-        if request.client:
-            client_ip = request.client.host
-        elif "x-forwarded-for" in request.headers:
-            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
-        elif "x-real-ip" in request.headers:
-            client_ip = request.headers["x-real-ip"]
-        
         has_permission = await permission_service.check_permission(
             user=current_user,
             resource_path=resource_path,
@@ -0,0 +1,217 @@
+"""
+In-process caches for authentication: token-to-user lookups and recently
+failed login credentials.
+"""
+import hashlib
+import hmac
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Per-user epoch shared by all workers; bumping it invalidates every
+# worker's cached token lookups for that user
+USER_EPOCH_KEY = "auth:user_epoch:{user_id}"
+USER_EPOCH_TTL = 86400  # Outlives every cache entry stamped with an epoch
+
+
+class TokenUserCache:
+    """
+    Bounded TTL/LRU cache mapping access tokens to the user they resolve to.
+
+    Entries hold a detached snapshot of the user row so a hit can be merged
+    into the caller's session without a database round-trip. Entries never
+    outlive the token's own expiry, and carry the user's epoch at load time
+    so callers can detect changes made through other workers.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: int = 60):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[User, Optional[str], str, float]]" = OrderedDict()
+
+    @staticmethod
+    def token_key(token: str) -> str:
+        """Hash a raw token so it is never held in memory as a cache key."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[Tuple[User, Optional[str], str]]:
+        """
+        Get cached user snapshot, token ID and user epoch for a token.
+
+        Args:
+            token: Raw access token
+
+        Returns:
+            Tuple of (detached user snapshot, jti, epoch) or None on miss/expiry
+        """
+        key = self.token_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        user, token_id, epoch, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return user, token_id, epoch
+
+    def set(
+        self,
+        token: str,
+        user: User,
+        token_id: Optional[str],
+        exp: Optional[float],
+        epoch: str
+    ) -> None:
+        """
+        Cache the user a token resolved to.
+
+        Args:
+            token: Raw access token
+            user: Loaded user
+            token_id: Token jti claim, used for blacklist checks on hits
+            exp: Token expiry as a UNIX timestamp
+            epoch: User epoch read before the user was loaded
+        """
+        expires_at = time.time() + self.ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+
+        key = self.token_key(token)
+        self._entries[key] = (_detached_snapshot(user), token_id, epoch, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, token: str) -> None:
+        """Drop the cached entry for a token (e.g. on logout)."""
+        self._entries.pop(self.token_key(token), None)
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        """Drop this process's cached entries for a user; see bump_user_epoch."""
+        stale = [key for key, (user, _, _, _) in self._entries.items() if user.id == user_id]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+class FailedLoginCache:
+    """
+    Bounded TTL cache of credential pairs that recently failed to log in.
+    
+    Lets repeated attempts with the same wrong credentials be rejected
+    without a database lookup or bcrypt check. Keys are HMACs under a
+    per-process secret, so attempted passwords are never held in memory.
+    """
+
+    def __init__(self, maxsize: int = 100_000, ttl_seconds: int = 30):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._secret = os.urandom(32)
+        self._entries: "OrderedDict[bytes, float]" = OrderedDict()
+
+    def credential_key(self, username: str, password: str) -> bytes:
+        """Derive the cache key for a username/password pair."""
+        return hmac.new(self._secret, f"{username}\0{password}".encode(), hashlib.sha256).digest()
+
+    def contains(self, username: str, password: str) -> bool:
+        """Check whether a credential pair failed within the TTL."""
+        key = self.credential_key(username, password)
+        expires_at = self._entries.get(key)
+        if expires_at is None:
+            return False
+
+        if expires_at <= time.time():
+            del self._entries[key]
+            return False
+        return True
+
+    def add(self, username: str, password: str) -> None:
+        """Record a failed credential pair."""
+        key = self.credential_key(username, password)
+        self._entries[key] = time.time() + self.ttl_seconds
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+def _detached_snapshot(user: User) -> User:
+    """Copy a user's column state into a detached instance safe to share."""
+    snapshot = User(**{
+        attr.key: getattr(user, attr.key)
+        for attr in inspect(User).column_attrs
+    })
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def user_epoch_key(user_id: uuid.UUID) -> str:
+    """Redis key holding a user's cache epoch."""
+    return USER_EPOCH_KEY.format(user_id=user_id)
+
+
+async def get_user_epoch(user_id: uuid.UUID) -> Optional[str]:
+    """
+    Read a user's current cache epoch.
+
+    Returns:
+        Optional[str]: Epoch, "0" if never bumped, or None if Redis is unavailable
+    """
+    from app.core.redis import get_redis
+
+    try:
+        redis = await get_redis()
+        return await redis.get(user_epoch_key(user_id)) or "0"
+    except Exception as e:
+        logger.warning(f"Error reading user cache epoch: {e}")
+        return None
+
+
+async def bump_user_epoch(user_id: uuid.UUID) -> None:
+    """
+    Invalidate cached token lookups for a user in every worker.
+
+    Call after changing anything a cached user snapshot carries, such as
+    role or active status.
+    """
+    from app.core.redis import get_redis
+
+    token_user_cache.invalidate_user(user_id)
+    try:
+        redis = await get_redis()
+        key = user_epoch_key(user_id)
+        pipe = redis.pipeline(transaction=False)
+        pipe.incr(key)
+        pipe.expire(key, USER_EPOCH_TTL)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Error bumping user cache epoch: {e}")
+
+
+# Global token cache
+token_user_cache = TokenUserCache(ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS)
+
+# Global failed login cache
+failed_login_cache = FailedLoginCache()
@@ -16,6 +16,15 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "postgresql+asyncpg://wiki:wiki@db:5432/wiki"
     DATABASE_POOL_SIZE: int = 10
     DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_STATEMENT_CACHE_SIZE: int = 256  # Set to 0 behind pgbouncer transaction pooling
+    
+    # Worker threads for blocking calls (bcrypt, file I/O) offloaded from the event loop
+    THREADPOOL_SIZE: int = 64
+    
+    # Server worker processes; per-process pools are sized to share the CPUs
+    WORKERS: int = 1
+    # Pillow processes per worker; 0 splits the CPUs evenly across WORKERS
+    IMAGE_POOL_SIZE: int = 0
     
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
@@ -24,10 +33,13 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = "jwt-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 30
+    AUTH_CACHE_TTL_SECONDS: int = 60  # Lifetime of cached token -> user lookups; user changes invalidate them via a Redis epoch
     
     # File Storage
     UPLOAD_DIR: str = "/app/uploads"
     MAX_FILE_SIZE: int = 104857600  # 100MB
+    USE_X_ACCEL_REDIRECT: bool = False  # Hand downloads to nginx instead of streaming them through the app
+    X_ACCEL_REDIRECT_PREFIX: str = "/_protected/"  # nginx internal location aliased to UPLOAD_DIR
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -1,12 +1,13 @@
 """
 Database connection management with SQLAlchemy and connection pooling.
 """
+import asyncio
 import logging
 import time
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
 from sqlalchemy import event
 from app.core.config import settings
 from app.core.logging import get_logger, DatabaseLogHandler
@@ -29,10 +30,11 @@ if settings.DEBUG:
         echo=True,  # Log SQL queries in debug mode
     )
 else:
-    # Production configuration with connection pooling
+    # Production configuration with connection pooling. The asyncio-adapted
+    # pool waits for free connections without blocking the event loop.
     engine = create_async_engine(
         settings.DATABASE_URL,
-        poolclass=QueuePool,
+        poolclass=AsyncAdaptedQueuePool,
         pool_size=settings.DATABASE_POOL_SIZE,
         max_overflow=settings.DATABASE_MAX_OVERFLOW,
         pool_pre_ping=True,
@@ -46,7 +48,8 @@ else:
                 "jit": "off",  # Disable JIT for faster connection times
             },
             "command_timeout": 60,
-            "prepared_statement_cache_size": 0,  # Disable prepared statement cache for better memory usage
+            # Reuse server-side prepared statements for repeated query shapes
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
         },
     )
 
@@ -60,6 +63,41 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Separate, tiny pool for health probes, so orchestrator and dashboard
+# polling can never take connections that requests are waiting for
+if settings.DEBUG:
+    health_engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=NullPool,
+    )
+else:
+    health_engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_timeout=5,     # Fail the probe fast rather than queue behind it
+        echo=False,
+        connect_args={
+            "server_settings": {
+                "application_name": "wiki_app_health",
+                "jit": "off",
+            },
+            "command_timeout": 5,
+        },
+    )
+
+HealthSessionLocal = async_sessionmaker(
+    health_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False,
+)
+
+
 # Database event listeners for comprehensive logging
 @event.listens_for(engine.sync_engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -196,6 +234,17 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_health_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a session from the health probe pool.
+    
+    Yields:
+        AsyncSession: Database session
+    """
+    async with HealthSessionLocal() as session:
+        yield session
+
+
 async def init_db() -> None:
     """Initialize database tables and optimizations."""
     try:
@@ -263,15 +312,73 @@ async def init_db() -> None:
             """)
             logger.info("Tag usage count triggers created")
             
+            # Create user document count update function and trigger
+            await conn.execute("""
+                CREATE OR REPLACE FUNCTION update_user_document_count()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    IF TG_OP = 'INSERT' THEN
+                        UPDATE users SET document_count = document_count + 1 WHERE id = NEW.author_id;
+                        RETURN NEW;
+                    ELSIF TG_OP = 'DELETE' THEN
+                        UPDATE users SET document_count = document_count - 1 WHERE id = OLD.author_id;
+                        RETURN OLD;
+                    ELSIF TG_OP = 'UPDATE' AND NEW.author_id IS DISTINCT FROM OLD.author_id THEN
+                        UPDATE users SET document_count = document_count - 1 WHERE id = OLD.author_id;
+                        UPDATE users SET document_count = document_count + 1 WHERE id = NEW.author_id;
+                        RETURN NEW;
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            
+            await conn.execute("""
+                DROP TRIGGER IF EXISTS update_user_document_count_trigger ON documents;
+                CREATE TRIGGER update_user_document_count_trigger
+                    AFTER INSERT OR DELETE OR UPDATE OF author_id ON documents
+                    FOR EACH ROW EXECUTE FUNCTION update_user_document_count();
+            """)
+            logger.info("User document count triggers created")
+            
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
 
 
+async def warm_db_pool() -> None:
+    """
+    Open the pool's steady-state connections at startup.
+    
+    The pool otherwise connects lazily, so the first requests after a deploy
+    would each pay the full connection handshake. Failures are logged and
+    left for the pool to retry on demand.
+    """
+    if isinstance(engine.pool, NullPool):
+        return
+    
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(settings.DATABASE_POOL_SIZE)),
+        return_exceptions=True
+    )
+    connections = [conn for conn in results if not isinstance(conn, BaseException)]
+    
+    # Closing returns each connection to the pool, where it stays open
+    for conn in connections:
+        await conn.close()
+    
+    failed = len(results) - len(connections)
+    if failed:
+        logger.warning(f"Database pool warm-up opened {len(connections)} connections, {failed} failed")
+    else:
+        logger.info(f"Database pool warmed with {len(connections)} connections")
+
+
 async def close_db() -> None:
     """Close database connections."""
     try:
         await engine.dispose()
+        await health_engine.dispose()
         logger.info("Database connections closed")
     except Exception as e:
         logger.error(f"Error closing database connections: {e}")
@@ -0,0 +1,81 @@
+"""
+Redis cache of serialized document responses.
+
+Entries are written by the document API and invalidated by the services
+that change documents, so every write path keeps the cache consistent.
+"""
+import logging
+import uuid
+from typing import Dict, Optional
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_CACHE_TTL = 60
+
+# Bumped by changes that touch many documents at once (folder moves, tag
+# renames); entries cached under an older generation are ignored
+DOCUMENT_CACHE_GENERATION_KEY = "document:generation"
+
+
+def document_cache_key(document_id: uuid.UUID) -> str:
+    """Redis key holding the cached response for a document."""
+    return f"document:{document_id}"
+
+
+async def get_cached_document(document_id: uuid.UUID) -> Optional[Dict[str, str]]:
+    """
+    Get a cached document entry (status, author_id, etag, body), if current.
+
+    The entry and the cache generation are read in one round trip.
+    """
+    try:
+        redis = await get_redis()
+        pipe = redis.pipeline(transaction=False)
+        pipe.hgetall(document_cache_key(document_id))
+        pipe.get(DOCUMENT_CACHE_GENERATION_KEY)
+        cached, generation = await pipe.execute()
+        if cached and cached.get("generation") == (generation or "0"):
+            return cached
+    except Exception as e:
+        logger.warning(f"Error reading cached document {document_id}: {e}")
+    return None
+
+
+async def cache_document(document, body: str, etag: str) -> None:
+    """Cache a serialized document with its ETag and the fields needed for visibility checks."""
+    cache_key = document_cache_key(document.id)
+    try:
+        redis = await get_redis()
+        generation = await redis.get(DOCUMENT_CACHE_GENERATION_KEY) or "0"
+        pipe = redis.pipeline()
+        pipe.hset(cache_key, mapping={
+            "status": document.status.value,
+            "author_id": str(document.author_id),
+            "etag": etag,
+            "body": body,
+            "generation": generation
+        })
+        pipe.expire(cache_key, DOCUMENT_CACHE_TTL)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Error caching document {document.id}: {e}")
+
+
+async def invalidate_cached_document(document_id: uuid.UUID) -> None:
+    """Drop the cached response for a document after it changes."""
+    try:
+        redis = await get_redis()
+        await redis.delete(document_cache_key(document_id))
+    except Exception as e:
+        logger.warning(f"Error invalidating cached document {document_id}: {e}")
+
+
+async def invalidate_all_cached_documents() -> None:
+    """Invalidate every cached document after a change spanning many of them."""
+    try:
+        redis = await get_redis()
+        await redis.incr(DOCUMENT_CACHE_GENERATION_KEY)
+    except Exception as e:
+        logger.warning(f"Error bumping document cache generation: {e}")
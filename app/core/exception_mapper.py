@@ -0,0 +1,45 @@
+"""
+Translation of service-layer exceptions into HTTP errors for API endpoints.
+"""
+from functools import wraps
+from typing import Callable, Dict, Type
+
+from fastapi import HTTPException, status
+
+from app.core.exceptions import (
+    ServiceException, NotFoundError, PermissionDeniedError, ValidationError,
+    DuplicateError, InternalError
+)
+
+# Status code per service exception type
+SERVICE_EXCEPTION_STATUS_CODES: Dict[Type[ServiceException], int] = {
+    NotFoundError: status.HTTP_404_NOT_FOUND,
+    PermissionDeniedError: status.HTTP_403_FORBIDDEN,
+    ValidationError: status.HTTP_400_BAD_REQUEST,
+    DuplicateError: status.HTTP_409_CONFLICT,
+    InternalError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+}
+
+_MAPPED_EXCEPTIONS = tuple(SERVICE_EXCEPTION_STATUS_CODES)
+
+
+def map_service_exceptions(func: Callable) -> Callable:
+    """
+    Decorator translating service exceptions raised by an endpoint into HTTPExceptions.
+
+    Apply below the router decorator so FastAPI still sees the endpoint's
+    signature through ``functools.wraps``.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except _MAPPED_EXCEPTIONS as e:
+            status_code = next(
+                SERVICE_EXCEPTION_STATUS_CODES[cls]
+                for cls in type(e).__mro__
+                if cls in SERVICE_EXCEPTION_STATUS_CODES
+            )
+            raise HTTPException(status_code=status_code, detail=e.message)
+
+    return wrapper
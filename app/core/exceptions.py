@@ -40,6 +40,14 @@ class DuplicateError(ServiceException):
         super().__init__(message, "DUPLICATE_ERROR")
 
 
+class ConflictError(DuplicateError):
+    """Exception raised when a change conflicts with an existing resource."""
+    
+    def __init__(self, message: str = "Resource conflict"):
+        super().__init__(message)
+        self.code = "CONFLICT_ERROR"
+
+
 class InternalError(ServiceException):
     """Exception raised for internal server errors."""
     
@@ -0,0 +1,53 @@
+"""
+Shared outbound HTTP client management.
+"""
+import logging
+from typing import Optional
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Global HTTP session, reused so outbound calls share pooled connections and DNS cache
+http_session: Optional[aiohttp.ClientSession] = None
+
+
+async def init_http_client() -> None:
+    """Initialize the shared HTTP session."""
+    global http_session
+    http_session = aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=30),
+        connector=aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=50,
+            ttl_dns_cache=300,
+        ),
+    )
+    logger.info("HTTP client session created")
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP session."""
+    global http_session
+    if http_session:
+        try:
+            await http_session.close()
+            logger.info("HTTP client session closed")
+        except Exception as e:
+            logger.error(f"Error closing HTTP client session: {e}")
+        finally:
+            http_session = None
+
+
+def get_http_client() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session.
+
+    Returns:
+        aiohttp.ClientSession: Shared session
+
+    Raises:
+        RuntimeError: If the session is not initialized
+    """
+    if http_session is None:
+        raise RuntimeError("HTTP client not initialized. Call init_http_client() first.")
+    return http_session
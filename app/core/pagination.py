@@ -0,0 +1,46 @@
+"""
+Keyset (cursor) pagination helpers.
+"""
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: datetime, row_id: uuid.UUID) -> str:
+    """
+    Encode the keyset position of a row as an opaque, URL-safe cursor.
+
+    Args:
+        sort_value: Timestamp the listing is ordered by
+        row_id: Row ID used as the tie-breaker
+
+    Returns:
+        str: Cursor string
+    """
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple[datetime, uuid.UUID]: Sort value and row ID
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    return datetime.fromisoformat(sort_value), uuid.UUID(row_id)
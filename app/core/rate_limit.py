@@ -3,18 +3,40 @@ Rate limiting middleware and decorators.
 """
 import logging
 from typing import Optional, Dict, Any, Callable
-from functools import wraps
+from functools import lru_cache, wraps
 from fastapi import Request, HTTPException, status, Depends
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
+from jose import jwt
 
+from app.core.config import settings
 from app.core.security import rate_limit_service
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _token_subject(token: str) -> Optional[str]:
+    """
+    Get the user ID a bearer token was issued for, for rate limit keys.
+    
+    Expiry is deliberately not verified, so the result depends only on the
+    token and is safe to memoize for the life of the process.
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            settings.JWT_SECRET_KEY,
+            algorithms=[settings.JWT_ALGORITHM],
+            options={"verify_exp": False}
+        )
+    except Exception:
+        return None
+    return payload.get("sub")
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Global rate limiting middleware."""
     
@@ -75,22 +97,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Try to get user ID from token if available
         auth_header = request.headers.get("Authorization")
         if auth_header and auth_header.startswith("Bearer "):
-            try:
-                from jose import jwt
-                from app.core.config import settings
-                
-                token = auth_header.split(" ")[1]
-                payload = jwt.decode(
-                    token,
-                    settings.JWT_SECRET_KEY,
-                    algorithms=[settings.JWT_ALGORITHM],
-                    options={"verify_exp": False}  # Don't verify expiration for rate limiting
-                )
-                user_id = payload.get("sub")
-                if user_id:
-                    return f"user:{user_id}"
-            except Exception:
-                pass
+            user_id = _token_subject(auth_header[7:])
+            if user_id:
+                return f"user:{user_id}"
         
         # Fall back to IP address
         client_ip = request.client.host if request.client else "unknown"
@@ -288,22 +297,9 @@ def _get_client_id_from_request(request: Request) -> str:
     # Try to get user ID from token if available
     auth_header = request.headers.get("Authorization")
     if auth_header and auth_header.startswith("Bearer "):
-        try:
-            from jose import jwt
-            from app.core.config import settings
-            
-            token = auth_header.split(" ")[1]
-            payload = jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM],
-                options={"verify_exp": False}
-            )
-            user_id = payload.get("sub")
-            if user_id:
-                return f"user:{user_id}"
-        except Exception:
-            pass
+        user_id = _token_subject(auth_header[7:])
+        if user_id:
+            return f"user:{user_id}"
     
     # Fall back to IP address
     client_ip = request.client.host if request.client else "unknown"
@@ -25,6 +25,9 @@ async def init_redis() -> None:
             retry_on_timeout=True,
             socket_keepalive=True,
             socket_keepalive_options={},
+            # Re-validate connections idle this long before reuse, so a pooled
+            # connection dropped by the server fails over instead of erroring
+            health_check_interval=30,
         )
         
         # Test connection
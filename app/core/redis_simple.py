@@ -18,7 +18,10 @@ async def init_redis() -> None:
         redis_client = redis.from_url(
             settings.REDIS_URL,
             encoding="utf-8",
-            decode_responses=True
+            decode_responses=True,
+            max_connections=20,
+            socket_keepalive=True,
+            health_check_interval=30,
         )
         
         # Test connection
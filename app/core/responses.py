@@ -0,0 +1,24 @@
+"""
+JSON responses for endpoints that serialize rows directly instead of
+through a response_model.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+# ORJSONResponse's options plus OPT_UTC_Z, so UTC datetimes end in "Z"
+# exactly as pydantic writes them for response_model endpoints
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+
+def orjson_dumps(content: Any) -> bytes:
+    """Serialize content with orjson, writing datetimes as pydantic does."""
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class UTCZJSONResponse(ORJSONResponse):
+    """ORJSONResponse writing UTC datetimes with a "Z" suffix."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
@@ -57,6 +57,9 @@ SUSPICIOUS_PATTERNS = [
     r'delete\s+from',  # SQL injection
 ]
 
+# Compiled once; URL checks run per request and upload scans per file
+SUSPICIOUS_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in SUSPICIOUS_PATTERNS]
+
 
 class SecurityMiddleware(BaseHTTPMiddleware):
     """Security middleware for headers and basic protection."""
@@ -95,8 +98,8 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         try:
             decoded_url = unquote(url)
             
-            for pattern in SUSPICIOUS_PATTERNS:
-                if re.search(pattern, decoded_url, re.IGNORECASE):
+            for regex in SUSPICIOUS_REGEXES:
+                if regex.search(decoded_url):
                     return True
             
             return False
@@ -299,8 +302,8 @@ class InputValidator:
             
             # Check for suspicious patterns
             threats = []
-            for i, pattern in enumerate(SUSPICIOUS_PATTERNS):
-                if re.search(pattern, content_str, re.IGNORECASE):
+            for i, regex in enumerate(SUSPICIOUS_REGEXES):
+                if regex.search(content_str):
                     threats.append(f"Suspicious pattern {i+1} detected")
             
             # Check for executable file extensions
@@ -377,6 +380,19 @@ class InputValidator:
         return hashlib.sha256(file_content).hexdigest()
 
 
+# Fixed-window counter: count the request, start the expiry clock on the
+# window's first request, and report the count and remaining TTL
+RATE_LIMIT_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+local ttl = redis.call('TTL', KEYS[1])
+if ttl < 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+    ttl = tonumber(ARGV[1])
+end
+return {count, ttl}
+"""
+
+
 class RateLimitService:
     """Rate limiting service using Redis."""
     
@@ -387,6 +403,14 @@ class RateLimitService:
             "upload": {"requests": 10, "window": 300}, # 10 uploads per 5 minutes
             "search": {"requests": 200, "window": 60}, # 200 searches per minute
         }
+        self._script = None
+    
+    def _rate_limit_script(self, redis):
+        """Get the rate limit script bound to the current Redis client."""
+        if self._script is None or self._script.registered_client is not redis:
+            # Invoked via EVALSHA, falling back to EVAL once if the server lost the script
+            self._script = redis.register_script(RATE_LIMIT_SCRIPT)
+        return self._script
     
     async def check_rate_limit(
         self, 
@@ -422,36 +446,22 @@ class RateLimitService:
             # Create Redis key
             redis_key = f"rate_limit:{limit_type}:{key}"
             
-            # Get current count
-            current_count = await redis.get(redis_key)
-            
-            if current_count is None:
-                # First request in window
-                await redis.setex(redis_key, window_seconds, 1)
-                return {
-                    "allowed": True,
-                    "requests_remaining": requests_limit - 1,
-                    "reset_time": window_seconds
-                }
-            
-            current_count = int(current_count)
+            # Count, start the window and read its TTL in one atomic round trip
+            script = self._rate_limit_script(redis)
+            current_count, ttl = await script(keys=[redis_key], args=[window_seconds])
             
-            if current_count >= requests_limit:
+            if current_count > requests_limit:
                 # Rate limit exceeded
-                ttl = await redis.ttl(redis_key)
                 return {
                     "allowed": False,
                     "requests_remaining": 0,
-                    "reset_time": ttl if ttl > 0 else window_seconds
+                    "reset_time": ttl
                 }
             
-            # Increment counter
-            await redis.incr(redis_key)
-            
             return {
                 "allowed": True,
-                "requests_remaining": requests_limit - current_count - 1,
-                "reset_time": await redis.ttl(redis_key)
+                "requests_remaining": requests_limit - current_count,
+                "reset_time": ttl
             }
             
         except Exception as e:
@@ -3,16 +3,19 @@ Main FastAPI application entry point.
 """
 import asyncio
 from contextlib import asynccontextmanager
+import anyio.to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
-from app.core.database import init_db, close_db
+from app.core.database import init_db, warm_db_pool, close_db
 from app.core.redis import init_redis, close_redis
+from app.core.http_client import init_http_client, close_http_client
 from app.core.logging import setup_logging, set_correlation_id, get_logger
 from app.core.security import SecurityMiddleware
 from app.core.rate_limit import RateLimitMiddleware
@@ -32,6 +35,7 @@ from app.api.tags import router as tags_router
 from app.api.developer import router as developer_router
 from app.api.templates import router as templates_router
 from app.api.web import router as web_router
+from app.services.file import init_upload_dir, init_image_pool, close_image_pool
 
 # Setup logging
 setup_logging()
@@ -48,14 +52,24 @@ async def lifespan(app: FastAPI):
     await logger.ainfo("Starting Wiki Documentation App")
     
     try:
+        # Size the threadpool used by run_in_threadpool / sync dependencies
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+        
         # Initialize Redis
         await init_redis()
         await logger.ainfo("Redis initialized successfully")
         
+        # Initialize shared outbound HTTP client
+        await init_http_client()
+        
         # Initialize database
         await init_db()
+        await warm_db_pool()
         await logger.ainfo("Database initialized successfully")
         
+        init_upload_dir()
+        init_image_pool()
+        
         await logger.ainfo("Application startup completed")
         
     except Exception as e:
@@ -70,6 +84,8 @@ async def lifespan(app: FastAPI):
     try:
         await close_db()
         await close_redis()
+        await close_http_client()
+        close_image_pool()
         await logger.ainfo("Application shutdown completed")
         
     except Exception as e:
@@ -85,6 +101,7 @@ def create_app() -> FastAPI:
         docs_url="/api/docs" if settings.DEBUG else None,
         redoc_url="/api/redoc" if settings.DEBUG else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # Add logging middleware (first for comprehensive logging)
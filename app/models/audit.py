@@ -4,7 +4,7 @@ Audit models for security and compliance tracking.
 import uuid
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import String, Text, DateTime, ForeignKey, Enum, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB, INET
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -81,8 +81,7 @@ class AuditLog(Base):
     # Audit information
     action: Mapped[AuditAction] = mapped_column(
         Enum(AuditAction), 
-        nullable=False,
-        index=True
+        nullable=False
     )
     severity: Mapped[AuditSeverity] = mapped_column(
         Enum(AuditSeverity), 
@@ -95,8 +94,7 @@ class AuditLog(Base):
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("users.id"), 
-        nullable=True,
-        index=True
+        nullable=True
     )
     session_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
@@ -105,7 +103,7 @@ class AuditLog(Base):
     user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Resource information
-    resource_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
+    resource_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     resource_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     resource_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
@@ -131,6 +129,13 @@ class AuditLog(Base):
     # Relationships
     user: Mapped[Optional["User"]] = relationship("User")
     
+    # Indexes
+    __table_args__ = (
+        Index('idx_audit_logs_user_created_desc', 'user_id', text('created_at DESC')),
+        Index('idx_audit_logs_action_created', 'action', text('created_at DESC')),
+        Index('idx_audit_logs_resource_created', 'resource_type', text('created_at DESC')),
+    )
+    
     def __repr__(self) -> str:
         return f"<AuditLog(id={self.id}, action='{self.action}', user_id={self.user_id})>"
 
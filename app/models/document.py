@@ -58,16 +58,14 @@ class Document(Base):
     # Status and visibility
     status: Mapped[DocumentStatus] = mapped_column(
         Enum(DocumentStatus), 
-        default=DocumentStatus.DRAFT,
-        index=True
+        default=DocumentStatus.DRAFT
     )
     
     # Author relationship
     author_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("users.id"), 
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Timestamps
@@ -3,7 +3,7 @@ Simple document model for the wiki application.
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, Boolean
+from sqlalchemy import Column, String, Text, DateTime, Boolean, Index, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database_simple import Base
 
@@ -36,4 +36,19 @@ class Document(Base):
             "is_published": self.is_published,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
\ No newline at end of file
+        }
+
+
+# Full-text search vector over title and content. Queries must use this exact
+# expression, with constants inlined rather than bound, for the planner to
+# match it against idx_documents_fts.
+search_vector = func.to_tsvector(
+    literal_column("'english'::regconfig"),
+    func.coalesce(Document.title, literal_column("''"))
+    .concat(literal_column("' '"))
+    .concat(func.coalesce(Document.content, literal_column("''")))
+)
+
+Document.__table__.append_constraint(
+    Index("idx_documents_fts", search_vector, postgresql_using="gin")
+)
@@ -55,9 +55,19 @@ class File(Base):
     )  # Optional association with document
     
     # Security and audit fields
-    is_malware_scanned: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_malware_scanned: Mapped[bool] = mapped_column(
+        Boolean, 
+        nullable=False, 
+        default=False,
+        server_default="false"
+    )
     malware_scan_result: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    access_count: Mapped[int] = mapped_column(Integer, default=0)
+    access_count: Mapped[int] = mapped_column(
+        Integer, 
+        nullable=False, 
+        default=0,
+        server_default="0"
+    )
     last_accessed_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), 
         nullable=True
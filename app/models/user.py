@@ -4,7 +4,7 @@ User model for authentication and authorization.
 import uuid
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Boolean, DateTime, Enum, Text
+from sqlalchemy import String, Boolean, DateTime, Enum, Text, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -64,6 +64,14 @@ class User(Base):
     mfa_enabled: Mapped[bool] = mapped_column(Boolean, default=False)
     mfa_secret: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
     
+    # Denormalized document counter (maintained by trigger on documents)
+    document_count: Mapped[int] = mapped_column(
+        Integer, 
+        nullable=False, 
+        default=0,
+        server_default="0"
+    )
+    
     # User preferences
     theme_preference: Mapped[ThemeType] = mapped_column(
         Enum(ThemeType), 
@@ -173,13 +173,13 @@ class DocumentMoveRequest(BaseModel):
 
 class DocumentRevisionResponse(BaseModel):
     """Schema for document revision response."""
-    id: str
-    document_id: str
+    id: uuid.UUID
+    document_id: uuid.UUID
     revision_number: int
     title: str
     content: str
     change_summary: Optional[str] = None
-    author_id: str
+    author_id: uuid.UUID
     author_username: str
     created_at: datetime
     
@@ -189,12 +189,12 @@ class DocumentRevisionResponse(BaseModel):
 
 class DocumentRevisionListResponse(BaseModel):
     """Schema for document revision list response."""
-    id: str
-    document_id: str
+    id: uuid.UUID
+    document_id: uuid.UUID
     revision_number: int
     title: str
     change_summary: Optional[str] = None
-    author_id: str
+    author_id: uuid.UUID
     author_username: str
     created_at: datetime
     
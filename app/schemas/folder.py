@@ -2,8 +2,10 @@
 Folder schemas for API requests and responses.
 """
 import re
+import uuid
+from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_serializer, validator
 
 
 class FolderCreate(BaseModel):
@@ -76,27 +78,37 @@ class FolderMoveRequest(BaseModel):
 
 class FolderTreeNode(BaseModel):
     """Schema for folder tree node."""
-    id: str
+    id: uuid.UUID
     name: str
     path: str
     parent_path: Optional[str] = None
     description: Optional[str] = None
-    created_by_id: str
-    created_at: str
+    created_by_id: uuid.UUID
+    created_at: datetime
     children: List['FolderTreeNode'] = []
     document_count: int = 0
+    
+    @field_serializer('created_at')
+    def serialize_created_at(self, value: datetime) -> str:
+        """Keep the isoformat() timestamps clients received before."""
+        return value.isoformat()
 
 
 class FolderListResponse(BaseModel):
     """Schema for folder list response."""
-    id: str
+    id: uuid.UUID
     name: str
     path: str
     parent_path: Optional[str] = None
     description: Optional[str] = None
-    created_by_id: str
-    created_at: str
+    created_by_id: uuid.UUID
+    created_at: datetime
     document_count: int = 0
+    
+    @field_serializer('created_at')
+    def serialize_created_at(self, value: datetime) -> str:
+        """Keep the isoformat() timestamps clients received before."""
+        return value.isoformat()
 
 
 # Enable forward references for recursive model
@@ -11,7 +11,7 @@ from app.models.document import DocumentStatus, ContentFormat
 
 class TagResponse(BaseModel):
     """Schema for tag response."""
-    id: str
+    id: uuid.UUID
     name: str
     description: Optional[str] = None
     color: Optional[str] = None
@@ -23,14 +23,14 @@ class TagResponse(BaseModel):
 
 class DocumentResponse(BaseModel):
     """Schema for document response."""
-    id: str
+    id: uuid.UUID
     title: str
     slug: str
     content: str
     content_type: ContentFormat
     folder_path: str
     status: DocumentStatus
-    author_id: str
+    author_id: uuid.UUID
     created_at: datetime
     updated_at: datetime
     published_at: Optional[datetime] = None
@@ -42,12 +42,12 @@ class DocumentResponse(BaseModel):
 
 class DocumentListResponse(BaseModel):
     """Schema for document list response."""
-    id: str
+    id: uuid.UUID
     title: str
     slug: str
     folder_path: str
     status: DocumentStatus
-    author_id: str
+    author_id: uuid.UUID
     created_at: datetime
     updated_at: datetime
     published_at: Optional[datetime] = None
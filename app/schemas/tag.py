@@ -12,7 +12,7 @@ class TagBase(BaseModel):
     """Base tag schema with common fields."""
     name: str = Field(..., min_length=1, max_length=50, description="Tag name")
     description: Optional[str] = Field(None, max_length=500, description="Tag description")
-    color: Optional[str] = Field(None, regex=r"^#[0-9A-Fa-f]{6}$", description="Hex color code")
+    color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$", description="Hex color code")
     
     @validator('name')
     def validate_name(cls, v):
@@ -39,7 +39,7 @@ class TagUpdate(BaseModel):
     """Schema for updating an existing tag."""
     name: Optional[str] = Field(None, min_length=1, max_length=50)
     description: Optional[str] = Field(None, max_length=500)
-    color: Optional[str] = Field(None, regex=r"^#[0-9A-Fa-f]{6}$")
+    color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
     
     @validator('name')
     def validate_name(cls, v):
@@ -4,7 +4,8 @@ Authentication service for JWT-based authentication with Redis session managemen
 import logging
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+from fastapi.concurrency import run_in_threadpool
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +13,7 @@ from sqlalchemy import select
 from aioredis import Redis
 
 from app.core.config import settings
+from app.core.auth_cache import token_user_cache, get_user_epoch, user_epoch_key
 from app.core.redis import get_redis
 from app.models.user import User, UserRole
 from app.services.audit import AuditService
@@ -98,7 +100,8 @@ class AuthenticationService:
                 logger.warning(f"Authentication failed: User account disabled for username: {username}")
                 return None
             
-            if not self.verify_password(password, user.password_hash):
+            # bcrypt is deliberately slow; keep it off the event loop
+            if not await run_in_threadpool(self.verify_password, password, user.password_hash):
                 logger.warning(f"Authentication failed: Invalid password for username: {username}")
                 await self.audit_service.log_authentication_failure(
                     username=username,
@@ -247,14 +250,36 @@ class AuthenticationService:
             AuthorizationError: If user is not found or inactive
         """
         try:
+            # Serve repeat requests for the same token without decoding it or
+            # reloading the user; the blacklist and the user's epoch are
+            # rechecked in one Redis round trip
+            cached = token_user_cache.get(token)
+            if cached is not None:
+                cached_user, token_id, epoch = cached
+                blacklisted, current_epoch = await self._cached_token_state(
+                    token_id, cached_user.id
+                )
+                if blacklisted:
+                    token_user_cache.pop(token)
+                    raise TokenBlacklistError("Token has been blacklisted")
+                if current_epoch == epoch and cached_user.is_active:
+                    return await self.db.merge(cached_user, load=False)
+                # Changed through another worker, or unverifiable; reload
+                token_user_cache.pop(token)
+            
             payload = await self.verify_token(token)
             user_id = payload.get("sub")
             
             if not user_id:
                 raise AuthenticationError("Token missing user ID")
+            user_id = uuid.UUID(user_id)
+            
+            # Read the epoch before the row, so a concurrent change is never
+            # cached under its new epoch with the old data
+            epoch = await get_user_epoch(user_id)
             
             # Get user from database
-            stmt = select(User).where(User.id == uuid.UUID(user_id))
+            stmt = select(User).where(User.id == user_id)
             result = await self.db.execute(stmt)
             user = result.scalar_one_or_none()
             
@@ -264,9 +289,11 @@ class AuthenticationService:
             if not user.is_active:
                 raise AuthorizationError("User account is disabled")
             
+            if epoch is not None:
+                token_user_cache.set(token, user, payload.get("jti"), payload.get("exp"), epoch)
             return user
             
-        except (AuthenticationError, AuthorizationError):
+        except (AuthenticationError, AuthorizationError, TokenBlacklistError):
             raise
         except Exception as e:
             logger.error(f"Error getting current user: {e}")
@@ -307,6 +334,7 @@ class AuthenticationService:
             redis = await get_redis()
             blacklist_key = f"blacklist:token:{token_id}"
             await redis.setex(blacklist_key, ttl, "blacklisted")
+            token_user_cache.pop(token)
             
             logger.info(f"Token blacklisted: {token_id}")
             return True
@@ -333,6 +361,33 @@ class AuthenticationService:
             logger.error(f"Error checking token blacklist: {e}")
             return False
     
+    async def _cached_token_state(
+        self,
+        token_id: Optional[str],
+        user_id: uuid.UUID
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Check a cached token's blacklist entry and its user's current epoch.
+        
+        Args:
+            token_id: JWT token ID (jti claim)
+            user_id: User the token resolved to
+            
+        Returns:
+            Tuple of (blacklisted, epoch); epoch is None if Redis is unavailable
+        """
+        try:
+            redis = await get_redis()
+            blacklist_key = f"blacklist:token:{token_id}" if token_id else None
+            if blacklist_key:
+                blacklisted, epoch = await redis.mget(blacklist_key, user_epoch_key(user_id))
+            else:
+                blacklisted, epoch = None, await redis.get(user_epoch_key(user_id))
+            return blacklisted is not None, epoch or "0"
+        except Exception as e:
+            logger.error(f"Error checking cached token state: {e}")
+            return False, None
+    
     async def refresh_access_token(self, refresh_token: str) -> Optional[str]:
         """
         Create new access token from refresh token.
@@ -8,12 +8,12 @@ from typing import List, Optional, Dict, Any, Set
 from datetime import datetime
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-import aiohttp
 import base64
 
 from app.models.user import User
 from app.models.document import Document
 from app.core.exceptions import NotFoundError, ValidationError, InternalError
+from app.core.http_client import get_http_client
 from app.services.document import DocumentService
 from app.services.auth import AuthService
 
@@ -425,28 +425,28 @@ class AzureDevOpsIntegrationService:
             "Accept": "application/json"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 404:
-                    raise NotFoundError(f"Azure DevOps work item #{work_item_id} not found")
-                elif response.status != 200:
-                    raise InternalError(f"Azure DevOps API error: {response.status}")
-                
-                data = await response.json()
-                fields = data.get("fields", {})
-                
-                return AzureWorkItem(
-                    id=data["id"],
-                    title=fields.get("System.Title", ""),
-                    work_item_type=fields.get("System.WorkItemType", ""),
-                    state=fields.get("System.State", ""),
-                    url=data.get("url", ""),
-                    description=fields.get("System.Description", ""),
-                    tags=fields.get("System.Tags", "").split(";") if fields.get("System.Tags") else [],
-                    assigned_to=fields.get("System.AssignedTo", {}).get("displayName", "") if fields.get("System.AssignedTo") else None,
-                    created_date=self._parse_timestamp(fields.get("System.CreatedDate")),
-                    changed_date=self._parse_timestamp(fields.get("System.ChangedDate"))
-                )
+        session = get_http_client()
+        async with session.get(url, headers=headers) as response:
+            if response.status == 404:
+                raise NotFoundError(f"Azure DevOps work item #{work_item_id} not found")
+            elif response.status != 200:
+                raise InternalError(f"Azure DevOps API error: {response.status}")
+            
+            data = await response.json()
+            fields = data.get("fields", {})
+            
+            return AzureWorkItem(
+                id=data["id"],
+                title=fields.get("System.Title", ""),
+                work_item_type=fields.get("System.WorkItemType", ""),
+                state=fields.get("System.State", ""),
+                url=data.get("url", ""),
+                description=fields.get("System.Description", ""),
+                tags=fields.get("System.Tags", "").split(";") if fields.get("System.Tags") else [],
+                assigned_to=fields.get("System.AssignedTo", {}).get("displayName", "") if fields.get("System.AssignedTo") else None,
+                created_date=self._parse_timestamp(fields.get("System.CreatedDate")),
+                changed_date=self._parse_timestamp(fields.get("System.ChangedDate"))
+            )
     
     async def _fetch_project_team_members(self, project_name: str) -> List[str]:
         """Fetch project team members from Azure DevOps API."""
@@ -466,16 +466,16 @@ class AzureDevOpsIntegrationService:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # This is a simplified implementation
-                        # In practice, you'd need to fetch team members for each team
-                        return []
-                    else:
-                        logger.warning(f"Failed to fetch team members for {project_name}: {response.status}")
-                        return []
+            session = get_http_client()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    # This is a simplified implementation
+                    # In practice, you'd need to fetch team members for each team
+                    return []
+                else:
+                    logger.warning(f"Failed to fetch team members for {project_name}: {response.status}")
+                    return []
         except Exception as e:
             logger.error(f"Error fetching project team members: {e}")
             return []
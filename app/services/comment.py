@@ -3,10 +3,11 @@ Comment service for document discussions.
 """
 import uuid
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.comment import Comment
 from app.models.document import Document
@@ -111,6 +112,30 @@ class CommentService:
             logger.error(f"Error getting comment {comment_id}: {e}")
             raise InternalError("Failed to retrieve comment")
     
+    async def check_document_access(self, document_id: uuid.UUID, user: User) -> Document:
+        """
+        Check that a user can read a document's comments.
+        
+        Args:
+            document_id: Document ID
+            user: User requesting access
+            
+        Returns:
+            Document instance
+            
+        Raises:
+            NotFoundError: If document not found
+            PermissionDeniedError: If user lacks permission
+            InternalError: If the check fails
+        """
+        try:
+            return await self._get_document_with_permission_check(document_id, user)
+        except (NotFoundError, PermissionDeniedError):
+            raise
+        except Exception as e:
+            logger.error(f"Error checking access to document {document_id}: {e}")
+            raise InternalError("Failed to check document access")
+    
     async def list_document_comments(
         self, 
         document_id: uuid.UUID, 
@@ -164,9 +189,10 @@ class CommentService:
                 result = await self.db.execute(stmt)
                 comments = result.scalars().all()
                 
-                # Add reply counts
+                # Add reply counts with a single grouped query
+                reply_counts = await self._get_reply_counts([comment.id for comment in comments])
                 for comment in comments:
-                    comment.reply_count = await self._get_reply_count(comment.id)
+                    comment.reply_count = reply_counts.get(comment.id, 0)
                 
                 return list(comments)
             
@@ -226,7 +252,7 @@ class CommentService:
             logger.error(f"Error updating comment {comment_id}: {e}")
             raise InternalError("Failed to update comment")
     
-    async def delete_comment(self, comment_id: uuid.UUID, user: User) -> None:
+    async def delete_comment(self, comment_id: uuid.UUID, user: User) -> Comment:
         """
         Delete a comment (soft delete).
         
@@ -234,6 +260,9 @@ class CommentService:
             comment_id: Comment ID
             user: User performing the deletion
             
+        Returns:
+            Deleted comment
+            
         Raises:
             NotFoundError: If comment not found
             PermissionDeniedError: If user lacks permission
@@ -256,6 +285,7 @@ class CommentService:
             await self.db.commit()
             
             logger.info(f"Deleted comment {comment_id} by user {user.username}")
+            return comment
             
         except (NotFoundError, PermissionDeniedError):
             await self.db.rollback()
@@ -321,37 +351,41 @@ class CommentService:
         result = await self.db.execute(stmt)
         all_comments = result.scalars().all()
         
-        # Build comment map
-        comment_map = {comment.id: comment for comment in all_comments}
-        
-        # Build nested structure
+        # Group comments by parent
+        children = {comment.id: [] for comment in all_comments}
         root_comments = []
         for comment in all_comments:
-            comment.replies = []
-            comment.reply_count = 0
-            
             if comment.parent_id is None:
                 root_comments.append(comment)
-            elif comment.parent_id in comment_map:
-                parent = comment_map[comment.parent_id]
-                parent.replies.append(comment)
-                parent.reply_count += 1
+            elif comment.parent_id in children:
+                children[comment.parent_id].append(comment)
+        
+        # Attach replies as already-loaded state, so the relationship is
+        # neither lazy-loaded nor marked as modified
+        for comment in all_comments:
+            replies = children[comment.id]
+            set_committed_value(comment, 'replies', replies)
+            comment.reply_count = len(replies)
         
         # Apply pagination to root comments only
         paginated_roots = root_comments[offset:offset + limit]
         
         return paginated_roots
     
-    async def _get_reply_count(self, comment_id: uuid.UUID) -> int:
-        """Get count of replies for a comment."""
+    async def _get_reply_counts(self, comment_ids: List[uuid.UUID]) -> Dict[uuid.UUID, int]:
+        """Get counts of replies for several comments, keyed by comment ID."""
+        if not comment_ids:
+            return {}
+        
         stmt = (
-            select(func.count(Comment.id))
+            select(Comment.parent_id, func.count(Comment.id))
             .where(
                 and_(
-                    Comment.parent_id == comment_id,
+                    Comment.parent_id.in_(comment_ids),
                     Comment.is_deleted == False
                 )
             )
+            .group_by(Comment.parent_id)
         )
         result = await self.db.execute(stmt)
-        return result.scalar() or 0
\ No newline at end of file
+        return dict(result.all())
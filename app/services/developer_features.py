@@ -1,6 +1,7 @@
 """
 Developer-focused documentation features service.
 """
+import asyncio
 import uuid
 import logging
 import re
@@ -8,7 +9,8 @@ import json
 import subprocess
 import tempfile
 import os
-from typing import List, Optional, Dict, Any, Set
+import time
+from typing import List, Optional, Dict, Any, Set, Tuple, ClassVar, FrozenSet
 from datetime import datetime
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,13 +19,44 @@ import aiohttp
 from app.models.user import User
 from app.models.document import Document
 from app.core.exceptions import NotFoundError, ValidationError, InternalError
+from app.core.http_client import get_http_client
 from app.services.document import DocumentService
 
 logger = logging.getLogger(__name__)
 
 
+# Repository metadata rarely changes within minutes, and provider APIs are rate limited
+REPOSITORY_INFO_CACHE_TTL = 120
+REPOSITORY_INFO_CACHE_SIZE = 2048
+
+_repository_info_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+_repository_info_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+
+def _get_cached_repository_info(key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """Get a copy of cached repository info, if present and fresh."""
+    entry = _repository_info_cache.get(key)
+    if entry is None:
+        return None
+    
+    expires_at, info = entry
+    if expires_at <= time.monotonic():
+        _repository_info_cache.pop(key, None)
+        return None
+    return dict(info)
+
+
+def _cache_repository_info(key: Tuple[str, str], info: Dict[str, Any]) -> None:
+    """Cache repository info, evicting the oldest entry when full."""
+    if len(_repository_info_cache) >= REPOSITORY_INFO_CACHE_SIZE:
+        _repository_info_cache.pop(next(iter(_repository_info_cache)), None)
+    _repository_info_cache[key] = (time.monotonic() + REPOSITORY_INFO_CACHE_TTL, dict(info))
+
+
 class CodeBlock:
     """Represents a code block with syntax highlighting and execution capabilities."""
+    __slots__ = ('language', 'code', 'line_numbers', 'executable', 'filename')
+    
     def __init__(self, language: str, code: str, line_numbers: bool = True,
                  executable: bool = False, filename: Optional[str] = None):
         self.language = language
@@ -35,6 +68,8 @@ class CodeBlock:
 
 class APIExample:
     """Represents a live API example with try-it functionality."""
+    __slots__ = ('method', 'url', 'headers', 'body', 'description', 'expected_response')
+    
     def __init__(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
                  body: Optional[str] = None, description: Optional[str] = None,
                  expected_response: Optional[str] = None):
@@ -48,6 +83,8 @@ class APIExample:
 
 class RepositoryInfo:
     """Repository information for documentation linking."""
+    __slots__ = ('url', 'branch', 'path', 'start_line', 'end_line')
+    
     def __init__(self, url: str, branch: str = "main", path: Optional[str] = None,
                  start_line: Optional[int] = None, end_line: Optional[int] = None):
         self.url = url
@@ -61,7 +98,7 @@ class DeveloperFeaturesService:
     """Service for developer-focused documentation features."""
     
     # Supported languages for syntax highlighting (100+ languages)
-    SUPPORTED_LANGUAGES = {
+    SUPPORTED_LANGUAGES: ClassVar[FrozenSet[str]] = frozenset({
         # Programming languages
         'python', 'javascript', 'typescript', 'java', 'csharp', 'cpp', 'c', 'go', 'rust',
         'php', 'ruby', 'swift', 'kotlin', 'scala', 'clojure', 'haskell', 'erlang', 'elixir',
@@ -108,16 +145,27 @@ class DeveloperFeaturesService:
         'ada', 'algol', 'apl', 'basic', 'crystal', 'd', 'factor', 'forth', 'groovy',
         'hack', 'idris', 'j', 'nim', 'ocaml', 'oz', 'pony', 'purescript', 'racket',
         'reason', 'red', 'rescript', 'solidity', 'zig'
-    }
+    })
     
     # Safe languages for code execution
-    SAFE_EXECUTABLE_LANGUAGES = {
+    SAFE_EXECUTABLE_LANGUAGES: ClassVar[FrozenSet[str]] = frozenset({
         'javascript', 'python', 'sql', 'json', 'yaml', 'markdown', 'html', 'css'
-    }
+    })
+    
+    # Fenced markdown code blocks, compiled once
+    CODE_BLOCK_PATTERN = re.compile(r'```(\w+)?\n(.*?)\n```', re.DOTALL)
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, http_session: Optional[aiohttp.ClientSession] = None):
         self.db = db
         self.document_service = DocumentService(db)
+        self._http_session = http_session
+    
+    @property
+    def http_session(self) -> aiohttp.ClientSession:
+        """Outbound HTTP session, defaulting to the application-wide shared one."""
+        if self._http_session is None:
+            self._http_session = get_http_client()
+        return self._http_session
     
     async def process_code_blocks(self, content: str) -> str:
         """
@@ -130,9 +178,6 @@ class DeveloperFeaturesService:
             Processed content with enhanced code blocks
         """
         try:
-            # Find all code blocks in the content
-            code_block_pattern = r'```(\w+)?\n(.*?)\n```'
-            
             def replace_code_block(match):
                 language = match.group(1) or 'text'
                 code = match.group(2)
@@ -148,7 +193,7 @@ class DeveloperFeaturesService:
                 return self._render_code_block(code_block)
             
             # Replace all code blocks
-            processed_content = re.sub(code_block_pattern, replace_code_block, content, flags=re.DOTALL)
+            processed_content = self.CODE_BLOCK_PATTERN.sub(replace_code_block, content)
             
             return processed_content
             
@@ -255,26 +300,26 @@ class DeveloperFeaturesService:
             headers.setdefault('User-Agent', 'WikiApp-APITester/1.0')
             
             # Execute request with timeout
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                async with session.request(
-                    method=api_example.method,
-                    url=api_example.url,
-                    headers=headers,
-                    data=api_example.body,
-                    ssl=False  # For development/testing
-                ) as response:
-                    response_text = await response.text()
-                    execution_time = (datetime.utcnow() - start_time).total_seconds()
-                    
-                    return {
-                        "success": True,
-                        "status_code": response.status,
-                        "headers": dict(response.headers),
-                        "body": response_text,
-                        "execution_time": execution_time,
-                        "content_type": response.headers.get('content-type', ''),
-                        "size": len(response_text)
-                    }
+            async with self.http_session.request(
+                method=api_example.method,
+                url=api_example.url,
+                headers=headers,
+                data=api_example.body,
+                timeout=aiohttp.ClientTimeout(total=30),
+                ssl=False  # For development/testing
+            ) as response:
+                response_text = await response.text()
+                execution_time = (datetime.utcnow() - start_time).total_seconds()
+                
+                return {
+                    "success": True,
+                    "status_code": response.status,
+                    "headers": dict(response.headers),
+                    "body": response_text,
+                    "execution_time": execution_time,
+                    "content_type": response.headers.get('content-type', ''),
+                    "size": len(response_text)
+                }
             
         except Exception as e:
             logger.error(f"Error executing API example: {e}")
@@ -339,6 +384,9 @@ class DeveloperFeaturesService:
         """
         Get repository information for documentation display.
         
+        Successful lookups are cached in-process for a short TTL, and
+        concurrent misses for the same file share a single upstream request.
+        
         Args:
             repo_url: Repository URL
             file_path: Path to file in repository
@@ -346,6 +394,28 @@ class DeveloperFeaturesService:
         Returns:
             Repository information
         """
+        key = (repo_url, file_path)
+        info = _get_cached_repository_info(key)
+        if info is not None:
+            return info
+        
+        lock = _repository_info_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                info = _get_cached_repository_info(key)
+                if info is not None:
+                    return info
+                
+                info = await self._fetch_repository_info(repo_url, file_path)
+                if "error" not in info:
+                    _cache_repository_info(key, info)
+                return dict(info)
+        finally:
+            if not lock.locked():
+                _repository_info_locks.pop(key, None)
+    
+    async def _fetch_repository_info(self, repo_url: str, file_path: str) -> Dict[str, Any]:
+        """Fetch repository information from the hosting provider."""
         try:
             # Parse repository URL to determine provider (GitHub, GitLab, etc.)
             if 'github.com' in repo_url:
@@ -600,20 +670,19 @@ except Exception as e:
                 # Use GitHub API to get file info
                 api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
                 
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(api_url) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            return {
-                                "provider": "github",
-                                "owner": owner,
-                                "repo": repo,
-                                "file_path": file_path,
-                                "url": repo_url,
-                                "last_commit": data.get("sha"),
-                                "size": data.get("size"),
-                                "download_url": data.get("download_url")
-                            }
+                async with self.http_session.get(api_url) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        return {
+                            "provider": "github",
+                            "owner": owner,
+                            "repo": repo,
+                            "file_path": file_path,
+                            "url": repo_url,
+                            "last_commit": data.get("sha"),
+                            "size": data.get("size"),
+                            "download_url": data.get("download_url")
+                        }
             
             return {
                 "provider": "github",
@@ -5,16 +5,18 @@ import uuid
 import re
 import logging
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, delete, update
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy import select, insert, literal, and_, or_, func, delete, update, tuple_
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import selectinload, joinedload, raiseload, defer, load_only
 
 from app.models.document import Document, DocumentStatus, ContentFormat
 from app.models.revision import DocumentRevision
 from app.models.folder import Folder
 from app.models.tag import Tag, DocumentTag
 from app.models.user import User
+from app.core.document_cache import invalidate_cached_document
 from app.core.exceptions import (
     NotFoundError, PermissionDeniedError, ValidationError, 
     DuplicateError, InternalError
@@ -65,83 +67,66 @@ class DocumentService:
             if existing:
                 raise DuplicateError(f"Document with title '{doc_data.title}' already exists in folder")
             
-            # Create document
-            document = Document(
-                id=uuid.uuid4(),
-                title=doc_data.title,
-                slug=slug,
-                content=doc_data.content,
-                content_type=doc_data.content_type or ContentFormat.MARKDOWN,
-                folder_path=doc_data.folder_path,
-                status=doc_data.status or DocumentStatus.DRAFT,
-                author_id=author.id,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
-            
-            self.db.add(document)
-            await self.db.flush()
-            
-            # Handle tags
-            if hasattr(doc_data, 'tags') and doc_data.tags:
-                await self._handle_document_tags(document.id, doc_data.tags)
-            
-            # Create initial revision
-            revision = DocumentRevision(
-                id=uuid.uuid4(),
-                document_id=document.id,
-                revision_number=1,
-                title=document.title,
-                content=document.content,
-                author_id=author.id,
-                created_at=datetime.utcnow()
+            # Insert the document and its initial revision in one statement:
+            # the revision copies its fields from the document insert's RETURNING
+            document_id = uuid.uuid4()
+            now = datetime.utcnow()
+            doc_status = doc_data.status or DocumentStatus.DRAFT
+            new_document = (
+                insert(Document)
+                .values(
+                    id=document_id,
+                    title=doc_data.title,
+                    slug=slug,
+                    content=doc_data.content,
+                    content_type=doc_data.content_type or ContentFormat.MARKDOWN,
+                    folder_path=doc_data.folder_path,
+                    status=doc_status,
+                    author_id=author.id,
+                    created_at=now,
+                    updated_at=now,
+                    published_at=now if doc_status == DocumentStatus.PUBLISHED else None,
+                    custom_metadata={}
+                )
+                .returning(
+                    Document.id, Document.title, Document.content,
+                    Document.author_id, Document.created_at
+                )
+                .cte("new_document")
             )
-            
-            self.db.add(revision)
-            await self.db.commit()
-            
-            logger.info(f"Document created: {document.id} by user {author.id}")
-            return document
-            
-            # Generate slug from title
-            slug = self._generate_slug(doc_data.title)
-            
-            # Check for duplicate slug in the same folder
-            await self._check_duplicate_slug(doc_data.folder_path, slug)
-            
-            # Create document
-            document = Document(
-                title=doc_data.title,
-                slug=slug,
-                content=doc_data.content,
-                content_type=doc_data.content_type,
-                folder_path=doc_data.folder_path,
-                status=doc_data.status,
-                author_id=author.id,
-                published_at=datetime.utcnow() if doc_data.status == DocumentStatus.PUBLISHED else None
+            await self.db.execute(
+                insert(DocumentRevision).from_select(
+                    ["id", "document_id", "revision_number", "title", "content", "author_id", "created_at"],
+                    select(
+                        literal(uuid.uuid4(), UUID(as_uuid=True)),
+                        new_document.c.id,
+                        literal(1),
+                        new_document.c.title,
+                        new_document.c.content,
+                        new_document.c.author_id,
+                        new_document.c.created_at
+                    )
+                )
             )
             
-            self.db.add(document)
-            await self.db.flush()  # Get the document ID
-            
             # Handle tags
             if hasattr(doc_data, 'tags') and doc_data.tags:
-                await self._associate_tags(document.id, doc_data.tags)
+                await self._handle_document_tags(document_id, doc_data.tags)
             
             await self.db.commit()
             
-            # Reload document with relationships
+            # Load the created document with its tags
             result = await self.db.execute(
                 select(Document)
                 .options(
-                    selectinload(Document.tags).selectinload(DocumentTag.tag)
+                    selectinload(Document.tags).joinedload(DocumentTag.tag)
                 )
-                .where(Document.id == document.id)
+                .where(Document.id == document_id)
             )
-            created_document = result.scalar_one()
+            document = result.scalar_one()
             
-            logger.info(f"Document created: {created_document.id} by user {author.id}")
-            return created_document
+            logger.info(f"Document created: {document.id} by user {author.id}")
+            return document
             
         except (ValidationError, DuplicateError):
             await self.db.rollback()
@@ -170,7 +155,8 @@ class DocumentService:
             query = (
                 select(Document)
                 .options(
-                    selectinload(Document.tags).selectinload(DocumentTag.tag)
+                    selectinload(Document.tags).joinedload(DocumentTag.tag),
+                    raiseload("*")
                 )
                 .where(Document.id == document_id)
             )
@@ -312,6 +298,7 @@ class DocumentService:
                     await self._associate_tags(document_id, doc_data.tags)
             
             await self.db.commit()
+            await invalidate_cached_document(document_id)
             
             # Reload updated document
             result = await self.db.execute(
@@ -376,6 +363,7 @@ class DocumentService:
                 await self._update_tag_usage_counts(tag_ids_to_update)
             
             await self.db.commit()
+            await invalidate_cached_document(document_id)
             logger.info(f"Document deleted: {document_id} by user {user.id}")
             
         except (NotFoundError, PermissionDeniedError):
@@ -446,6 +434,7 @@ class DocumentService:
             )
             
             await self.db.commit()
+            await invalidate_cached_document(document_id)
             
             # Reload document
             result = await self.db.execute(
@@ -474,28 +463,42 @@ class DocumentService:
         folder_path: Optional[str] = None,
         status: Optional[DocumentStatus] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None
     ) -> List[Document]:
         """
         List documents with filtering and pagination.
         
+        Documents are ordered by (updated_at, id) descending, so a cursor
+        seeks straight to the next page instead of scanning skipped rows.
+        Only the listing columns are loaded and relationships are not; fetch
+        tags for the page with get_tags_for_documents.
+        
         Args:
             user: User requesting the list
             folder_path: Optional folder path filter
             status: Optional status filter
             limit: Maximum number of documents to return
             offset: Number of documents to skip
+            cursor: (updated_at, id) of the last document on the previous page
             
         Returns:
             List[Document]: List of documents
         """
         try:
+            # Only the listing columns; content can run to megabytes per row
             query = (
                 select(Document)
                 .options(
-                    selectinload(Document.tags).selectinload(DocumentTag.tag)
+                    load_only(
+                        Document.id, Document.title, Document.slug,
+                        Document.folder_path, Document.status, Document.author_id,
+                        Document.created_at, Document.updated_at, Document.published_at,
+                        raiseload=True
+                    ),
+                    raiseload("*")
                 )
-                .order_by(Document.updated_at.desc())
+                .order_by(Document.updated_at.desc(), Document.id.desc())
             )
             
             # Apply visibility controls
@@ -518,6 +521,8 @@ class DocumentService:
                 query = query.where(Document.status == status)
             
             # Apply pagination
+            if cursor:
+                query = query.where(tuple_(Document.updated_at, Document.id) < tuple_(*cursor))
             query = query.limit(limit).offset(offset)
             
             result = await self.db.execute(query)
@@ -529,6 +534,53 @@ class DocumentService:
             logger.error(f"Error listing documents: {e}")
             raise InternalError("Failed to retrieve documents")
     
+    async def get_tags_for_documents(
+        self, document_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, List[Dict[str, Any]]]:
+        """
+        Get tag details for a page of documents in one query.
+        
+        Reads plain columns rather than hydrating DocumentTag and Tag objects.
+        
+        Args:
+            document_ids: Documents to fetch tags for
+            
+        Returns:
+            Dict[uuid.UUID, List[Dict[str, Any]]]: Tag dicts keyed by document ID
+        """
+        tags_by_document: Dict[uuid.UUID, List[Dict[str, Any]]] = {}
+        if not document_ids:
+            return tags_by_document
+        
+        try:
+            result = await self.db.execute(
+                select(
+                    DocumentTag.document_id,
+                    Tag.id,
+                    Tag.name,
+                    Tag.description,
+                    Tag.color,
+                    Tag.usage_count
+                )
+                .join(Tag, DocumentTag.tag_id == Tag.id)
+                .where(DocumentTag.document_id.in_(document_ids))
+            )
+            
+            for document_id, tag_id, name, description, color, usage_count in result:
+                tags_by_document.setdefault(document_id, []).append({
+                    "id": tag_id,
+                    "name": name,
+                    "description": description,
+                    "color": color,
+                    "usage_count": usage_count
+                })
+            
+            return tags_by_document
+            
+        except Exception as e:
+            logger.error(f"Error getting tags for documents: {e}")
+            raise InternalError("Failed to retrieve document tags")
+    
     # Private helper methods
     
     async def _ensure_folder_exists(self, folder_path: str, user: User) -> None:
@@ -707,10 +759,15 @@ class DocumentService:
             # First check if document exists and user has access
             await self.get_document(document_id, user)
             
-            # Get revisions
+            # Get revisions; the history listing needs neither the content
+            # nor more of the author than the username
             result = await self.db.execute(
                 select(DocumentRevision)
-                .options(joinedload(DocumentRevision.author))
+                .options(
+                    defer(DocumentRevision.content, raiseload=True),
+                    joinedload(DocumentRevision.author).load_only(User.id, User.username),
+                    raiseload("*")
+                )
                 .where(DocumentRevision.document_id == document_id)
                 .order_by(DocumentRevision.revision_number.desc())
                 .limit(limit)
@@ -835,6 +892,7 @@ class DocumentService:
             )
             
             await self.db.commit()
+            await invalidate_cached_document(document_id)
             
             # Reload updated document
             result = await self.db.execute(
@@ -881,9 +939,26 @@ class DocumentService:
             PermissionDeniedError: If access denied
         """
         try:
-            # Get both revisions
-            rev1 = await self.get_document_revision(document_id, revision1, user)
-            rev2 = await self.get_document_revision(document_id, revision2, user)
+            # Check access once, then fetch both revisions in a single query
+            await self.get_document(document_id, user)
+            
+            result = await self.db.execute(
+                select(DocumentRevision)
+                .options(joinedload(DocumentRevision.author).load_only(User.id, User.username))
+                .where(
+                    and_(
+                        DocumentRevision.document_id == document_id,
+                        DocumentRevision.revision_number.in_((revision1, revision2))
+                    )
+                )
+            )
+            revisions = {rev.revision_number: rev for rev in result.scalars()}
+            
+            for revision_number in (revision1, revision2):
+                if revision_number not in revisions:
+                    raise NotFoundError(f"Revision {revision_number} not found for document")
+            
+            rev1, rev2 = revisions[revision1], revisions[revision2]
             
             # Basic comparison data
             comparison = {
@@ -928,8 +1003,9 @@ class DocumentService:
             raise
         except Exception as e:
             logger.error(f"Error comparing revisions {revision1} and {revision2} for document {document_id}: {e}")
-            raise InternalError("Failed to compare document revisions")    as
-ync def get_all_documents_summary(self) -> List[Document]:
+            raise InternalError("Failed to compare document revisions")
+    
+    async def get_all_documents_summary(self) -> List[Document]:
         """Get a summary of all published documents for navigation."""
         try:
             result = await self.db.execute(
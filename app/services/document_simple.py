@@ -2,11 +2,12 @@
 Simple document service for CRUD operations.
 """
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
+from sqlalchemy import select, func, literal_column, tuple_
 from sqlalchemy.exc import IntegrityError
-from app.models.document_simple import Document
+from app.models.document_simple import Document, search_vector
 import re
 
 
@@ -74,31 +75,34 @@ class DocumentService:
         )
         return result.scalar_one_or_none()
     
-    async def list_documents(self, limit: int = 100, offset: int = 0) -> List[Document]:
-        """List all documents with pagination."""
+    async def list_documents(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> List[Document]:
+        """List all documents with pagination, optionally after a (updated_at, id) cursor."""
+        query = select(Document).where(Document.is_published == True)
+        if cursor:
+            query = query.where(tuple_(Document.updated_at, Document.id) < tuple_(*cursor))
         result = await self.db.execute(
-            select(Document)
-            .where(Document.is_published == True)
-            .order_by(Document.updated_at.desc())
+            query
+            .order_by(Document.updated_at.desc(), Document.id.desc())
             .limit(limit)
             .offset(offset)
         )
         return result.scalars().all()
     
     async def search_documents(self, query: str, limit: int = 50) -> List[Document]:
-        """Search documents by title and content."""
-        search_term = f"%{query}%"
+        """Full-text search documents by title and content, most relevant first."""
+        ts_query = func.plainto_tsquery(literal_column("'english'::regconfig"), query)
         result = await self.db.execute(
             select(Document)
             .where(
                 Document.is_published == True,
-                or_(
-                    Document.title.ilike(search_term),
-                    Document.content.ilike(search_term),
-                    Document.summary.ilike(search_term)
-                )
+                search_vector.op("@@")(ts_query)
             )
-            .order_by(Document.updated_at.desc())
+            .order_by(func.ts_rank_cd(search_vector, ts_query).desc(), Document.updated_at.desc())
             .limit(limit)
         )
         return result.scalars().all()
@@ -1,21 +1,26 @@
 """
 File service for secure file upload and management with malware scanning.
 """
+import asyncio
 import logging
 import os
 import uuid
-import base64
+import binascii
 import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, BinaryIO, Tuple
+from typing import Optional, Dict, Any, BinaryIO, List, Set, Tuple
 from pathlib import Path
 from fastapi import UploadFile, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from PIL import Image, ImageOps
 import magic
 
 from app.core.config import settings
+from app.core.document_cache import invalidate_cached_document
 from app.core.security import InputValidator
 from app.models.user import User
 from app.models.file import File
@@ -35,21 +40,175 @@ class MalwareDetectedError(Exception):
     pass
 
 
+UPLOAD_DIR = Path(settings.UPLOAD_DIR)
+
+# Refuse to decode images larger than this; guards the workers against decompression bombs
+Image.MAX_IMAGE_PIXELS = 50_000_000
+
+# Process pool for CPU-bound Pillow work, so resizes neither block the event loop nor serialize on the GIL
+image_pool: Optional[ProcessPoolExecutor] = None
+
+
+def init_upload_dir() -> None:
+    """Create the upload root once at startup rather than per service instance."""
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def init_image_pool() -> None:
+    """
+    Start the image processing pool.
+    
+    Each server worker starts its own pool, so by default the CPUs are split
+    across WORKERS. Children are spawned rather than forked, so they do not
+    inherit the running event loop, threadpool threads or open sockets.
+    """
+    global image_pool
+    max_workers = settings.IMAGE_POOL_SIZE or max(1, (os.cpu_count() or 1) // max(1, settings.WORKERS))
+    image_pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    logger.info(f"Image processing pool started with {max_workers} processes")
+
+
+def close_image_pool() -> None:
+    """Shut down the image processing pool."""
+    global image_pool
+    if image_pool:
+        image_pool.shutdown(wait=True, cancel_futures=True)
+        logger.info("Image processing pool shut down")
+    image_pool = None
+
+
+async def _run_image_task(func, *args):
+    """
+    Run a Pillow task off the event loop.
+    
+    Uses the process pool when the app has started one, and the threadpool
+    otherwise (e.g. in workers or scripts that never ran the lifespan).
+    """
+    if image_pool is None:
+        return await run_in_threadpool(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(image_pool, func, *args)
+
+
+def _write_upload(source: BinaryIO, content: bytes, destination: Path) -> None:
+    """
+    Persist an uploaded file.
+    
+    Uploads that the multipart parser already spooled to a temporary file are
+    copied kernel-side with sendfile; small in-memory ones are written from the
+    bytes already read.
+    """
+    with open(destination, "wb") as f:
+        # Same check Starlette uses; fileno() on an unrolled spool would force a rollover
+        if not getattr(source, "_rolled", True):
+            f.write(content)
+            return
+        
+        src_fd = source.fileno()
+        dst_fd = f.fileno()
+        offset = 0
+        while True:
+            sent = os.sendfile(dst_fd, src_fd, offset, 1 << 20)
+            if sent == 0:
+                break
+            offset += sent
+
+
+def _remove_orphaned_files(upload_dir: Path, known_paths: Set[str]) -> int:
+    """Delete files under upload_dir that have no database record."""
+    cleaned_count = 0
+    for file_path in upload_dir.rglob("*"):
+        if file_path.is_file():
+            relative_path = str(file_path.relative_to(upload_dir))
+            
+            if relative_path not in known_paths:
+                # Orphaned file found
+                try:
+                    os.unlink(file_path)
+                    cleaned_count += 1
+                    logger.info(f"Cleaned up orphaned file: {relative_path}")
+                except Exception as e:
+                    logger.error(f"Error cleaning up orphaned file {relative_path}: {e}")
+    
+    return cleaned_count
+
+
+def _optimize_image(
+    image_bytes: bytes,
+    mime_type: str,
+    max_size: Tuple[int, int],
+    quality: int
+) -> Tuple[bytes, str]:
+    """Normalize, downscale and re-encode an image. Runs in the image pool."""
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        # Convert RGBA to RGB if necessary (for JPEG)
+        if img.mode in ('RGBA', 'LA', 'P'):
+            # Create white background
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+            img = background
+        
+        # Auto-orient image based on EXIF data
+        img = ImageOps.exif_transpose(img)
+        
+        # Resize if too large
+        if img.width > max_size[0] or img.height > max_size[1]:
+            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+        
+        # Save optimized image
+        output_buffer = io.BytesIO()
+        
+        # Determine output format
+        if mime_type in ['image/jpeg', 'image/jpg']:
+            img.save(output_buffer, format='JPEG', quality=quality, optimize=True)
+            final_mime_type = 'image/jpeg'
+        elif mime_type == 'image/png':
+            img.save(output_buffer, format='PNG', optimize=True)
+            final_mime_type = 'image/png'
+        elif mime_type == 'image/webp':
+            img.save(output_buffer, format='WEBP', quality=quality, optimize=True)
+            final_mime_type = 'image/webp'
+        else:
+            # Default to JPEG for other formats
+            img.save(output_buffer, format='JPEG', quality=quality, optimize=True)
+            final_mime_type = 'image/jpeg'
+        
+        return output_buffer.getvalue(), final_mime_type
+
+
+def _render_thumbnail(source_path: str, size: Tuple[int, int], mime_type: str) -> bytes:
+    """Read an image from disk and encode its thumbnail. Runs in the image pool."""
+    with Image.open(source_path) as img:
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        
+        output_buffer = io.BytesIO()
+        if mime_type == 'image/png':
+            img.save(output_buffer, format='PNG', optimize=True)
+        else:
+            img.save(output_buffer, format='JPEG', quality=85, optimize=True)
+        
+        return output_buffer.getvalue()
+
+
 class FileService:
     """Service for handling secure file uploads and management."""
     
+    upload_dir = UPLOAD_DIR
+    
+    # Image processing settings
+    max_image_width = 2048
+    max_image_height = 2048
+    image_quality = 85
+    thumbnail_size = (300, 300)
+    
     def __init__(self, db: AsyncSession, audit_service: Optional[AuditService] = None, permission_service=None):
         self.db = db
         self.audit_service = audit_service or AuditService(db)
         self.permission_service = permission_service  # Will be injected to avoid circular imports
-        self.upload_dir = Path(settings.UPLOAD_DIR)
-        self.upload_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Image processing settings
-        self.max_image_width = 2048
-        self.max_image_height = 2048
-        self.image_quality = 85
-        self.thumbnail_size = (300, 300)
     
     async def upload_file(
         self,
@@ -81,13 +240,15 @@ class FileService:
             if not file.filename:
                 raise FileUploadError("Filename is required")
             
-            # Read file content
+            # Reject oversized uploads before pulling them into memory; the
+            # multipart parser has already counted the bytes
+            if file.size is not None and not InputValidator.validate_file_size(file.size):
+                raise FileUploadError(f"File size {file.size} exceeds maximum allowed size")
+            
+            # Read file content; type validation and the malware scan need all of it
             file_content = await file.read()
             file_size = len(file_content)
             
-            # Reset file pointer for potential re-reading
-            await file.seek(0)
-            
             # Validate file size
             if not InputValidator.validate_file_size(file_size):
                 raise FileUploadError(f"File size {file_size} exceeds maximum allowed size")
@@ -96,9 +257,38 @@ class FileService:
             if not InputValidator.validate_file_type(file_content, file.filename):
                 raise FileUploadError(f"File type not allowed: {file.filename}")
             
-            # Scan for malware
-            scan_result = InputValidator.scan_for_malware(file_content, file.filename)
+            # Validate folder path
+            if not InputValidator.validate_path(folder_path):
+                raise FileUploadError("Invalid folder path")
+            
+            # Generate unique filename
+            file_extension = Path(file.filename).suffix.lower()
+            unique_filename = f"{uuid.uuid4()}{file_extension}"
+            
+            # Create folder structure
+            folder_full_path = self.upload_dir / folder_path.strip("/")
+            folder_full_path.mkdir(parents=True, exist_ok=True)
+            file_path = folder_full_path / unique_filename
+            
+            # Scan for malware, checksum and save in one pass off the event
+            # loop. All three work from the same buffer; hashlib and the disk
+            # write release the GIL, so they overlap the pattern scan. The file
+            # has no record yet, so nothing can serve it before the verdict.
+            results = await asyncio.gather(
+                run_in_threadpool(InputValidator.scan_for_malware, file_content, file.filename),
+                run_in_threadpool(InputValidator.generate_file_hash, file_content),
+                run_in_threadpool(_write_upload, file.file, file_content, file_path),
+                return_exceptions=True
+            )
+            # Wait for all three before cleaning up, so a failed scan or hash
+            # cannot leave behind a file the write finished afterwards
+            errors = [result for result in results if isinstance(result, BaseException)]
+            if errors:
+                file_path.unlink(missing_ok=True)
+                raise errors[0]
+            scan_result, file_hash, _ = results
             if not scan_result["is_safe"]:
+                os.unlink(file_path)
                 logger.warning(f"Malware detected in file {file.filename}: {scan_result['threats_found']}")
                 await self.audit_service.create_security_event(
                     event_type="malware_detected",
@@ -115,26 +305,6 @@ class FileService:
                 )
                 raise MalwareDetectedError(f"Security threat detected in file: {', '.join(scan_result['threats_found'])}")
             
-            # Validate folder path
-            if not InputValidator.validate_path(folder_path):
-                raise FileUploadError("Invalid folder path")
-            
-            # Generate unique filename
-            file_extension = Path(file.filename).suffix.lower()
-            unique_filename = f"{uuid.uuid4()}{file_extension}"
-            
-            # Create folder structure
-            folder_full_path = self.upload_dir / folder_path.strip("/")
-            folder_full_path.mkdir(parents=True, exist_ok=True)
-            
-            # Save file
-            file_path = folder_full_path / unique_filename
-            with open(file_path, "wb") as f:
-                f.write(file_content)
-            
-            # Generate file hash
-            file_hash = InputValidator.generate_file_hash(file_content)
-            
             # Check for duplicate files
             existing_file = await self._find_duplicate_file(file_hash)
             if existing_file:
@@ -466,18 +636,20 @@ class FileService:
         """
         try:
             # Parse base64 image data
+            payload_start = 0
             if image_data.startswith('data:'):
-                # Remove data URL prefix (e.g., "data:image/png;base64,")
-                header, encoded_data = image_data.split(',', 1)
+                # Skip data URL prefix (e.g., "data:image/png;base64,") without copying the payload
+                payload_start = image_data.index(',') + 1
+                header = image_data[:payload_start - 1]
                 mime_type = header.split(';')[0].split(':')[1]
             else:
                 # Assume it's just base64 data
-                encoded_data = image_data
                 mime_type = "image/png"  # Default
             
-            # Decode base64 data
+            # Decode base64 data: one ASCII encode, then decode straight from a view of it
             try:
-                image_bytes = base64.b64decode(encoded_data)
+                encoded_data = memoryview(image_data.encode('ascii'))[payload_start:]
+                image_bytes = binascii.a2b_base64(encoded_data)
             except Exception as e:
                 raise FileUploadError(f"Invalid base64 image data: {e}")
             
@@ -561,47 +733,16 @@ class FileService:
             Tuple[bytes, str]: Processed image bytes and final MIME type
         """
         try:
-            # Open image with PIL
-            with Image.open(io.BytesIO(image_bytes)) as img:
-                # Convert RGBA to RGB if necessary (for JPEG)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # Create white background
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = background
-                
-                # Auto-orient image based on EXIF data
-                img = ImageOps.exif_transpose(img)
-                
-                # Resize if too large
-                if img.width > self.max_image_width or img.height > self.max_image_height:
-                    img.thumbnail((self.max_image_width, self.max_image_height), Image.Resampling.LANCZOS)
-                    logger.info(f"Image resized to {img.width}x{img.height}")
-                
-                # Save optimized image
-                output_buffer = io.BytesIO()
-                
-                # Determine output format
-                if mime_type in ['image/jpeg', 'image/jpg']:
-                    img.save(output_buffer, format='JPEG', quality=self.image_quality, optimize=True)
-                    final_mime_type = 'image/jpeg'
-                elif mime_type == 'image/png':
-                    img.save(output_buffer, format='PNG', optimize=True)
-                    final_mime_type = 'image/png'
-                elif mime_type == 'image/webp':
-                    img.save(output_buffer, format='WEBP', quality=self.image_quality, optimize=True)
-                    final_mime_type = 'image/webp'
-                else:
-                    # Default to JPEG for other formats
-                    img.save(output_buffer, format='JPEG', quality=self.image_quality, optimize=True)
-                    final_mime_type = 'image/jpeg'
-                
-                processed_bytes = output_buffer.getvalue()
-                logger.info(f"Image processed: {len(image_bytes)} -> {len(processed_bytes)} bytes")
-                
-                return processed_bytes, final_mime_type
+            processed_bytes, final_mime_type = await _run_image_task(
+                _optimize_image,
+                image_bytes,
+                mime_type,
+                (self.max_image_width, self.max_image_height),
+                self.image_quality
+            )
+            logger.info(f"Image processed: {len(image_bytes)} -> {len(processed_bytes)} bytes")
+            
+            return processed_bytes, final_mime_type
                 
         except Exception as e:
             logger.error(f"Error processing image: {e}")
@@ -620,6 +761,26 @@ class FileService:
         }
         return mime_to_ext.get(mime_type, '.jpg')
     
+    async def get_thumbnail(self, original_file: File) -> Optional[File]:
+        """
+        Get the thumbnail already generated for an image file, if any.
+        
+        Args:
+            original_file: Original image file record
+            
+        Returns:
+            File: Thumbnail file record or None if not generated yet
+        """
+        # Tolerate duplicates left by racing generations; the oldest wins
+        stmt = (
+            select(File)
+            .where(File.filename == f"thumb_{original_file.filename}")
+            .order_by(File.created_at)
+            .limit(1)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().first()
+    
     async def create_thumbnail(
         self,
         file_id: uuid.UUID,
@@ -645,9 +806,7 @@ class FileService:
             
             # Check if thumbnail already exists
             thumbnail_filename = f"thumb_{original_file.filename}"
-            stmt = select(File).where(File.filename == thumbnail_filename)
-            result = await self.db.execute(stmt)
-            existing_thumbnail = result.scalar_one_or_none()
+            existing_thumbnail = await self.get_thumbnail(original_file)
             
             if existing_thumbnail:
                 return existing_thumbnail
@@ -657,24 +816,11 @@ class FileService:
             if not original_path.exists():
                 return None
             
-            with open(original_path, 'rb') as f:
-                image_bytes = f.read()
-            
             # Create thumbnail
             thumbnail_size = size or self.thumbnail_size
-            
-            with Image.open(io.BytesIO(image_bytes)) as img:
-                # Create thumbnail
-                img.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
-                
-                # Save thumbnail
-                output_buffer = io.BytesIO()
-                if original_file.mime_type == 'image/png':
-                    img.save(output_buffer, format='PNG', optimize=True)
-                else:
-                    img.save(output_buffer, format='JPEG', quality=85, optimize=True)
-                
-                thumbnail_bytes = output_buffer.getvalue()
+            thumbnail_bytes = await _run_image_task(
+                _render_thumbnail, str(original_path), thumbnail_size, original_file.mime_type
+            )
             
             # Save thumbnail file
             folder_path = Path(original_file.file_path).parent
@@ -859,7 +1005,7 @@ class FileService:
             from app.models.document import Document
             
             references = await self._find_file_references(file_record)
-            updated_count = 0
+            updated_ids = []
             
             for ref in references:
                 stmt = select(Document).where(Document.id == ref["document_id"])
@@ -894,15 +1040,17 @@ class FileService:
                     
                     if new_content != old_content:
                         document.content = new_content
-                        updated_count += 1
+                        updated_ids.append(document.id)
                         
                         logger.info(f"Updated file references in document {document.title}")
             
-            if updated_count > 0:
+            if updated_ids:
                 await self.db.flush()
-                logger.info(f"Updated file references in {updated_count} documents")
+                for document_id in updated_ids:
+                    await invalidate_cached_document(document_id)
+                logger.info(f"Updated file references in {len(updated_ids)} documents")
             
-            return updated_count
+            return len(updated_ids)
             
         except Exception as e:
             logger.error(f"Error updating file references: {e}")
@@ -983,28 +1131,13 @@ class FileService:
             int: Number of files cleaned up
         """
         try:
-            cleaned_count = 0
-            
             # Get all file records from database
             stmt = select(File.file_path)
             result = await self.db.execute(stmt)
             db_file_paths = {row[0] for row in result.fetchall()}
             
-            # Scan upload directory
-            for file_path in self.upload_dir.rglob("*"):
-                if file_path.is_file():
-                    relative_path = str(file_path.relative_to(self.upload_dir))
-                    
-                    if relative_path not in db_file_paths:
-                        # Orphaned file found
-                        try:
-                            os.unlink(file_path)
-                            cleaned_count += 1
-                            logger.info(f"Cleaned up orphaned file: {relative_path}")
-                        except Exception as e:
-                            logger.error(f"Error cleaning up orphaned file {relative_path}: {e}")
-            
-            return cleaned_count
+            # Scan upload directory off the event loop
+            return await run_in_threadpool(_remove_orphaned_files, self.upload_dir, db_file_paths)
             
         except Exception as e:
             logger.error(f"Error during file cleanup: {e}")
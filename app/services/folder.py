@@ -12,6 +12,7 @@ from app.models.folder import Folder
 from app.models.user import User
 from app.models.document import Document
 from app.schemas.folder import FolderCreate, FolderUpdate, FolderTreeNode
+from app.core.document_cache import invalidate_all_cached_documents
 from app.core.exceptions import (
     NotFoundError, PermissionDeniedError, ValidationError,
     DuplicateError, InternalError
@@ -129,14 +130,17 @@ class FolderService:
             InternalError: If listing fails
         """
         try:
-            # Build query with document count
+            # Count documents per returned folder with a correlated subquery on
+            # the folder_path index, so only the requested page is counted
+            # rather than joining and grouping every document first
+            document_count = (
+                select(func.count())
+                .where(Document.folder_path == Folder.path)
+                .correlate(Folder)
+                .scalar_subquery()
+            )
             stmt = (
-                select(
-                    Folder,
-                    func.count(Document.id).label('document_count')
-                )
-                .outerjoin(Document, Document.folder_path == Folder.path)
-                .group_by(Folder.id)
+                select(Folder, document_count.label('document_count'))
                 .order_by(Folder.path)
                 .limit(limit)
                 .offset(offset)
@@ -180,18 +184,27 @@ class FolderService:
             InternalError: If tree building fails
         """
         try:
-            # Get all folders with document counts
+            # Aggregate documents by folder once, then attach the counts to
+            # folders, instead of grouping full folder rows over the join
+            counts_stmt = (
+                select(Document.folder_path, func.count().label('document_count'))
+                .group_by(Document.folder_path)
+            )
+            
+            # Filter by root path if specified
+            if root_path:
+                counts_stmt = counts_stmt.where(Document.folder_path.like(f"{root_path}%"))
+            
+            document_counts = counts_stmt.subquery()
             stmt = (
                 select(
                     Folder,
-                    func.count(Document.id).label('document_count')
+                    func.coalesce(document_counts.c.document_count, 0).label('document_count')
                 )
-                .outerjoin(Document, Document.folder_path == Folder.path)
-                .group_by(Folder.id)
+                .outerjoin(document_counts, document_counts.c.folder_path == Folder.path)
                 .order_by(Folder.path)
             )
             
-            # Filter by root path if specified
             if root_path:
                 stmt = stmt.where(
                     or_(
@@ -239,13 +252,13 @@ class FolderService:
                         children.append(child_node)
                 
                 return FolderTreeNode(
-                    id=str(folder.id),
+                    id=folder.id,
                     name=folder.name,
                     path=folder.path,
                     parent_path=folder.parent_path,
                     description=folder.description,
-                    created_by_id=str(folder.created_by_id),
-                    created_at=folder.created_at.isoformat(),
+                    created_by_id=folder.created_by_id,
+                    created_at=folder.created_at,
                     children=children,
                     document_count=data['document_count']
                 )
@@ -430,6 +443,8 @@ class FolderService:
             await self._update_child_paths(old_path, new_path)
             
             await self.db.commit()
+            # Every document below the folder changed its folder_path
+            await invalidate_all_cached_documents()
             await self.db.refresh(folder)
             
             logger.info(f"Moved folder from {old_path} to {new_path} by user {user.username}")
@@ -481,8 +496,9 @@ class FolderService:
         
         for doc in documents:
             if doc.folder_path.startswith(old_path):
-                doc.folder_path = doc.folder_path.replace(old_path, new_path, 1)    asy
-nc def get_all_folders(self) -> List[Folder]:
+                doc.folder_path = doc.folder_path.replace(old_path, new_path, 1)
+    
+    async def get_all_folders(self) -> List[Folder]:
         """Get all folders for navigation tree building."""
         try:
             result = await self.db.execute(
@@ -8,11 +8,11 @@ from typing import List, Optional, Dict, Any, Set
 from datetime import datetime
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-import aiohttp
 
 from app.models.user import User
 from app.models.document import Document
 from app.core.exceptions import NotFoundError, ValidationError, InternalError
+from app.core.http_client import get_http_client
 from app.services.document import DocumentService
 from app.services.auth import AuthService
 
@@ -372,26 +372,26 @@ class GitHubIntegrationService:
             "Accept": "application/vnd.github.v3+json"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 404:
-                    raise NotFoundError(f"GitHub issue {repo_name}#{issue_number} not found")
-                elif response.status != 200:
-                    raise InternalError(f"GitHub API error: {response.status}")
-                
-                data = await response.json()
-                
-                return GitHubIssue(
-                    number=data["number"],
-                    title=data["title"],
-                    state=data["state"],
-                    html_url=data["html_url"],
-                    body=data.get("body", ""),
-                    labels=[label["name"] for label in data.get("labels", [])],
-                    assignees=[assignee["login"] for assignee in data.get("assignees", [])],
-                    created_at=self._parse_timestamp(data.get("created_at")),
-                    updated_at=self._parse_timestamp(data.get("updated_at"))
-                )
+        session = get_http_client()
+        async with session.get(url, headers=headers) as response:
+            if response.status == 404:
+                raise NotFoundError(f"GitHub issue {repo_name}#{issue_number} not found")
+            elif response.status != 200:
+                raise InternalError(f"GitHub API error: {response.status}")
+            
+            data = await response.json()
+            
+            return GitHubIssue(
+                number=data["number"],
+                title=data["title"],
+                state=data["state"],
+                html_url=data["html_url"],
+                body=data.get("body", ""),
+                labels=[label["name"] for label in data.get("labels", [])],
+                assignees=[assignee["login"] for assignee in data.get("assignees", [])],
+                created_at=self._parse_timestamp(data.get("created_at")),
+                updated_at=self._parse_timestamp(data.get("updated_at"))
+            )
     
     async def _fetch_repository_collaborators(self, repo_name: str) -> List[str]:
         """Fetch repository collaborators from GitHub API."""
@@ -405,14 +405,14 @@ class GitHubIntegrationService:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return [collab["login"] for collab in data]
-                    else:
-                        logger.warning(f"Failed to fetch collaborators for {repo_name}: {response.status}")
-                        return []
+            session = get_http_client()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return [collab["login"] for collab in data]
+                else:
+                    logger.warning(f"Failed to fetch collaborators for {repo_name}: {response.status}")
+                    return []
         except Exception as e:
             logger.error(f"Error fetching repository collaborators: {e}")
             return []
@@ -1,10 +1,12 @@
 """
 Permission service for group-based authorization with path pattern matching.
 """
+import hashlib
 import logging
 import re
 import uuid
-from typing import List, Optional, Dict, Any, Set
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Pattern, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_
 from sqlalchemy.orm import selectinload
@@ -26,13 +28,56 @@ class PermissionError(Exception):
     pass
 
 
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a resource glob into a regex body."""
+    return pattern.replace('*', '.*').replace('?', '.')
+
+
+@lru_cache(maxsize=1024)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """
+    Compile resource globs into a single alternation matched in one pass.
+    
+    Keyed on the patterns themselves, so new or removed rules simply
+    produce a different cache entry. Patterns that are not valid regexes
+    are skipped, matching nothing as before.
+    
+    Args:
+        patterns: Resource globs
+        
+    Returns:
+        Optional[Pattern[str]]: Compiled matcher, or None if nothing compiled
+    """
+    alternatives = []
+    for pattern in patterns:
+        regex = _glob_to_regex(pattern)
+        try:
+            re.compile(regex)
+        except re.error:
+            continue
+        alternatives.append(f'(?:{regex})')
+    
+    if not alternatives:
+        return None
+    return re.compile('|'.join(alternatives))
+
+
+def _matches_any(patterns: List[str], path: str) -> bool:
+    """Check whether path fully matches any of the resource globs."""
+    if not patterns:
+        return False
+    matcher = _compile_patterns(tuple(sorted(set(patterns))))
+    return bool(matcher and matcher.fullmatch(path))
+
+
 class PermissionService:
     """Service for handling group-based permissions with path pattern matching."""
     
     def __init__(self, db: AsyncSession, audit_service: Optional[AuditService] = None):
         self.db = db
         self.audit_service = audit_service or AuditService(db)
-        self._cache_ttl = 300  # 5 minutes cache TTL
+        self._cache_ttl = 15  # Short TTL; rule changes also bump the user's epoch
+        self._epoch_ttl = 86400  # Outlives every entry cached under an epoch
     
     async def check_permission(
         self, 
@@ -67,7 +112,7 @@ class PermissionService:
                 return True
             
             # Check cached permissions first
-            cache_key = f"permission:{user.id}:{resource_path}:{action.value}"
+            cache_key = await self._permission_cache_key(user.id, resource_path, action)
             cached_result = await self._get_cached_permission(cache_key)
             if cached_result is not None:
                 await self.audit_service.log_permission_event(
@@ -242,8 +287,10 @@ class PermissionService:
             if not self._validate_resource_pattern(resource_pattern):
                 raise PermissionError(f"Invalid resource pattern: {resource_pattern}")
             
-            # Create permission
+            # Create permission; attaching the loaded group lets callers
+            # read permission.group without another query
             permission = Permission(
+                group=group,
                 group_id=group_id,
                 resource_pattern=resource_pattern,
                 action=action,
@@ -428,15 +475,7 @@ class PermissionService:
         Returns:
             bool: True if path matches pattern
         """
-        try:
-            # Convert glob pattern to regex
-            regex_pattern = pattern.replace('*', '.*').replace('?', '.')
-            regex_pattern = f'^{regex_pattern}$'
-            
-            return bool(re.match(regex_pattern, path))
-            
-        except Exception:
-            return False
+        return _matches_any([pattern], path)
     
     async def _evaluate_permissions(
         self, 
@@ -455,34 +494,25 @@ class PermissionService:
         Returns:
             Optional[bool]: True if allowed, False if denied, None if no matching permissions
         """
-        matching_permissions = []
+        deny_patterns = []
+        allow_patterns = []
         
-        # Find all matching permissions
         for permission in permissions:
-            if (permission.action == action and 
-                self._match_pattern(permission.resource_pattern, resource_path)):
-                matching_permissions.append(permission)
-        
-        if not matching_permissions:
-            return None  # No matching permissions found
-        
-        # Sort by specificity (longer patterns are more specific)
-        matching_permissions.sort(
-            key=lambda p: len(p.resource_pattern.replace('*', '')), 
-            reverse=True
-        )
+            if permission.action != action:
+                continue
+            if permission.effect == PermissionEffect.DENY:
+                deny_patterns.append(permission.resource_pattern)
+            else:
+                allow_patterns.append(permission.resource_pattern)
         
         # Apply deny-by-default: explicit deny takes precedence
-        for permission in matching_permissions:
-            if permission.effect == PermissionEffect.DENY:
-                return False
+        if _matches_any(deny_patterns, resource_path):
+            return False
         
-        # If no deny found, check for allow
-        for permission in matching_permissions:
-            if permission.effect == PermissionEffect.ALLOW:
-                return True
+        if _matches_any(allow_patterns, resource_path):
+            return True
         
-        return False  # Deny by default
+        return None  # No matching permissions found
     
     def _check_default_permissions(self, role: UserRole, action: PermissionAction) -> bool:
         """
@@ -504,6 +534,28 @@ class PermissionService:
         
         return False
     
+    async def _permission_cache_key(
+        self,
+        user_id: uuid.UUID,
+        resource_path: str,
+        action: PermissionAction
+    ) -> str:
+        """
+        Build the cache key for a permission check.
+        
+        The key embeds the user's permission epoch, so bumping the epoch
+        invalidates every cached check for that user at once.
+        """
+        epoch = 0
+        try:
+            redis = await get_redis()
+            epoch = int(await redis.get(f"perm:epoch:{user_id}") or 0)
+        except Exception as e:
+            logger.warning(f"Error getting permission epoch: {e}")
+        
+        digest = hashlib.sha1(f"{resource_path}\0{action.value}".encode()).hexdigest()
+        return f"perm:check:{user_id}:{epoch}:{digest}"
+    
     async def _get_cached_permission(self, cache_key: str) -> Optional[bool]:
         """Get cached permission result."""
         try:
@@ -529,18 +581,16 @@ class PermissionService:
             logger.warning(f"Error caching permission: {e}")
     
     async def _clear_user_permission_cache(self, user_id: uuid.UUID) -> None:
-        """Clear all cached permissions for a user."""
+        """Invalidate all cached permissions for a user by bumping their epoch."""
         try:
             redis = await get_redis()
-            pattern = f"permission:{user_id}:*"
-            
-            keys = []
-            async for key in redis.scan_iter(match=pattern):
-                keys.append(key)
+            epoch_key = f"perm:epoch:{user_id}"
             
-            if keys:
-                await redis.delete(*keys)
-                logger.info(f"Cleared {len(keys)} cached permissions for user {user_id}")
+            pipe = redis.pipeline(transaction=False)
+            pipe.incr(epoch_key)
+            pipe.expire(epoch_key, self._epoch_ttl)
+            await pipe.execute()
+            logger.info(f"Invalidated cached permissions for user {user_id}")
                 
         except Exception as e:
             logger.warning(f"Error clearing user permission cache: {e}")
@@ -5,6 +5,7 @@ import uuid
 import logging
 import time
 from typing import List, Optional, Dict, Any
+from fastapi import Depends
 from sqlalchemy import select, update, delete, func, text, and_, or_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,9 +18,10 @@ from app.schemas.tag import (
     TagUsageInfo, TagRenameRequest, TagDeleteResponse,
     TagAutocompleteResponse
 )
-from app.core.database import get_db_session
+from app.core.database import get_db
 from app.core.exceptions import ValidationError, NotFoundError, ConflictError
 from app.core.redis import get_redis
+from app.core.document_cache import invalidate_all_cached_documents
 
 logger = logging.getLogger(__name__)
 
@@ -208,6 +210,8 @@ class TagService:
                 setattr(tag, field, value)
             
             await self.db.commit()
+            # Cached document bodies embed their tags
+            await invalidate_all_cached_documents()
             await self.db.refresh(tag)
             
             logger.info(f"Tag {tag_id} updated by user {user.id}")
@@ -259,6 +263,8 @@ class TagService:
             old_tag.name = rename_request.new_name
             
             await self.db.commit()
+            # Cached document bodies embed their tags
+            await invalidate_all_cached_documents()
             await self.db.refresh(old_tag)
             
             logger.info(
@@ -316,6 +322,8 @@ class TagService:
             # Delete the tag (cascading will handle document_tags)
             await self.db.delete(tag)
             await self.db.commit()
+            # Cached document bodies embed their tags
+            await invalidate_all_cached_documents()
             
             logger.info(
                 f"Tag '{tag.name}' deleted by user {user.id}, "
@@ -606,14 +614,8 @@ class TagService:
                     await redis.delete(*keys)
         except Exception as e:
             logger.warning(f"Failed to clear autocomplete cache: {e}")
-
-
-# Dependency injection helper
-async def get_tag_service() -> TagService:
-    """Get tag service instance."""
-    async with get_db_session() as db:
-        return TagService(db)    
-async def get_all_tags(self) -> List[Tag]:
+    
+    async def get_all_tags(self) -> List[Tag]:
         """Get all tags."""
         try:
             result = await self.db.execute(
@@ -653,4 +655,10 @@ async def get_all_tags(self) -> List[Tag]:
             
         except Exception as e:
             logger.error(f"Error getting popular tags: {e}")
-            return []
\ No newline at end of file
+            return []
+
+
+# Dependency injection helper
+async def get_tag_service(db: AsyncSession = Depends(get_db)) -> TagService:
+    """Get tag service instance."""
+    return TagService(db)
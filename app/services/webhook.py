@@ -15,6 +15,7 @@ import aiohttp
 from app.models.user import User
 from app.schemas.admin import WebhookConfigRequest
 from app.core.exceptions import NotFoundError, ValidationError, InternalError
+from app.core.http_client import get_http_client
 from app.services.github_integration import GitHubIntegrationService
 from app.services.azure_devops_integration import AzureDevOpsIntegrationService
 
@@ -306,27 +307,27 @@ class WebhookService:
             }
             
             # Send test request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    webhook.url,
-                    json=test_payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    success = response.status < 400
-                    
-                    if success:
-                        webhook.success_count += 1
-                    else:
-                        webhook.failure_count += 1
-                    
-                    webhook.last_triggered_at = datetime.utcnow()
-                    
-                    return {
-                        "success": success,
-                        "status_code": response.status,
-                        "response_text": await response.text()
-                    }
+            session = get_http_client()
+            async with session.post(
+                webhook.url,
+                json=test_payload,
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                success = response.status < 400
+                
+                if success:
+                    webhook.success_count += 1
+                else:
+                    webhook.failure_count += 1
+                
+                webhook.last_triggered_at = datetime.utcnow()
+                
+                return {
+                    "success": success,
+                    "status_code": response.status,
+                    "response_text": await response.text()
+                }
             
         except NotFoundError:
             raise
@@ -451,18 +452,18 @@ class WebhookService:
             ).hexdigest()
             headers["X-Webhook-Signature"] = f"sha256={signature}"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                webhook.url,
-                json=webhook_payload,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                if response.status < 400:
-                    webhook.success_count += 1
-                    logger.info(f"Webhook {webhook.id} sent successfully")
-                else:
-                    webhook.failure_count += 1
-                    logger.warning(f"Webhook {webhook.id} failed: {response.status}")
-                
-                webhook.last_triggered_at = datetime.utcnow()
\ No newline at end of file
+        session = get_http_client()
+        async with session.post(
+            webhook.url,
+            json=webhook_payload,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            if response.status < 400:
+                webhook.success_count += 1
+                logger.info(f"Webhook {webhook.id} sent successfully")
+            else:
+                webhook.failure_count += 1
+                logger.warning(f"Webhook {webhook.id} failed: {response.status}")
+            
+            webhook.last_triggered_at = datetime.utcnow()
\ No newline at end of file
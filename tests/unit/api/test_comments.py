@@ -0,0 +1,122 @@
+"""
+Unit tests for comment response helpers.
+"""
+import pytest
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.api.comments import _comment_tree_payloads
+from app.models.comment import Comment
+from tests.conftest import UserFactory
+
+
+def _comment(author, document_id, parent=None, replies=None, content="Comment"):
+    """Build an in-memory comment, optionally with replies already loaded."""
+    now = datetime.now(timezone.utc)
+    comment = Comment(
+        id=uuid.uuid4(),
+        content=content,
+        document_id=document_id,
+        author_id=author.id,
+        parent_id=parent.id if parent else None,
+        is_deleted=False,
+        created_at=now,
+        updated_at=now
+    )
+    set_committed_value(comment, 'author', author)
+    if replies is not None:
+        set_committed_value(comment, 'replies', replies)
+    return comment
+
+
+@pytest.mark.unit
+class TestCommentTreePayloads:
+    """Test cases for _comment_tree_payloads."""
+    
+    @pytest.fixture
+    def author(self):
+        """Create a comment author."""
+        return UserFactory.create_user(username="commenter")
+    
+    @pytest.fixture
+    def document_id(self):
+        """Create a document ID."""
+        return uuid.uuid4()
+    
+    def test_empty(self):
+        """Test that no comments serialize to an empty list."""
+        assert _comment_tree_payloads([]) == []
+    
+    def test_nested_tree_keeps_order(self, author, document_id):
+        """Test that roots and replies keep their order at every depth."""
+        root_a = _comment(author, document_id, content="a", replies=[])
+        root_b = _comment(author, document_id, content="b", replies=[])
+        reply_a1 = _comment(author, document_id, root_a, content="a1", replies=[])
+        reply_a2 = _comment(author, document_id, root_a, content="a2", replies=[])
+        reply_a1x = _comment(author, document_id, reply_a1, content="a1x", replies=[])
+        set_committed_value(root_a, 'replies', [reply_a1, reply_a2])
+        set_committed_value(reply_a1, 'replies', [reply_a1x])
+        
+        payloads = _comment_tree_payloads([root_a, root_b])
+        
+        assert [p["content"] for p in payloads] == ["a", "b"]
+        assert [p["content"] for p in payloads[0]["replies"]] == ["a1", "a2"]
+        assert [p["content"] for p in payloads[0]["replies"][0]["replies"]] == ["a1x"]
+        assert payloads[0]["replies"][1]["replies"] == []
+        assert payloads[1]["replies"] == []
+    
+    def test_payload_fields(self, author, document_id):
+        """Test the scalar fields and author username of a payload."""
+        root = _comment(author, document_id, replies=[])
+        
+        payload = _comment_tree_payloads([root])[0]
+        
+        assert payload["id"] == root.id
+        assert payload["document_id"] == document_id
+        assert payload["author_id"] == author.id
+        assert payload["author_username"] == "commenter"
+        assert payload["parent_id"] is None
+        assert payload["is_deleted"] is False
+        assert payload["created_at"] == root.created_at
+    
+    def test_reply_count(self, author, document_id):
+        """Test that reply_count prefers the grouped count and falls back to loaded replies."""
+        counted = _comment(author, document_id, replies=[])
+        counted.reply_count = 5
+        loaded = _comment(author, document_id)
+        set_committed_value(loaded, 'replies', [
+            _comment(author, document_id, loaded, replies=[]),
+            _comment(author, document_id, loaded, replies=[])
+        ])
+        
+        payloads = _comment_tree_payloads([counted, loaded])
+        
+        assert payloads[0]["reply_count"] == 5
+        assert payloads[1]["reply_count"] == 2
+    
+    def test_unloaded_replies_not_lazy_loaded(self, author, document_id):
+        """Test that comments without loaded replies serialize with none."""
+        root = _comment(author, document_id)
+        
+        payload = _comment_tree_payloads([root])[0]
+        
+        assert payload["replies"] == []
+        assert payload["reply_count"] == 0
+    
+    def test_deep_thread(self, author, document_id):
+        """Test that very deep threads serialize without recursion limits."""
+        root = _comment(author, document_id, replies=[])
+        parent = root
+        for _ in range(2000):
+            reply = _comment(author, document_id, parent, replies=[])
+            set_committed_value(parent, 'replies', [reply])
+            parent = reply
+        
+        payload = _comment_tree_payloads([root])[0]
+        
+        depth = 0
+        while payload["replies"]:
+            payload = payload["replies"][0]
+            depth += 1
+        assert depth == 2000
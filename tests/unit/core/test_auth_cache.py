@@ -0,0 +1,196 @@
+"""
+Unit tests for authentication caches.
+"""
+import pytest
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core import auth_cache
+from app.core.auth_cache import (
+    TokenUserCache, FailedLoginCache, bump_user_epoch, get_user_epoch, user_epoch_key,
+    USER_EPOCH_TTL
+)
+from app.models.user import User
+from tests.conftest import UserFactory
+
+
+@pytest.mark.unit
+class TestTokenUserCache:
+    """Test cases for TokenUserCache."""
+    
+    @pytest.fixture
+    def cache(self):
+        """Create a small token cache."""
+        return TokenUserCache(maxsize=2, ttl_seconds=60)
+    
+    @pytest.fixture
+    def user(self):
+        """Create a user."""
+        return UserFactory.create_user()
+    
+    def test_get_miss(self, cache):
+        """Test that an unknown token misses."""
+        assert cache.get("unknown") is None
+    
+    def test_set_and_get(self, cache, user):
+        """Test that a hit returns a detached snapshot, token ID and epoch."""
+        cache.set("token", user, "jti-1", None, "3")
+        
+        cached_user, token_id, epoch = cache.get("token")
+        
+        assert cached_user is not user
+        assert isinstance(cached_user, User)
+        assert cached_user.id == user.id
+        assert cached_user.username == user.username
+        assert token_id == "jti-1"
+        assert epoch == "3"
+    
+    def test_raw_token_not_stored(self, cache, user):
+        """Test that keys are token hashes rather than raw tokens."""
+        cache.set("secret-token", user, None, None, "0")
+        
+        assert "secret-token" not in cache._entries
+        assert TokenUserCache.token_key("secret-token") in cache._entries
+    
+    def test_entry_expires_after_ttl(self, cache, user):
+        """Test that entries expire after the cache TTL."""
+        with patch.object(auth_cache.time, "time", return_value=1000.0):
+            cache.set("token", user, None, None, "0")
+        
+        with patch.object(auth_cache.time, "time", return_value=1059.0):
+            assert cache.get("token") is not None
+        with patch.object(auth_cache.time, "time", return_value=1060.0):
+            assert cache.get("token") is None
+        assert not cache._entries
+    
+    def test_entry_capped_at_token_expiry(self, cache, user):
+        """Test that entries never outlive the token's exp claim."""
+        with patch.object(auth_cache.time, "time", return_value=1000.0):
+            cache.set("token", user, None, 1010, "0")
+        
+        with patch.object(auth_cache.time, "time", return_value=1010.0):
+            assert cache.get("token") is None
+    
+    def test_lru_eviction(self, cache):
+        """Test that the least recently used entry is evicted when full."""
+        cache.set("a", UserFactory.create_user(), None, None, "0")
+        cache.set("b", UserFactory.create_user(), None, None, "0")
+        cache.get("a")
+        
+        cache.set("c", UserFactory.create_user(), None, None, "0")
+        
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+    
+    def test_pop(self, cache, user):
+        """Test dropping a single token."""
+        cache.set("token", user, None, None, "0")
+        
+        cache.pop("token")
+        cache.pop("token")
+        
+        assert cache.get("token") is None
+    
+    def test_invalidate_user(self, cache, user):
+        """Test that invalidating a user drops only that user's tokens."""
+        other = UserFactory.create_user()
+        cache.set("a", user, None, None, "0")
+        cache.set("b", other, None, None, "0")
+        
+        cache.invalidate_user(user.id)
+        
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+
+@pytest.mark.unit
+class TestFailedLoginCache:
+    """Test cases for FailedLoginCache."""
+    
+    def test_add_and_contains(self):
+        """Test that recorded credential pairs are found, and only those."""
+        cache = FailedLoginCache()
+        cache.add("alice", "wrong")
+        
+        assert cache.contains("alice", "wrong") is True
+        assert cache.contains("alice", "other") is False
+        assert cache.contains("bob", "wrong") is False
+    
+    def test_passwords_not_stored(self):
+        """Test that keys are HMACs rather than the raw credentials."""
+        cache = FailedLoginCache()
+        cache.add("alice", "wrong")
+        
+        assert all(isinstance(key, bytes) and b"wrong" not in key for key in cache._entries)
+    
+    def test_entry_expires(self):
+        """Test that failures are forgotten after the TTL."""
+        cache = FailedLoginCache(ttl_seconds=30)
+        with patch.object(auth_cache.time, "time", return_value=1000.0):
+            cache.add("alice", "wrong")
+        
+        with patch.object(auth_cache.time, "time", return_value=1030.0):
+            assert cache.contains("alice", "wrong") is False
+    
+    def test_bounded_size(self):
+        """Test that the oldest failures are evicted when full."""
+        cache = FailedLoginCache(maxsize=2)
+        cache.add("a", "1")
+        cache.add("b", "2")
+        cache.add("c", "3")
+        
+        assert cache.contains("a", "1") is False
+        assert cache.contains("b", "2") is True
+        assert cache.contains("c", "3") is True
+
+
+@pytest.mark.unit
+class TestUserEpoch:
+    """Test cases for the shared per-user cache epoch."""
+    
+    @pytest.fixture
+    def mock_pipeline(self, mock_redis):
+        """Attach a pipeline to the mocked Redis client."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, True])
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+        return pipe
+    
+    @pytest.mark.asyncio
+    async def test_get_user_epoch_defaults_to_zero(self, mock_redis):
+        """Test that a user never bumped is at epoch 0."""
+        mock_redis.get.return_value = None
+        with patch("app.core.redis.get_redis", AsyncMock(return_value=mock_redis)):
+            assert await get_user_epoch(uuid.uuid4()) == "0"
+    
+    @pytest.mark.asyncio
+    async def test_get_user_epoch_redis_error(self):
+        """Test that an unavailable Redis reports no epoch."""
+        with patch("app.core.redis.get_redis", AsyncMock(side_effect=ConnectionError())):
+            assert await get_user_epoch(uuid.uuid4()) is None
+    
+    @pytest.mark.asyncio
+    async def test_bump_user_epoch(self, mock_redis, mock_pipeline):
+        """Test that bumping drops local entries and increments the shared epoch."""
+        user = UserFactory.create_user()
+        auth_cache.token_user_cache.set("token", user, None, None, "0")
+        
+        with patch("app.core.redis.get_redis", AsyncMock(return_value=mock_redis)):
+            await bump_user_epoch(user.id)
+        
+        assert auth_cache.token_user_cache.get("token") is None
+        mock_pipeline.incr.assert_called_once_with(user_epoch_key(user.id))
+        mock_pipeline.expire.assert_called_once_with(user_epoch_key(user.id), USER_EPOCH_TTL)
+        mock_pipeline.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_bump_user_epoch_redis_error(self):
+        """Test that local entries are dropped even when Redis is unavailable."""
+        user = UserFactory.create_user()
+        auth_cache.token_user_cache.set("token", user, None, None, "0")
+        
+        with patch("app.core.redis.get_redis", AsyncMock(side_effect=ConnectionError())):
+            await bump_user_epoch(user.id)
+        
+        assert auth_cache.token_user_cache.get("token") is None
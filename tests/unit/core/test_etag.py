@@ -0,0 +1,39 @@
+"""
+Unit tests for ETag helpers.
+"""
+import pytest
+
+from app.core.etag import etag_matches
+
+
+@pytest.mark.unit
+class TestEtagMatches:
+    """Test cases for etag_matches."""
+    
+    def test_missing_header(self):
+        """Test that no If-None-Match header never matches."""
+        assert etag_matches(None, '"abc"') is False
+        assert etag_matches("", '"abc"') is False
+    
+    def test_exact_match(self):
+        """Test matching an identical ETag."""
+        assert etag_matches('"abc"', '"abc"') is True
+    
+    def test_mismatch(self):
+        """Test a different ETag does not match."""
+        assert etag_matches('"abc"', '"def"') is False
+    
+    def test_weak_comparison(self):
+        """Test that weak and strong forms of the same tag match."""
+        assert etag_matches('W/"abc"', '"abc"') is True
+        assert etag_matches('"abc"', 'W/"abc"') is True
+    
+    def test_wildcard(self):
+        """Test that * matches any ETag."""
+        assert etag_matches("*", '"abc"') is True
+        assert etag_matches(" * ", '"abc"') is True
+    
+    def test_list_of_tags(self):
+        """Test matching any tag in a comma-separated list."""
+        assert etag_matches('"x", W/"abc" ,"y"', '"abc"') is True
+        assert etag_matches('"x", "y"', '"abc"') is False
@@ -0,0 +1,75 @@
+"""
+Unit tests for the service exception mapper.
+"""
+import pytest
+from fastapi import HTTPException, status
+
+from app.core.exception_mapper import map_service_exceptions
+from app.core.exceptions import (
+    NotFoundError, PermissionDeniedError, ValidationError, DuplicateError, InternalError
+)
+
+
+def _raising(exc):
+    """Build a mapped endpoint that raises exc."""
+    @map_service_exceptions
+    async def endpoint():
+        raise exc
+    return endpoint
+
+
+@pytest.mark.unit
+class TestMapServiceExceptions:
+    """Test cases for map_service_exceptions."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("exc, status_code", [
+        (NotFoundError("Document not found"), status.HTTP_404_NOT_FOUND),
+        (PermissionDeniedError("Access denied"), status.HTTP_403_FORBIDDEN),
+        (ValidationError("Invalid title"), status.HTTP_400_BAD_REQUEST),
+        (DuplicateError("Slug exists"), status.HTTP_409_CONFLICT),
+        (InternalError("Failed"), status.HTTP_500_INTERNAL_SERVER_ERROR),
+    ])
+    async def test_maps_service_exceptions(self, exc, status_code):
+        """Test each service exception becomes its HTTP status with the message as detail."""
+        with pytest.raises(HTTPException) as exc_info:
+            await _raising(exc)()
+        
+        assert exc_info.value.status_code == status_code
+        assert exc_info.value.detail == exc.message
+    
+    @pytest.mark.asyncio
+    async def test_maps_subclass_by_mro(self):
+        """Test that subclasses map to their nearest mapped base."""
+        class MissingTagError(NotFoundError):
+            pass
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await _raising(MissingTagError("Tag not found"))()
+        
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    
+    @pytest.mark.asyncio
+    async def test_other_exceptions_pass_through(self):
+        """Test that unrelated exceptions, including HTTPException, are not rewritten."""
+        with pytest.raises(RuntimeError):
+            await _raising(RuntimeError("boom"))()
+        
+        http_exc = HTTPException(status_code=status.HTTP_418_IM_A_TEAPOT, detail="teapot")
+        with pytest.raises(HTTPException) as exc_info:
+            await _raising(http_exc)()
+        assert exc_info.value is http_exc
+    
+    @pytest.mark.asyncio
+    async def test_returns_result_and_preserves_signature(self):
+        """Test that successful calls pass through and the wrapped signature is kept."""
+        async def get_item(item_id: int, verbose: bool = False):
+            """Get an item."""
+            return {"id": item_id}
+        
+        wrapped = map_service_exceptions(get_item)
+        
+        assert await wrapped(3) == {"id": 3}
+        assert wrapped.__name__ == "get_item"
+        assert wrapped.__doc__ == "Get an item."
+        assert wrapped.__wrapped__ is get_item
@@ -0,0 +1,48 @@
+"""
+Unit tests for cursor pagination helpers.
+"""
+import pytest
+import uuid
+from datetime import datetime, timezone
+
+from app.core.pagination import encode_cursor, decode_cursor
+
+
+@pytest.mark.unit
+class TestCursorPagination:
+    """Test cases for encode_cursor and decode_cursor."""
+    
+    def test_round_trip(self):
+        """Test that a decoded cursor returns the encoded position."""
+        created_at = datetime(2024, 1, 15, 10, 30, 45, 123456, tzinfo=timezone.utc)
+        row_id = uuid.uuid4()
+        
+        cursor = encode_cursor(created_at, row_id)
+        
+        assert decode_cursor(cursor) == (created_at, row_id)
+    
+    def test_round_trip_naive_datetime(self):
+        """Test round trip of a timestamp without timezone."""
+        created_at = datetime(2024, 1, 15, 10, 30, 45)
+        row_id = uuid.uuid4()
+        
+        assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+    
+    def test_cursor_is_url_safe(self):
+        """Test that cursors carry no characters needing URL escaping."""
+        cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+        
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+    
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor",
+        "",
+        "%%%",
+        encode_cursor(datetime(2024, 1, 1), uuid.uuid4())[:-6],
+    ])
+    def test_decode_invalid_cursor(self, cursor):
+        """Test that malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
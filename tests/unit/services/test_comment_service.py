@@ -0,0 +1,109 @@
+"""
+Unit tests for comment service.
+"""
+import pytest
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.comment import CommentService
+from app.models.comment import Comment
+from app.models.document import Document
+from app.models.user import User
+
+
+@pytest.mark.unit
+class TestCommentReplyGrouping:
+    """Test cases for grouping replies under their parent comments."""
+    
+    @pytest.fixture
+    def comment_service(self, test_db):
+        """Create comment service on the test database."""
+        return CommentService(test_db)
+    
+    @pytest.fixture
+    async def add_comment(self, test_db: AsyncSession, test_document: Document, test_user: User):
+        """Return a helper saving comments with increasing timestamps."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        created = []
+        
+        async def _add_comment(parent=None, is_deleted=False, content="Comment"):
+            comment = Comment(
+                id=uuid.uuid4(),
+                content=content,
+                document_id=test_document.id,
+                author_id=test_user.id,
+                parent_id=parent.id if parent else None,
+                is_deleted=is_deleted,
+                created_at=start + timedelta(minutes=len(created))
+            )
+            test_db.add(comment)
+            await test_db.commit()
+            created.append(comment)
+            return comment
+        
+        return _add_comment
+    
+    @pytest.mark.asyncio
+    async def test_get_reply_counts(self, comment_service, add_comment):
+        """Test that replies are counted per parent, excluding deleted ones."""
+        root_a = await add_comment()
+        root_b = await add_comment()
+        root_c = await add_comment()
+        await add_comment(parent=root_a)
+        await add_comment(parent=root_a)
+        await add_comment(parent=root_a, is_deleted=True)
+        await add_comment(parent=root_b)
+        
+        counts = await comment_service._get_reply_counts([root_a.id, root_b.id, root_c.id])
+        
+        assert counts == {root_a.id: 2, root_b.id: 1}
+    
+    @pytest.mark.asyncio
+    async def test_get_reply_counts_empty(self, comment_service):
+        """Test that no IDs give no counts."""
+        assert await comment_service._get_reply_counts([]) == {}
+    
+    @pytest.mark.asyncio
+    async def test_get_comments_with_replies(self, comment_service, add_comment, test_document):
+        """Test that replies are nested under their parents in creation order."""
+        root_a = await add_comment(content="a")
+        root_b = await add_comment(content="b")
+        reply_a1 = await add_comment(parent=root_a, content="a1")
+        await add_comment(parent=root_a, content="a2")
+        await add_comment(parent=reply_a1, content="a1x")
+        await add_comment(parent=root_b, is_deleted=True, content="deleted")
+        
+        roots = await comment_service._get_comments_with_replies(test_document.id, limit=10, offset=0)
+        
+        assert [c.content for c in roots] == ["a", "b"]
+        assert [c.content for c in roots[0].replies] == ["a1", "a2"]
+        assert [c.content for c in roots[0].replies[0].replies] == ["a1x"]
+        assert roots[1].replies == []
+        assert [c.reply_count for c in roots] == [2, 0]
+        assert roots[0].replies[0].reply_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_comments_with_replies_paginates_roots(self, comment_service, add_comment, test_document):
+        """Test that pagination applies to root comments and keeps their replies."""
+        await add_comment(content="a")
+        root_b = await add_comment(content="b")
+        await add_comment(content="c")
+        await add_comment(parent=root_b, content="b1")
+        
+        roots = await comment_service._get_comments_with_replies(test_document.id, limit=1, offset=1)
+        
+        assert [c.content for c in roots] == ["b"]
+        assert [c.content for c in roots[0].replies] == ["b1"]
+    
+    @pytest.mark.asyncio
+    async def test_get_comments_with_replies_marks_replies_loaded(
+        self, comment_service, add_comment, test_db, test_document
+    ):
+        """Test that attached replies are committed state, not pending changes."""
+        root = await add_comment()
+        await add_comment(parent=root)
+        
+        roots = await comment_service._get_comments_with_replies(test_document.id, limit=10, offset=0)
+        
+        assert roots[0] not in test_db.dirty
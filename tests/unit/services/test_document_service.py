@@ -4,14 +4,16 @@ Unit tests for document service.
 import pytest
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.document import DocumentService
 from app.models.document import Document, DocumentStatus
 from app.models.user import User, UserRole
 from app.models.folder import Folder
+from app.models.tag import DocumentTag
 from app.core.exceptions import NotFoundError, ValidationError, DuplicateError
-from tests.conftest import UserFactory, DocumentFactory
+from tests.conftest import UserFactory, DocumentFactory, TagFactory
 
 
 @pytest.mark.unit
@@ -378,4 +380,71 @@ class TestDocumentService:
         await document_service._update_search_vector(mock_document)
         
         mock_db.execute.assert_called()
-        mock_db.commit.assert_called()
\ No newline at end of file
+        mock_db.commit.assert_called()
+
+
+@pytest.mark.unit
+class TestDocumentServiceQueryCount:
+    """Test the number of SQL statements document reads issue."""
+    
+    @pytest.fixture
+    def statements(self, test_engine):
+        """Record every SQL statement executed on the test engine."""
+        executed = []
+        
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+        
+        event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        yield executed
+        event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    
+    @pytest.fixture
+    async def tagged_documents(self, test_db, test_user):
+        """Create three documents with two tags each."""
+        documents = [
+            await DocumentFactory.create_and_save_document(test_db, author_id=test_user.id)
+            for _ in range(3)
+        ]
+        for document in documents:
+            for _ in range(2):
+                tag = await TagFactory.create_and_save_tag(test_db)
+                test_db.add(DocumentTag(document_id=document.id, tag_id=tag.id))
+        await test_db.commit()
+        
+        # Start from a cold identity map so nothing is served from memory
+        test_db.expunge_all()
+        return documents
+    
+    @pytest.mark.asyncio
+    async def test_get_document_query_count(self, test_db, test_user, tagged_documents, statements):
+        """Test that a document and its tags load in two statements and nothing lazy-loads."""
+        document_service = DocumentService(test_db)
+        
+        document = await document_service.get_document(tagged_documents[0].id, test_user)
+        tag_names = [document_tag.tag.name for document_tag in document.tags]
+        
+        assert len(tag_names) == 2
+        assert len(statements) == 2
+    
+    @pytest.mark.asyncio
+    async def test_list_documents_query_count(self, test_db, test_user, tagged_documents, statements):
+        """Test that listing documents issues a single statement."""
+        document_service = DocumentService(test_db)
+        
+        documents = await document_service.list_documents(test_user, limit=10)
+        
+        assert len(documents) == 3
+        assert len(statements) == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_tags_for_documents_query_count(self, test_db, tagged_documents, statements):
+        """Test that tags for a whole page load in a single statement."""
+        document_service = DocumentService(test_db)
+        
+        tags_by_document = await document_service.get_tags_for_documents(
+            [document.id for document in tagged_documents]
+        )
+        
+        assert len(statements) == 1
+        assert all(len(tags_by_document[document.id]) == 2 for document in tagged_documents)
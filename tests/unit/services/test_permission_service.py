@@ -6,7 +6,7 @@ import uuid
 from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.permission import PermissionService
+from app.services.permission import PermissionService, _compile_patterns, _matches_any
 from app.models.user import User, UserRole
 from app.models.permission import PermissionGroup, Permission, PermissionAction, PermissionEffect
 from app.core.exceptions import NotFoundError, ValidationError, PermissionDeniedError
@@ -428,4 +428,82 @@ class TestPermissionService:
         assert mock_permission_group.name == "updated-group"
         assert mock_permission_group.description == "Updated description"
         mock_db.commit.assert_called()
-        mock_db.refresh.assert_called()
\ No newline at end of file
+        mock_db.refresh.assert_called()
+
+
+@pytest.mark.unit
+class TestResourcePatternMatching:
+    """Test cases for compiled resource pattern matching."""
+    
+    def test_compile_patterns_empty(self):
+        """Test that no patterns compile to no matcher."""
+        assert _compile_patterns(()) is None
+    
+    def test_compile_patterns_skips_invalid(self):
+        """Test that patterns which are not valid regexes are skipped."""
+        matcher = _compile_patterns(("/docs/[", "/docs/*"))
+        
+        assert matcher is not None
+        assert matcher.fullmatch("/docs/a")
+        assert _compile_patterns(("/docs/[",)) is None
+    
+    def test_compile_patterns_cached(self):
+        """Test that the same patterns reuse the compiled matcher."""
+        patterns = ("/docs/*", "/admin/?")
+        
+        assert _compile_patterns(patterns) is _compile_patterns(patterns)
+    
+    @pytest.mark.parametrize("patterns, path, expected", [
+        (["/docs/*"], "/docs/api/v1", True),
+        (["/docs/*"], "/other/docs/a", False),
+        (["/docs/?"], "/docs/a", True),
+        (["/docs/?"], "/docs/ab", False),
+        (["/docs/a"], "/docs/ab", False),
+        (["/a/*", "/b/*"], "/b/x", True),
+        (["/a/*", "/b/*"], "/c/x", False),
+        ([], "/docs/a", False),
+    ])
+    def test_matches_any(self, patterns, path, expected):
+        """Test that paths must fully match at least one glob."""
+        assert _matches_any(patterns, path) is expected
+    
+    def test_matches_any_ignores_order_and_duplicates(self):
+        """Test that equivalent pattern lists share one compiled matcher."""
+        _compile_patterns.cache_clear()
+        
+        _matches_any(["/b/*", "/a/*", "/a/*"], "/a/x")
+        _matches_any(["/a/*", "/b/*"], "/b/x")
+        
+        assert _compile_patterns.cache_info().misses == 1
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_permissions_deny_over_allow_same_pattern(self, mock_db):
+        """Test that a deny rule beats an allow rule for the same path."""
+        permission_service = PermissionService(mock_db)
+        permissions = [
+            MagicMock(
+                resource_pattern="/docs/*",
+                action=PermissionAction.READ_PAGES,
+                effect=PermissionEffect.ALLOW
+            ),
+            MagicMock(
+                resource_pattern="/docs/*",
+                action=PermissionAction.READ_PAGES,
+                effect=PermissionEffect.DENY
+            ),
+            MagicMock(
+                resource_pattern="/docs/*",
+                action=PermissionAction.EDIT_PAGES,
+                effect=PermissionEffect.ALLOW
+            )
+        ]
+        
+        assert await permission_service._evaluate_permissions(
+            permissions, "/docs/a", PermissionAction.READ_PAGES
+        ) is False
+        assert await permission_service._evaluate_permissions(
+            permissions, "/docs/a", PermissionAction.EDIT_PAGES
+        ) is True
+        assert await permission_service._evaluate_permissions(
+            permissions, "/other", PermissionAction.EDIT_PAGES
+        ) is None